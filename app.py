@@ -4,13 +4,43 @@
 Golf Score Manager Web Application
 """
 
-from flask import Flask, render_template, request, jsonify, redirect, url_for, session
+from flask import Flask, Response, g, render_template, request, jsonify, redirect, url_for, session, stream_with_context
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
+import argparse
+import io
+import json
 import os
-from golf_score_manager import GolfScoreManager
+import sys
+import threading
+import time
+from golf_score_manager import SCORE_SCHEMA_VERSION, GolfScoreManager, parse_rounds_query
+from metrics import CONTENT_TYPE, REGISTRY, golf_manager_families, observe_http_request, render_metrics, timed_phase
+from quota_scheduler import get_quota_scheduler
+from round_export import EXPORT_FORMATS, export_chunks, export_rounds, guarded_chunks
+from round_import import detect_format, import_rounds, spool_upload
+from round_model import GolfRound
+from sheets_client import get_client_factory, sheets_discovery_document
 from user_manager import UserManager
+from storage import StorageError, storage_backend_name
+
+class GolfJSONProvider(DefaultJSONProvider):
+    """GolfRound를 기존 딕셔너리 형식으로 직렬화하는 JSON 변환기"""
+    
+    @staticmethod
+    def default(o):
+        if isinstance(o, GolfRound):
+            return o.to_dict()
+        return DefaultJSONProvider.default(o)
+    
+    def response(self, *args, **kwargs):
+        # 응답 시간 중 JSON 인코딩이 차지하는 부분을 지표로 기록 (세션 쿠키 직렬화는 제외)
+        with timed_phase('json_encode'):
+            return super().response(*args, **kwargs)
+
 
 app = Flask(__name__)
+app.json = GolfJSONProvider(app)
 CORS(app, origins=['http://localhost:3000', 'http://localhost:3001', 'http://127.0.0.1:3000', 'http://127.0.0.1:3001'], 
      supports_credentials=True)
 
@@ -22,37 +52,110 @@ app.secret_key = os.getenv('FLASK_SECRET_KEY', 'your-secret-key-change-in-produc
 # Manager 인스턴스 생성
 golf_manager = None
 user_manager = None
+_init_lock = threading.Lock()  # 동시에 들어온 첫 요청들이 Manager를 두 번 만들지 않도록 보호
 
 def init_golf_manager():
-    """GolfScoreManager 초기화"""
+    """GolfScoreManager 초기화 (이미 초기화됐으면 그대로 사용)"""
     global golf_manager
-    try:
-        # 환경변수에서 스프레드시트 ID 가져오기
-        spreadsheet_id = os.getenv('GOOGLE_SPREADSHEET_ID')
-        if not spreadsheet_id:
-            print("❌ GOOGLE_SPREADSHEET_ID 환경변수가 설정되지 않았습니다.")
+    with _init_lock:
+        if golf_manager:
+            return True
+        try:
+            # 환경변수에서 스프레드시트 ID 가져오기
+            spreadsheet_id = os.getenv('GOOGLE_SPREADSHEET_ID')
+            if not spreadsheet_id and storage_backend_name() == 'sheets':
+                print("❌ GOOGLE_SPREADSHEET_ID 환경변수가 설정되지 않았습니다.")
+                return False
+            
+            golf_manager = GolfScoreManager(spreadsheet_id)
+            return True
+        except Exception as e:
+            print(f"GolfScoreManager 초기화 오류: {e}")
             return False
-        
-        golf_manager = GolfScoreManager(spreadsheet_id)
-        return True
-    except Exception as e:
-        print(f"GolfScoreManager 초기화 오류: {e}")
-        return False
 
 def init_user_manager():
-    """UserManager 초기화"""
+    """UserManager 초기화 (이미 초기화됐으면 그대로 사용)"""
     global user_manager
-    try:
-        # 환경변수 검증
-        if not os.getenv('GOOGLE_USERS_SHEET_ID'):
-            print("❌ GOOGLE_USERS_SHEET_ID 환경변수가 설정되지 않았습니다.")
+    with _init_lock:
+        if user_manager:
+            return True
+        try:
+            # 환경변수 검증
+            if not os.getenv('GOOGLE_USERS_SHEET_ID') and storage_backend_name() == 'sheets':
+                print("❌ GOOGLE_USERS_SHEET_ID 환경변수가 설정되지 않았습니다.")
+                return False
+            
+            user_manager = UserManager()
+            return True
+        except Exception as e:
+            print(f"❌ UserManager 초기화 오류: {e}")
             return False
-        
-        user_manager = UserManager()
-        return True
-    except Exception as e:
-        print(f"❌ UserManager 초기화 오류: {e}")
+
+def migrate_schema():
+    """Score 시트 헤더를 현재 스키마로 다시 쓰고 스키마 버전 기록 (열 구성을 바꾼 뒤 배포 전에 한 번 실행)"""
+    if not init_golf_manager():
+        return False
+    try:
+        golf_manager.migrate_schema()
+    except StorageError as e:
+        print(f"❌ 스키마 기록 오류: {e}")
         return False
+    finally:
+        golf_manager.close()
+    print(f"✅ Score 시트 스키마를 schema_v{SCORE_SCHEMA_VERSION}로 기록했습니다.")
+    return True
+
+def warmup():
+    """첫 요청 전에 인증, Manager 초기화, 캐시 미리 채우기를 끝내고 단계별 소요 시간 출력
+    
+    캐시 로드 단계는 저장소를 직접 읽어 권한/할당량 오류(StorageError)를 실패로 처리합니다.
+    성공 여부와 {단계 이름: 소요 시간(초)}을 반환합니다.
+    """
+    timings = {}
+    
+    def run_phase(name, func):
+        started = time.perf_counter()
+        try:
+            result = func()
+        except Exception as e:
+            print(f"❌ {name} 단계 오류: {e}")
+            result = False
+        timings[name] = time.perf_counter() - started
+        return result is not False
+    
+    ok = True
+    if storage_backend_name() == 'sheets':
+        ok = run_phase('discovery 문서', sheets_discovery_document) and ok
+        ok = run_phase('인증', lambda: get_client_factory().credentials) and ok
+    golf_ok = run_phase('GolfScoreManager 초기화', init_golf_manager)
+    user_ok = run_phase('UserManager 초기화', init_user_manager)
+    if golf_ok:
+        golf_ok = run_phase('라운드 캐시 로드', golf_manager.preload)
+    if user_ok:
+        user_ok = run_phase('사용자 인덱스 로드', user_manager.preload)
+    ok = ok and golf_ok and user_ok
+    
+    print("⏱️ 시작 단계별 소요 시간")
+    for name, seconds in timings.items():
+        print(f"   {name}: {seconds * 1000:.0f}ms")
+    print(f"   합계: {sum(timings.values()) * 1000:.0f}ms")
+    return ok, timings
+
+# /api/metrics 출력 시점에 읽기 캐시/쓰기 큐 지표를 함께 출력
+REGISTRY.register_collector(lambda: golf_manager_families(golf_manager) if golf_manager else [])
+
+@app.before_request
+def start_request_timer():
+    g.request_started = time.perf_counter()
+
+@app.after_request
+def record_request_metrics(response):
+    """라우트별 처리 시간/상태 코드 기록 (URL 규칙 단위라 경로 값에 따라 지표가 늘지 않음)"""
+    started = g.pop('request_started', None)
+    if started is not None:
+        route = request.url_rule.rule if request.url_rule else 'unmatched'
+        observe_http_request(request.method, route, response.status_code, time.perf_counter() - started)
+    return response
 
 def require_auth(f):
     """인증이 필요한 함수를 위한 데코레이터"""
@@ -199,15 +302,24 @@ def check_auth():
 @app.route('/api/rounds', methods=['GET'])
 @require_auth
 def get_rounds():
-    """저장된 라운드 기록 조회 (로그인 필요)"""
+    """저장된 라운드 기록 조회 (로그인 필요)
+    
+    ?from=YYYY-MM-DD&to=YYYY-MM-DD&course=코스 이름으로 거르고, limit개씩(기본 20, 최대 100)
+    최신순으로 반환합니다. 다음 페이지는 응답의 next_cursor를 ?cursor=로 넘겨 조회합니다.
+    """
     try:
         if not golf_manager:
             if not init_golf_manager():
                 return jsonify({'error': 'GolfScoreManager 초기화 실패'}), 500
         
-        rounds = golf_manager.load_from_sheets()
-        # 현재 사용자의 라운드만 필터링 (추후 구현)
-        return jsonify({'rounds': rounds})
+        try:
+            query = parse_rounds_query(request.args)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        
+        # 현재 사용자의 라운드만 최신순으로 한 페이지씩 조회
+        page = golf_manager.get_player_rounds(session['username'], **query)
+        return jsonify(page)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -258,6 +370,88 @@ def create_round():
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+@app.route('/api/rounds/export')
+@require_auth
+def export_rounds_endpoint():
+    """로그인한 사용자의 라운드 내보내기 (시트를 페이지 단위로 읽으며 청크 전송)
+    
+    ?format=csv|jsonl (기본값: csv). ?player로 다른 플레이어를 지정하면 403을 반환합니다.
+    전송 도중 저장소 오류가 나면 마지막 줄에 오류 표시(JSON Lines는 {"error": ...}, CSV는 #error 행)를 붙입니다.
+    """
+    if not golf_manager:
+        if not init_golf_manager():
+            return jsonify({'error': 'GolfScoreManager 초기화 실패'}), 500
+    
+    fmt = request.args.get('format', 'csv')
+    if fmt not in EXPORT_FORMATS:
+        return jsonify({'error': 'format은 csv 또는 jsonl이어야 합니다.'}), 400
+    
+    player_name = session['username']
+    if request.args.get('player', player_name) != player_name:
+        return jsonify({'error': '다른 플레이어의 라운드는 내보낼 수 없습니다.'}), 403
+    
+    chunks = guarded_chunks(export_chunks(export_rounds(golf_manager, player_name), fmt), fmt)
+    filename = f"rounds-{time.strftime('%Y%m%d')}.{fmt}"
+    return Response(stream_with_context(chunks), content_type=EXPORT_FORMATS[fmt],
+                    headers={'Content-Disposition': f'attachment; filename="{filename}"'})
+
+@app.route('/api/rounds/import', methods=['POST'])
+@require_auth
+def import_rounds_endpoint():
+    """라운드 일괄 가져오기 (로그인 필요, 로그인한 사용자의 라운드만)
+    
+    본문(또는 multipart의 file)으로 CSV/JSON Lines를 받아 묶음 단위로 저장하며,
+    진행 상황을 한 줄에 하나씩 JSON으로 스트리밍합니다. 플레이어가 다른 레코드는
+    저장하지 않고 오류로 보고합니다. 폼(application/x-www-form-urlencoded) 본문은 415로 거부합니다.
+    ?format=csv|jsonl (기본값: Content-Type 또는 파일 이름으로 판단)
+    ?skip=N 앞의 레코드 N개를 건너뜀 (중단된 가져오기는 마지막 줄의 records 값으로 재개)
+    """
+    if not golf_manager:
+        if not init_golf_manager():
+            return jsonify({'error': 'GolfScoreManager 초기화 실패'}), 500
+    
+    # 폼 본문은 Flask가 먼저 읽어 버리므로 스트림으로 받을 수 없음 (curl --data-binary의 기본값)
+    if request.mimetype == 'application/x-www-form-urlencoded':
+        return jsonify({'error': '본문을 text/csv 또는 application/x-ndjson으로 보내거나 multipart의 file 필드로 올려주세요.'}), 415
+    upload = None
+    if request.mimetype == 'multipart/form-data':
+        upload = request.files.get('file')
+        if upload is None:
+            return jsonify({'error': 'multipart 요청에는 file 필드가 필요합니다.'}), 400
+    
+    fmt = (request.args.get('format') or
+           detect_format(upload.filename if upload else request.content_type))
+    if fmt not in ('csv', 'jsonl'):
+        return jsonify({'error': 'format=csv 또는 format=jsonl을 지정해주세요.'}), 400
+    try:
+        skip_records = max(0, int(request.args.get('skip', 0)))
+    except ValueError:
+        return jsonify({'error': 'skip은 0 이상의 정수여야 합니다.'}), 400
+    
+    # 본문을 메모리에 모으지 않고 읽으면서 처리 (첫 바이트만 미리 읽어 빈 본문 확인)
+    binary = io.BufferedReader(spool_upload(upload.stream) if upload else request.stream)
+    if not binary.peek(1):
+        binary.close()
+        return jsonify({'error': '가져올 내용이 없습니다.'}), 400
+    stream = io.TextIOWrapper(binary, encoding='utf-8-sig', newline='')
+    
+    player_name = session['username']
+    
+    def generate():
+        last = {'records': skip_records}
+        try:
+            for progress in import_rounds(stream, fmt, golf_manager.save_rounds, skip_records=skip_records,
+                                          player_name=player_name):
+                last = progress
+                yield json.dumps(progress, ensure_ascii=False) + '\n'
+        except Exception as e:
+            yield json.dumps({'error': str(e), 'records': last['records'], 'done': False},
+                             ensure_ascii=False) + '\n'
+        finally:
+            stream.close()
+    
+    return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
+
 @app.route('/api/statistics')
 @require_auth
 def get_player_statistics():
@@ -282,21 +476,53 @@ def health_check():
             if not init_golf_manager():
                 return jsonify({'status': 'error', 'message': 'GolfScoreManager 초기화 실패'}), 500
         
-        return jsonify({'status': 'ok', 'message': '서비스 정상 작동'})
+        response = {
+            'status': 'ok',
+            'message': '서비스 정상 작동',
+            'read_cache': golf_manager.get_read_cache_stats()
+        }
+        write_queue_stats = golf_manager.get_write_queue_stats()
+        if write_queue_stats is not None:
+            response['write_queue'] = write_queue_stats
+        credential_stats = get_client_factory().credential_stats()
+        if credential_stats is not None:
+            response['credentials'] = credential_stats
+        if storage_backend_name() == 'sheets':
+            response['sheets_quota'] = get_quota_scheduler().stats()
+            response['sheets_pool'] = get_client_factory().pool_stats()
+        return jsonify(response)
     except Exception as e:
         return jsonify({'status': 'error', 'message': str(e)}), 500
 
+@app.route('/api/metrics')
+def metrics():
+    """Prometheus 형식 지표 (라우트별 처리 시간, Sheets 호출 수/시간/전송량, 캐시 적중)"""
+    return Response(render_metrics(), content_type=CONTENT_TYPE)
+
 if __name__ == '__main__':
-    # Manager 초기화
-    golf_init_success = init_golf_manager()
-    user_init_success = init_user_manager()
+    parser = argparse.ArgumentParser(description='골프 스코어 관리 웹 애플리케이션')
+    parser.add_argument('--preflight', action='store_true',
+                        help='초기화와 캐시 로드만 확인하고 종료 (성공 0, 실패 1, 준비 상태 확인용)')
+    parser.add_argument('--migrate-schema', action='store_true',
+                        help='Score 시트 헤더를 현재 스키마로 다시 쓰고 스키마 버전을 기록한 뒤 종료')
+    args = parser.parse_args()
+    
+    if args.migrate_schema:
+        sys.exit(0 if migrate_schema() else 1)
+    
+    # Manager 초기화와 캐시 미리 채우기
+    warmup_ok, _ = warmup()
+    
+    if args.preflight:
+        print("✅ 사전 점검 통과" if warmup_ok else "❌ 사전 점검 실패")
+        sys.exit(0 if warmup_ok else 1)
     
-    if golf_init_success:
+    if golf_manager:
         print("✅ GolfScoreManager 초기화 완료")
     else:
         print("❌ GolfScoreManager 초기화 실패")
     
-    if user_init_success:
+    if user_manager:
         print("✅ UserManager 초기화 완료")
     else:
         print("❌ UserManager 초기화 실패")
@@ -0,0 +1,334 @@
+#!/usr/bin/env python3
+"""
+골프 스코어 관리 웹 애플리케이션 - asyncio(Quart) 버전
+Golf Score Manager Web Application on asyncio (Quart)
+
+app.py와 같은 API를 비동기 핸들러로 제공합니다. 프로세스 하나가 여러 요청을 동시에
+처리하며, Sheets 호출은 AsyncGolfService의 스레드 풀에서 실행됩니다.
+
+실행: pip install quart hypercorn && hypercorn async_app:app --bind 0.0.0.0:3000
+로컬 테스트: GOLF_STORAGE_BACKEND=sqlite 로 Google 계정 없이 실행
+"""
+
+import asyncio
+import json
+import os
+import time
+from functools import wraps
+
+from quart import Quart, Response, g, jsonify, render_template, request, session
+
+from async_service import AsyncBodyReader, AsyncGolfService
+from golf_score_manager import parse_rounds_query
+from metrics import CONTENT_TYPE, REGISTRY, golf_manager_families, observe_http_request, render_metrics
+from round_export import EXPORT_FORMATS
+from round_import import detect_format, spool_upload
+from round_model import GolfRound
+
+app = Quart(__name__)
+
+# 세션 보안을 위한 시크릿 키
+app.secret_key = os.getenv('FLASK_SECRET_KEY', 'your-secret-key-change-in-production')
+
+service: AsyncGolfService = None
+
+
+def to_json(value):
+    """GolfRound를 기존 딕셔너리 형식으로 변환 (목록/딕셔너리 안의 값 포함)"""
+    if isinstance(value, GolfRound):
+        return value.to_dict()
+    if isinstance(value, list):
+        return [to_json(item) for item in value]
+    if isinstance(value, dict):
+        return {key: to_json(item) for key, item in value.items()}
+    return value
+
+
+def require_auth(f):
+    """인증이 필요한 핸들러를 위한 데코레이터"""
+    @wraps(f)
+    async def decorated_function(*args, **kwargs):
+        if 'user_id' not in session:
+            return jsonify({'error': '로그인이 필요합니다.'}), 401
+        return await f(*args, **kwargs)
+    return decorated_function
+
+
+@app.before_serving
+async def startup():
+    """요청을 받기 전에 Manager 초기화"""
+    global service
+    service = await AsyncGolfService.create()
+    REGISTRY.register_collector(lambda: golf_manager_families(service.golf_manager))
+    print("✅ 비동기 서비스 초기화 완료")
+
+
+@app.after_serving
+async def shutdown():
+    """대기 중인 쓰기를 마치고 종료"""
+    if service:
+        await service.close()
+
+
+@app.before_request
+async def start_request_timer():
+    g.request_started = time.perf_counter()
+
+
+@app.after_request
+async def record_request_metrics(response):
+    """라우트별 처리 시간/상태 코드 기록"""
+    started = g.pop('request_started', None)
+    if started is not None:
+        route = request.url_rule.rule if request.url_rule else 'unmatched'
+        observe_http_request(request.method, route, response.status_code, time.perf_counter() - started)
+    return response
+
+
+@app.route('/')
+async def index():
+    """메인 페이지"""
+    return await render_template('index.html')
+
+# ===== 사용자 인증 관련 라우트 =====
+
+@app.route('/api/auth/register', methods=['POST'])
+async def register():
+    """사용자 회원가입"""
+    try:
+        data = await request.get_json()
+        username = data.get('username', '').strip()
+        email = data.get('email', '').strip()
+        password = data.get('password', '').strip()
+
+        # 입력 검증
+        if not username or not email or not password:
+            return jsonify({'error': '모든 필드를 입력해주세요.'}), 400
+
+        if len(password) < 6:
+            return jsonify({'error': '비밀번호는 6자 이상이어야 합니다.'}), 400
+
+        result = await service.register_user(username, email, password)
+        return jsonify(result), 201 if result['success'] else 400
+    except Exception as e:
+        return jsonify({'error': f'회원가입 중 오류가 발생했습니다: {str(e)}'}), 500
+
+
+@app.route('/api/auth/login', methods=['POST'])
+async def login():
+    """사용자 로그인"""
+    try:
+        data = await request.get_json()
+        username_or_email = data.get('username_or_email', '').strip()
+        password = data.get('password', '').strip()
+
+        if not username_or_email or not password:
+            return jsonify({'error': '사용자명/이메일과 비밀번호를 입력해주세요.'}), 400
+
+        result = await service.authenticate_user(username_or_email, password)
+        if not result['success']:
+            return jsonify(result), 401
+
+        # 세션에 사용자 정보 저장
+        session['user_id'] = result['user']['user_id']
+        session['username'] = result['user']['username']
+        session['email'] = result['user']['email']
+        return jsonify({'success': True, 'message': '로그인 성공', 'user': result['user']})
+    except Exception as e:
+        return jsonify({'error': f'로그인 중 오류가 발생했습니다: {str(e)}'}), 500
+
+
+@app.route('/api/auth/logout', methods=['POST'])
+async def logout():
+    """사용자 로그아웃"""
+    session.clear()
+    return jsonify({'success': True, 'message': '로그아웃되었습니다.'})
+
+
+@app.route('/api/auth/me', methods=['GET'])
+@require_auth
+async def get_current_user():
+    """현재 로그인한 사용자 정보 조회"""
+    return jsonify({
+        'user_id': session['user_id'],
+        'username': session['username'],
+        'email': session['email']
+    })
+
+
+@app.route('/api/auth/status', methods=['GET'])
+@app.route('/api/auth/check', methods=['GET'])
+async def check_auth_status():
+    """인증 상태 확인"""
+    if 'user_id' not in session:
+        return jsonify({'authenticated': False})
+    return jsonify({
+        'authenticated': True,
+        'user': {
+            'user_id': session['user_id'],
+            'username': session['username'],
+            'email': session['email']
+        }
+    })
+
+# ===== 라운드/통계 라우트 =====
+
+@app.route('/api/rounds', methods=['GET'])
+@require_auth
+async def get_rounds():
+    """현재 사용자의 라운드 기록을 최신순으로 한 페이지 조회 (로그인 필요, 조건은 app.py와 같음)"""
+    try:
+        try:
+            query = parse_rounds_query(request.args)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        page = await service.player_rounds(session['username'], **query)
+        return jsonify(to_json(page))
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+@app.route('/api/rounds', methods=['POST'])
+@require_auth
+async def create_round():
+    """새 라운드 기록 생성 (로그인 필요)"""
+    try:
+        data = await request.get_json()
+        course_name = data.get('course_name')
+        detailed_scores = data.get('detailed_scores', [])
+
+        if not course_name or len(detailed_scores) != 18:
+            return jsonify({'error': '필수 데이터가 누락되었습니다'}), 400
+
+        round_data = await service.save_round(session['username'], course_name, detailed_scores)
+        return jsonify({
+            'message': '라운드가 성공적으로 저장되었습니다',
+            'round_data': to_json(round_data)
+        })
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+@app.route('/api/rounds/export')
+@require_auth
+async def export_rounds_endpoint():
+    """로그인한 사용자의 라운드 내보내기 (조건과 응답 형식은 app.py와 같음)
+
+    ?format=csv|jsonl (기본값: csv). ?player로 다른 플레이어를 지정하면 403을 반환합니다.
+    """
+    fmt = request.args.get('format', 'csv')
+    if fmt not in EXPORT_FORMATS:
+        return jsonify({'error': 'format은 csv 또는 jsonl이어야 합니다.'}), 400
+
+    player_name = session['username']
+    if request.args.get('player', player_name) != player_name:
+        return jsonify({'error': '다른 플레이어의 라운드는 내보낼 수 없습니다.'}), 403
+
+    filename = f"rounds-{time.strftime('%Y%m%d')}.{fmt}"
+    response = Response(service.export_chunks(player_name, fmt), content_type=EXPORT_FORMATS[fmt],
+                        headers={'Content-Disposition': f'attachment; filename="{filename}"'})
+    response.timeout = None  # 큰 내보내기가 RESPONSE_TIMEOUT에 잘리지 않도록
+    return response
+
+
+@app.route('/api/rounds/import', methods=['POST'])
+@require_auth
+async def import_rounds_endpoint():
+    """라운드 일괄 가져오기 (로그인 필요, 로그인한 사용자의 라운드만, 조건과 응답 형식은 app.py와 같음)
+
+    본문(또는 multipart의 file)을 받는 만큼 작업 스레드에 넘겨 묶음 단위로 저장하며,
+    진행 상황을 한 줄에 하나씩 JSON으로 스트리밍합니다. 폼 본문은 415로 거부합니다.
+    ?format=csv|jsonl, ?skip=N 은 app.py와 같습니다.
+    """
+    # 폼 본문은 Quart가 먼저 읽어 필드로 풀어 버리므로 스트림으로 받을 수 없음
+    if request.mimetype == 'application/x-www-form-urlencoded':
+        return jsonify({'error': '본문을 text/csv 또는 application/x-ndjson으로 보내거나 multipart의 file 필드로 올려주세요.'}), 415
+    upload = None
+    if request.mimetype == 'multipart/form-data':
+        upload = (await request.files).get('file')
+        if upload is None:
+            return jsonify({'error': 'multipart 요청에는 file 필드가 필요합니다.'}), 400
+
+    fmt = (request.args.get('format') or
+           detect_format(upload.filename if upload else request.content_type))
+    if fmt not in ('csv', 'jsonl'):
+        return jsonify({'error': 'format=csv 또는 format=jsonl을 지정해주세요.'}), 400
+    try:
+        skip_records = max(0, int(request.args.get('skip', 0)))
+    except ValueError:
+        return jsonify({'error': 'skip은 0 이상의 정수여야 합니다.'}), 400
+
+    if upload:
+        raw = await asyncio.to_thread(spool_upload, upload.stream)
+    else:
+        raw = AsyncBodyReader(request.body, asyncio.get_running_loop())
+    stream = await service.open_import_stream(raw)
+    if stream is None:
+        raw.close()
+        return jsonify({'error': '가져올 내용이 없습니다.'}), 400
+
+    player_name = session['username']
+
+    async def generate():
+        last = {'records': skip_records}
+        try:
+            async for progress in service.import_rounds(stream, fmt, player_name, skip_records):
+                last = progress
+                yield json.dumps(progress, ensure_ascii=False) + '\n'
+        except Exception as e:
+            yield json.dumps({'error': str(e), 'records': last['records'], 'done': False},
+                             ensure_ascii=False) + '\n'
+        finally:
+            stream.close()
+
+    response = Response(generate(), mimetype='application/x-ndjson')
+    response.timeout = None
+    return response
+
+
+@app.route('/api/statistics')
+@require_auth
+async def get_player_statistics():
+    """현재 사용자의 통계 조회 (로그인 필요)"""
+    try:
+        return jsonify(await service.get_player_statistics(session['username']))
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+@app.route('/api/dashboard')
+@require_auth
+async def get_dashboard():
+    """현재 사용자의 라운드 한 페이지와 통계를 한 번에 조회 (페이지 조건은 /api/rounds와 같음)"""
+    try:
+        try:
+            query = parse_rounds_query(request.args)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        page = await service.dashboard(session['username'], **query)
+        return jsonify(to_json(page))
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+@app.route('/api/health')
+async def health_check():
+    """헬스 체크"""
+    try:
+        response = {'status': 'ok', 'message': '서비스 정상 작동'}
+        response.update(await service.health())
+        return jsonify(response)
+    except Exception as e:
+        return jsonify({'status': 'error', 'message': str(e)}), 500
+
+
+@app.route('/api/metrics')
+async def metrics():
+    """Prometheus 형식 지표 (라우트별 처리 시간, Sheets 호출 수/시간/전송량, 캐시 적중)"""
+    return Response(render_metrics(), content_type=CONTENT_TYPE)
+
+
+if __name__ == '__main__':
+    port = int(os.environ.get('PORT', 3000))
+    print(f"🌐 비동기 웹 서버 시작: http://localhost:{port}")
+    app.run(host='0.0.0.0', port=port)
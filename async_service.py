@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+비동기 서비스 계층 - GolfScoreManager/UserManager 작업을 이벤트 루프에서 사용
+Asyncio service layer over GolfScoreManager and UserManager
+"""
+
+import asyncio
+import functools
+import io
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterable, AsyncIterator, Dict, Iterator, List, Optional
+
+from golf_score_manager import GolfScoreManager
+from round_export import export_chunks, export_rounds, guarded_chunks
+from round_import import import_rounds
+from storage import storage_backend_name
+from user_manager import UserManager
+
+# 동시에 진행할 수 있는 저장소 호출 수 (스레드마다 별도의 Sheets HTTP 연결 사용)
+ASYNC_IO_CONCURRENCY = int(os.getenv('GOLF_ASYNC_IO_CONCURRENCY', '16'))
+
+
+_END = object()  # 동기 반복자의 끝 표시
+
+
+class AsyncBodyReader(io.RawIOBase):
+    """비동기 요청 본문(바이트 조각의 async iterable)을 작업 스레드에서 동기 스트림으로 읽는 어댑터
+
+    read()는 이벤트 루프에 다음 조각을 요청하고 받을 때까지 기다리므로 이벤트 루프가 아닌
+    스레드 풀에서만 호출해야 합니다. 본문을 메모리에 모으지 않고 받은 만큼 넘겨줍니다.
+    """
+
+    def __init__(self, body: AsyncIterable[bytes], loop: asyncio.AbstractEventLoop):
+        super().__init__()
+        self._chunks = body.__aiter__()
+        self._loop = loop
+        self._buffer = b''
+        self._finished = False
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        while not self._buffer and not self._finished:
+            self._buffer = asyncio.run_coroutine_threadsafe(self._next_chunk(), self._loop).result()
+        size = min(len(buffer), len(self._buffer))
+        buffer[:size] = self._buffer[:size]
+        self._buffer = self._buffer[size:]
+        return size
+
+    async def _next_chunk(self) -> bytes:
+        try:
+            return await self._chunks.__anext__()
+        except StopAsyncIteration:
+            self._finished = True
+            return b''
+
+
+class AsyncGolfService:
+    """Manager 작업을 전용 스레드 풀에서 실행하는 비동기 래퍼
+
+    Sheets 호출은 블로킹 I/O이므로 이벤트 루프 대신 크기가 제한된 스레드 풀에서 실행합니다.
+    요청 하나가 기다리는 동안 같은 프로세스의 다른 요청이 계속 진행됩니다.
+    Sheets 서비스(HTTP 연결)는 호출마다 공유 풀(sheets_client.SheetsServicePool)에서 빌려 씁니다.
+    """
+
+    def __init__(self, golf_manager: GolfScoreManager, user_manager: UserManager,
+                 concurrency: int = None):
+        self.golf_manager = golf_manager
+        self.user_manager = user_manager
+        self._executor = ThreadPoolExecutor(max_workers=max(1, concurrency or ASYNC_IO_CONCURRENCY),
+                                            thread_name_prefix='golf-io')
+
+    @classmethod
+    async def create(cls, spreadsheet_id: str = None, concurrency: int = None) -> 'AsyncGolfService':
+        """두 Manager를 동시에 초기화해서 서비스 생성 (인증/헤더 확인이 이벤트 루프를 막지 않음)"""
+        spreadsheet_id = spreadsheet_id or os.getenv('GOOGLE_SPREADSHEET_ID')
+        if not spreadsheet_id and storage_backend_name() == 'sheets':
+            raise ValueError("GOOGLE_SPREADSHEET_ID 환경변수가 설정되지 않았습니다.")
+
+        golf_manager, user_manager = await asyncio.gather(
+            asyncio.to_thread(GolfScoreManager, spreadsheet_id),
+            asyncio.to_thread(UserManager)
+        )
+        return cls(golf_manager, user_manager, concurrency)
+
+    async def _run(self, func, *args, **kwargs):
+        """블로킹 함수를 스레드 풀에서 실행하고 결과를 기다림"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+
+    # ===== 사용자 =====
+
+    async def register_user(self, username: str, email: str, password: str) -> Dict:
+        return await self._run(self.user_manager.register_user, username, email, password)
+
+    async def authenticate_user(self, username_or_email: str, password: str) -> Dict:
+        return await self._run(self.user_manager.authenticate_user, username_or_email, password)
+
+    # ===== 라운드 =====
+
+    async def load_rounds(self) -> List[Dict]:
+        return await self._run(self.golf_manager.load_from_sheets)
+
+    async def player_rounds(self, player_name: str, **query) -> Dict:
+        """플레이어 라운드 한 페이지 (query: get_player_rounds 인자)"""
+        return await self._run(self.golf_manager.get_player_rounds, player_name, **query)
+
+    async def save_round(self, player_name: str, course_name: str, detailed_scores: List[Dict]):
+        """홀별 상세 스코어로 라운드를 만들어 저장하고 반환"""
+        return await self._run(self._build_and_save_round, player_name, course_name, detailed_scores)
+
+    async def get_player_statistics(self, player_name: str) -> Dict:
+        return await self._run(self.golf_manager.get_player_statistics, player_name)
+
+    async def dashboard(self, player_name: str, **query) -> Dict:
+        """라운드 한 페이지와 통계를 함께 조회 (query: get_player_rounds 인자)
+
+        두 조회 모두 같은 라운드 목록 잠금을 쓰므로 겹쳐 실행해도 이득이 없어
+        스레드 하나에서 차례로 실행합니다.
+        """
+        return await self._run(self._dashboard, player_name, query)
+
+    async def export_chunks(self, player_name: str, fmt: str) -> AsyncIterator[str]:
+        """플레이어 라운드를 fmt 형식 텍스트 조각으로 반환 (시트를 페이지 단위로 읽는 것은 스레드 풀에서)
+
+        도중에 실패하면 round_export.guarded_chunks처럼 오류 표시로 끝납니다.
+        """
+        chunks = guarded_chunks(export_chunks(export_rounds(self.golf_manager, player_name), fmt), fmt)
+        async for chunk in self._iterate(chunks):
+            yield chunk
+
+    async def open_import_stream(self, raw: io.RawIOBase) -> Optional[io.TextIOWrapper]:
+        """업로드 본문을 텍스트 스트림으로 열기 (첫 바이트만 미리 읽어 보고 빈 본문이면 None)"""
+        return await self._run(self._open_import_stream, raw)
+
+    async def import_rounds(self, stream: io.TextIOWrapper, fmt: str, player_name: str,
+                            skip_records: int = 0) -> AsyncIterator[Dict]:
+        """본문을 읽으며 묶음 단위로 저장하고 진행 상황을 반환 (round_import.import_rounds와 같음)"""
+        progress = import_rounds(stream, fmt, self.golf_manager.save_rounds, skip_records=skip_records,
+                                 player_name=player_name)
+        async for item in self._iterate(progress):
+            yield item
+
+    async def health(self) -> Dict:
+        """읽기 캐시/쓰기 큐 지표"""
+        response = {'read_cache': self.golf_manager.get_read_cache_stats()}
+        write_queue_stats = self.golf_manager.get_write_queue_stats()
+        if write_queue_stats is not None:
+            response['write_queue'] = write_queue_stats
+        return response
+
+    async def close(self):
+        """대기 중인 쓰기를 마치고 스레드 풀 종료"""
+        await self._run(self.golf_manager.close)
+        await self._run(self.user_manager.close)
+        self._executor.shutdown(wait=True)
+
+    async def _iterate(self, iterator: Iterator) -> AsyncIterator:
+        """동기 반복자의 다음 값을 스레드 풀에서 하나씩 받아 반환"""
+        while True:
+            item = await self._run(next, iterator, _END)
+            if item is _END:
+                return
+            yield item
+
+    @staticmethod
+    def _open_import_stream(raw: io.RawIOBase) -> Optional[io.TextIOWrapper]:
+        binary = io.BufferedReader(raw)
+        if not binary.peek(1):
+            return None
+        return io.TextIOWrapper(binary, encoding='utf-8-sig', newline='')
+
+    def _dashboard(self, player_name: str, query: Dict) -> Dict:
+        page = self.golf_manager.get_player_rounds(player_name, **query)
+        page['statistics'] = self.golf_manager.get_player_statistics(player_name)
+        return page
+
+    def _build_and_save_round(self, player_name: str, course_name: str, detailed_scores: List[Dict]):
+        manager = self.golf_manager
+        round_data = manager.create_golf_round(player_name, course_name)
+        for hole, detailed_score in enumerate(detailed_scores, 1):
+            round_data = manager.add_detailed_score(
+                round_data,
+                hole,
+                detailed_score['par'],
+                detailed_score['driver'],
+                detailed_score['wood_util'],
+                detailed_score['iron'],
+                detailed_score['putter']
+            )
+        manager.calculate_handicap(round_data)
+        manager.save_to_sheets(round_data)
+        return round_data
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+플레이어 통계 벤치마크: 딕셔너리 목록 vs NumPy 열 지향 저장소
+Player statistics: list-of-dicts path vs. columnar NumPy store
+
+사용법: python benchmarks/bench_columnar_stats.py [--sizes 10000 1000000] [--players 200]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from columnar_store import ColumnarRoundStore, HOLE_COUNT, np
+from golf_score_manager import compute_player_statistics
+
+
+def make_rounds(count: int, players: int):
+    """합성 라운드 데이터 (메모리를 아끼려고 홀 상세 목록은 몇 가지 패턴을 공유)"""
+    rng = random.Random(42)
+    hole_patterns = []
+    for _ in range(32):
+        holes = []
+        for _ in range(HOLE_COUNT):
+            hole = {'par': rng.choice((3, 4, 4, 5)), 'driver': 1, 'wood_util': rng.randint(0, 1),
+                    'iron': rng.randint(1, 2), 'putter': rng.randint(1, 3)}
+            hole['total'] = hole['driver'] + hole['wood_util'] + hole['iron'] + hole['putter']
+            holes.append(hole)
+        hole_patterns.append(holes)
+
+    rounds = []
+    for index in range(count):
+        detailed_scores = hole_patterns[index % len(hole_patterns)]
+        total_score = sum(hole['total'] for hole in detailed_scores) + rng.randint(-5, 5)
+        rounds.append({
+            'date': f'2024-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}',
+            'player_name': f'player{rng.randrange(players)}',
+            'course_name': f'course{rng.randrange(20)}',
+            'total_score': total_score,
+            'handicap': max(0, total_score - 72),
+            'scores': [hole['total'] for hole in detailed_scores],
+            'detailed_scores': detailed_scores
+        })
+    return rounds
+
+
+def dict_statistics(rounds, player_name):
+    """GolfScoreManager.get_player_statistics의 딕셔너리 경로"""
+    player_rounds = [r for r in rounds if r['player_name'] == player_name]
+    return compute_player_statistics(player_name, player_rounds)
+
+
+def time_queries(func, player_names, repeat: int) -> float:
+    """쿼리 한 번당 평균 시간 (밀리초)"""
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for player_name in player_names:
+            func(player_name)
+    return (time.perf_counter() - started) * 1000 / (repeat * len(player_names))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='플레이어 통계 벤치마크')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10000, 1000000], help='라운드 수')
+    parser.add_argument('--players', type=int, default=200, help='플레이어 수')
+    parser.add_argument('--queries', type=int, default=20, help='측정할 플레이어 수')
+    args = parser.parse_args()
+
+    if np is None:
+        print("numpy가 설치되어 있지 않습니다: pip install numpy")
+        return
+
+    print(f"{'라운드 수':>10}{'구축(초)':>10}{'배열 MB':>10}{'dict ms/쿼리':>14}{'numpy ms/쿼리':>15}{'배속':>8}")
+    for size in args.sizes:
+        rounds = make_rounds(size, args.players)
+        player_names = [f'player{index}' for index in range(min(args.queries, args.players))]
+
+        started = time.perf_counter()
+        store = ColumnarRoundStore.from_rounds(rounds)
+        build_seconds = time.perf_counter() - started
+
+        for player_name in player_names:
+            assert dict_statistics(rounds, player_name) == store.player_statistics(player_name)
+
+        repeat = max(1, 100000 // size)
+        dict_ms = time_queries(lambda name: dict_statistics(rounds, name), player_names, repeat)
+        numpy_ms = time_queries(store.player_statistics, player_names, repeat)
+        print(f"{size:>10}{build_seconds:>10.2f}{store.nbytes() / 1e6:>10.1f}"
+              f"{dict_ms:>14.3f}{numpy_ms:>15.3f}{dict_ms / numpy_ms:>8.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+GolfScoreManager/UserManager 벤치마크 (메모리 Sheets 에뮬레이터, pytest-benchmark 형식)
+Manager benchmarks against the in-memory Sheets emulator
+
+사용법:
+  pip install pytest-benchmark
+  pytest benchmarks/bench_managers.py --benchmark-group-by=param:rows
+  GOLF_BENCH_ROWS=1000,10000 pytest benchmarks/bench_managers.py    # 시트 행 수 (기본 1000,10000,100000)
+  GOLF_EMULATOR_LATENCY_MS=50 pytest benchmarks/bench_managers.py   # 요청마다 지연 추가
+
+pytest-benchmark가 없으면 간단한 대체 fixture가 평균 시간을 출력합니다 (pytest -s로 확인).
+라운드는 한 개당 약 350바이트라 10만 행도 GOLF_READ_CACHE_MAX_BYTES 기본값(64MB) 안에서
+캐시됩니다. 값을 줄이면 캐시 대신 요청마다 새 행만 이어 읽는 경우를 측정할 수 있습니다.
+"""
+
+import itertools
+import os
+import random
+import sys
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from golf_score_manager import SCORE_SCHEMA_VERSION, GolfScoreManager, _score_headers
+from password_hasher import PasswordHasher
+from sheets_emulator import SheetsEmulator
+from user_manager import UserManager
+
+ROW_COUNTS = [int(value) for value in os.getenv('GOLF_BENCH_ROWS', '1000,10000,100000').split(',')]
+PLAYER_COUNT = 100
+HASH_ITERATIONS = 1000  # 로그인 벤치마크가 PBKDF2 시간에 묻히지 않도록 낮춤
+PASSWORD = 'bench-password'
+FALLBACK_ROUNDS = 5
+
+try:
+    import pytest_benchmark  # noqa: F401
+except ImportError:
+    class _SimpleBenchmark:
+        """pytest-benchmark의 benchmark fixture 대체 (같은 호출 형식)"""
+
+        def __init__(self, name: str):
+            self.name = name
+
+        def __call__(self, func, *args, **kwargs):
+            result = func(*args, **kwargs)  # 준비 실행
+            timings = []
+            for _ in range(FALLBACK_ROUNDS):
+                started = time.perf_counter()
+                result = func(*args, **kwargs)
+                timings.append(time.perf_counter() - started)
+            print(f"\n{self.name}: 평균 {sum(timings) / len(timings) * 1000:.2f}ms "
+                  f"(최소 {min(timings) * 1000:.2f}ms, {FALLBACK_ROUNDS}회)")
+            return result
+
+    @pytest.fixture
+    def benchmark(request):
+        return _SimpleBenchmark(request.node.name)
+
+
+def make_score_rows(count: int):
+    """Score 시트 데이터 행 (숫자 셀은 숫자 그대로)"""
+    rng = random.Random(count)
+    rows = []
+    for _ in range(count):
+        holes = []
+        for _ in range(18):
+            hole = [rng.choice((3, 4, 5)), 1, rng.randint(0, 1), rng.randint(1, 2), rng.randint(1, 3)]
+            holes.extend(hole + [sum(hole[1:])])
+        total = sum(holes[5::6])
+        rows.append([f'2024-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}', f'player{rng.randrange(PLAYER_COUNT)}',
+                     f'course{rng.randrange(20)}', total, max(0, total - 72)] + holes)
+    return rows
+
+
+@pytest.fixture(scope='module', params=ROW_COUNTS, ids=lambda rows: f'rows={rows}')
+def rows(request):
+    return request.param
+
+
+@pytest.fixture(scope='module')
+def score_sheet(rows):
+    """헤더와 rows개의 라운드가 들어 있는 Score 시트"""
+    emulator = SheetsEmulator()
+    spreadsheet_id = f'bench-score-{rows}'
+    header = _score_headers() + [f'schema_v{SCORE_SCHEMA_VERSION}']
+    emulator.load_rows(spreadsheet_id, 'Score', [header] + make_score_rows(rows), value_input='RAW')
+    return emulator, spreadsheet_id
+
+
+@pytest.fixture(scope='module')
+def member_sheet(rows):
+    """헤더와 rows명의 사용자가 들어 있는 Member 시트"""
+    emulator = SheetsEmulator()
+    spreadsheet_id = f'bench-member-{rows}'
+    hasher = PasswordHasher(iterations=HASH_ITERATIONS, executor='inline')
+    password_hash = hasher.hash(PASSWORD)
+    users = [[f'id{index}', f'user{index}', f'user{index}@example.com', password_hash, '2024-01-01T00:00:00', '']
+             for index in range(rows)]
+    emulator.load_rows(spreadsheet_id, 'Member',
+                       [['user_id', 'username', 'email', 'password_hash', 'created_at', 'last_login']] + users)
+    return emulator, spreadsheet_id, hasher
+
+
+def golf_manager(score_sheet) -> GolfScoreManager:
+    emulator, spreadsheet_id = score_sheet
+    return GolfScoreManager(spreadsheet_id, write_behind=False, backend=emulator.backend(spreadsheet_id))
+
+
+@pytest.fixture(scope='module')
+def loaded_golf_manager(score_sheet):
+    manager = golf_manager(score_sheet)
+    manager.load_from_sheets()
+    return manager
+
+
+@pytest.fixture(scope='module')
+def user_manager(member_sheet):
+    emulator, spreadsheet_id, hasher = member_sheet
+    manager = UserManager(password_hasher=hasher, backend=emulator.backend(spreadsheet_id))
+    manager.get_all_users()  # 사용자 인덱스 준비
+    yield manager
+    manager.close()
+
+
+def test_save_round(benchmark, loaded_golf_manager):
+    round_data = loaded_golf_manager.create_golf_round('player1', 'course1')
+    for hole in range(1, 19):
+        loaded_golf_manager.add_detailed_score(round_data, hole, 4, 1, 1, 1, 2)
+    loaded_golf_manager.calculate_handicap(round_data)
+    benchmark(loaded_golf_manager.save_to_sheets, round_data)
+
+
+def test_load_cold(benchmark, score_sheet, rows):
+    """새 Manager가 시트 전체를 읽고 파싱"""
+    rounds = benchmark(lambda: golf_manager(score_sheet).load_from_sheets())
+    assert len(rounds) >= rows
+
+
+def test_load_cached(benchmark, loaded_golf_manager):
+    benchmark(loaded_golf_manager.load_from_sheets)
+
+
+def test_player_statistics(benchmark, loaded_golf_manager):
+    stats = benchmark(loaded_golf_manager.get_player_statistics, 'player7')
+    assert stats['total_rounds'] > 0
+
+
+def test_register_user(benchmark, user_manager):
+    counter = itertools.count()
+
+    def register():
+        index = next(counter)
+        return user_manager.register_user(f'new{index}', f'new{index}@example.com', PASSWORD)
+
+    assert benchmark(register)['success']
+
+
+def test_login(benchmark, user_manager, rows):
+    username = f'user{rows // 2}'
+    assert benchmark(user_manager.authenticate_user, username, PASSWORD)['success']
+
+
+if __name__ == '__main__':
+    sys.exit(pytest.main([__file__, '-s'] + sys.argv[1:]))
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+비밀번호 검증 처리량 벤치마크 (워커 수별 초당 로그인 수)
+Login throughput vs. password-hash worker count
+
+사용법: python benchmarks/bench_password_hash.py [--logins 200] [--iterations 100000]
+"""
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from password_hasher import PasswordHasher
+
+
+def measure(hasher: PasswordHasher, password_hash: str, logins: int, request_threads: int) -> float:
+    """요청 스레드 request_threads개가 동시에 로그인할 때 초당 검증 수"""
+    hasher.verify('secret-password', password_hash)  # 워커 풀 준비
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=request_threads) as pool:
+        results = list(pool.map(lambda _: hasher.verify('secret-password', password_hash), range(logins)))
+    elapsed = time.perf_counter() - started
+    assert all(results)
+    return logins / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description='비밀번호 검증 처리량 벤치마크')
+    parser.add_argument('--logins', type=int, default=200, help='측정할 로그인 수')
+    parser.add_argument('--iterations', type=int, default=100000, help='PBKDF2 반복 횟수')
+    parser.add_argument('--request-threads', type=int, default=16, help='동시 요청 스레드 수 (Flask 스레드 모사)')
+    args = parser.parse_args()
+
+    cpu_count = os.cpu_count() or 1
+    worker_counts = sorted({1, 2, 4, 8, cpu_count})
+
+    print(f"PBKDF2 반복 횟수 {args.iterations}, 로그인 {args.logins}회, 요청 스레드 {args.request_threads}개, CPU {cpu_count}개")
+    print(f"{'실행 방식':<12}{'워커':>6}{'로그인/초':>12}")
+
+    inline = PasswordHasher(iterations=args.iterations, executor='inline')
+    password_hash = inline.hash('secret-password')
+    print(f"{'inline':<12}{'-':>6}{measure(inline, password_hash, args.logins, args.request_threads):>12.1f}")
+
+    for kind in ('thread', 'process'):
+        for workers in worker_counts:
+            hasher = PasswordHasher(iterations=args.iterations, executor=kind, workers=workers)
+            try:
+                rate = measure(hasher, password_hash, args.logins, args.request_threads)
+            finally:
+                hasher.shutdown()
+            print(f"{kind:<12}{workers:>6}{rate:>12.1f}")
+
+
+if __name__ == '__main__':
+    main()
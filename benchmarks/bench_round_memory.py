@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+라운드 한 개당 메모리 사용량 벤치마크: 딕셔너리 라운드 vs GolfRound
+Bytes per loaded round: nested dicts vs. compact GolfRound
+
+사용법: python benchmarks/bench_round_memory.py [--rounds 20000]
+"""
+
+import argparse
+import os
+import random
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from round_model import HOLE_FIELDS, GolfRound, compact_array
+
+
+def make_rows(count: int):
+    """Score 시트에서 읽은 것과 같은 문자열 행"""
+    rng = random.Random(7)
+    rows = []
+    for _ in range(count):
+        holes = []
+        for _ in range(18):
+            hole = [rng.choice((3, 4, 5)), 1, rng.randint(0, 1), rng.randint(1, 2), rng.randint(1, 3)]
+            holes.extend(hole + [sum(hole[1:])])
+        total = sum(holes[5::6])
+        rows.append([f'2024-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}', f'player{rng.randrange(100)}',
+                     f'course{rng.randrange(20)}', str(total), str(max(0, total - 72))] + [str(v) for v in holes])
+    return rows
+
+
+def to_dict_round(row):
+    """기존 load_from_sheets가 만들던 딕셔너리 라운드"""
+    detailed_scores = []
+    for i in range(18):
+        start = 5 + i * 6
+        detailed_scores.append({field: int(row[start + offset]) for offset, field in enumerate(HOLE_FIELDS)})
+    return {
+        'date': row[0], 'player_name': row[1], 'course_name': row[2],
+        'total_score': int(row[3]), 'handicap': int(row[4]),
+        'scores': [hole['total'] for hole in detailed_scores],
+        'detailed_scores': detailed_scores
+    }
+
+
+def to_golf_round(row):
+    """GolfRound (홀별 값은 1바이트 배열)"""
+    return GolfRound(row[0], row[1], row[2], compact_array([int(value) for value in row[5:113]]),
+                     total_score=int(row[3]), handicap=int(row[4]))
+
+
+def measure(build, rows) -> float:
+    """rows를 모두 변환해 보관했을 때 라운드 한 개당 바이트"""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    rounds = [build(row) for row in rows]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    assert len(rounds) == len(rows)
+    return (after - before) / len(rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='라운드 메모리 사용량 벤치마크')
+    parser.add_argument('--rounds', type=int, default=20000, help='라운드 수')
+    args = parser.parse_args()
+
+    rows = make_rows(args.rounds)
+    assert to_golf_round(rows[0]).to_dict() == to_dict_round(rows[0])
+
+    dict_bytes = measure(to_dict_round, rows)
+    compact_bytes = measure(to_golf_round, rows)
+    print(f"라운드 {args.rounds}개")
+    print(f"{'형식':<12}{'바이트/라운드':>16}")
+    print(f"{'dict':<12}{dict_bytes:>16.0f}")
+    print(f"{'GolfRound':<12}{compact_bytes:>16.0f}")
+    print(f"절감: {dict_bytes / compact_bytes:.1f}배")
+
+
+if __name__ == '__main__':
+    main()
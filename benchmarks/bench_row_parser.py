@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Score 시트 행 파싱 속도 벤치마크: 기존 isdigit 파서 vs score_parser
+Rows/sec for the legacy isdigit row parser vs. score_parser
+
+사용법: python benchmarks/bench_row_parser.py [--rows 100000] [--repeat 3]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from round_model import GolfRound, compact_array
+from score_parser import parse_score_row
+
+
+def make_rows(count: int, unformatted: bool):
+    """Score 시트 행 (unformatted=True면 숫자 셀이 UNFORMATTED_VALUE 응답처럼 int)"""
+    rng = random.Random(7)
+    cell = (lambda value: value) if unformatted else str
+    rows = []
+    for _ in range(count):
+        holes = []
+        for _ in range(18):
+            hole = [rng.choice((3, 4, 5)), 1, rng.randint(0, 1), rng.randint(1, 2), rng.randint(1, 3)]
+            holes.extend(hole + [sum(hole[1:])])
+        total = sum(holes[5::6])
+        rows.append([f'2024-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}', f'player{rng.randrange(100)}',
+                     f'course{rng.randrange(20)}', cell(total), cell(max(0, total - 72))]
+                    + [cell(value) for value in holes])
+    return rows
+
+
+def legacy_parse(row):
+    """이전 GolfScoreManager._parse_score_row (문자열 셀만 처리)"""
+    if len(row) < 5:
+        return None
+    details = []
+    for i in range(18):
+        start_idx = 5 + (i * 6)
+        if start_idx + 5 < len(row):
+            details.extend([
+                int(row[start_idx]) if row[start_idx].isdigit() else 4,
+                int(row[start_idx + 1]) if row[start_idx + 1].isdigit() else 0,
+                int(row[start_idx + 2]) if row[start_idx + 2].isdigit() else 0,
+                int(row[start_idx + 3]) if row[start_idx + 3].isdigit() else 0,
+                int(row[start_idx + 4]) if row[start_idx + 4].isdigit() else 0,
+                int(row[start_idx + 5]) if row[start_idx + 5].isdigit() else 0
+            ])
+        else:
+            details.extend([4, 0, 0, 0, 0, 0])
+    return GolfRound(
+        row[0], row[1], row[2], compact_array(details),
+        total_score=int(row[3]) if row[3].isdigit() else 0,
+        handicap=int(row[4]) if row[4].isdigit() else 0
+    )
+
+
+def rows_per_second(parse, rows, repeat: int) -> float:
+    """가장 빠른 반복 기준 초당 처리 행 수"""
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for row in rows:
+            parse(row)
+        best = min(best, time.perf_counter() - started)
+    return len(rows) / best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Score 행 파싱 속도 벤치마크')
+    parser.add_argument('--rows', type=int, default=100000, help='행 수')
+    parser.add_argument('--repeat', type=int, default=3, help='반복 횟수')
+    args = parser.parse_args()
+
+    text_rows = make_rows(args.rows, unformatted=False)
+    number_rows = make_rows(args.rows, unformatted=True)
+    assert parse_score_row(number_rows[0]).to_dict() == legacy_parse(text_rows[0]).to_dict()
+
+    results = [
+        ('legacy (문자열)', rows_per_second(legacy_parse, text_rows, args.repeat)),
+        ('parser (문자열)', rows_per_second(parse_score_row, text_rows, args.repeat)),
+        ('parser (숫자)', rows_per_second(parse_score_row, number_rows, args.repeat)),
+    ]
+    print(f"행 {args.rows}개, {args.repeat}회 중 최고 기록")
+    print(f"{'파서':<18}{'행/초':>14}")
+    for name, rate in results:
+        print(f"{name:<18}{rate:>14,.0f}")
+    print(f"속도 향상 (숫자 셀): {results[2][1] / results[0][1]:.1f}배")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+열 지향(columnar) 라운드 저장소 - NumPy 벡터 연산 통계
+Columnar round store with vectorized statistics (optional NumPy dependency)
+"""
+
+from typing import Dict, Iterable, List, Optional
+
+from round_model import HOLE_FIELDS, GolfRound
+
+try:
+    import numpy as np
+except ImportError:  # NumPy가 없으면 기존 딕셔너리 경로만 사용
+    np = None
+
+HOLE_COUNT = 18
+# 홀별 값 배열 형식: GolfRound의 가장 넓은 배열 형식('q', 64비트)과 같아야 큰 값이 잘리지 않음
+HOLE_DTYPE = np.int64 if np is not None else None
+
+
+def numpy_available() -> bool:
+    """NumPy 설치 여부"""
+    return np is not None
+
+
+class ColumnarRoundStore:
+    """라운드를 연속된 정수 배열로 보관하는 저장소
+
+    holes: (라운드 수 × 18 × 6) int64 배열 - par/driver/wood_util/iron/putter/total
+    total_scores, handicaps: 라운드별 정수 배열
+    dates: datetime64[D] 배열 (해석할 수 없는 날짜는 NaT)
+    player_codes, course_codes: 이름을 정수 코드로 바꾼 배열 (players/courses 목록의 위치)
+    """
+
+    def __init__(self, capacity: int = 1024):
+        if np is None:
+            raise RuntimeError("열 지향 저장소를 사용하려면 numpy를 설치하세요: pip install numpy")
+
+        capacity = max(1, capacity)
+        self.size = 0
+        self.holes = np.zeros((capacity, HOLE_COUNT, len(HOLE_FIELDS)), dtype=HOLE_DTYPE)
+        self.total_scores = np.zeros(capacity, dtype=np.int64)
+        self.handicaps = np.zeros(capacity, dtype=np.int64)
+        self.dates = np.full(capacity, np.datetime64('NaT'), dtype='datetime64[D]')
+        self.player_codes = np.zeros(capacity, dtype=np.int32)
+        self.course_codes = np.zeros(capacity, dtype=np.int32)
+        self.players: List[str] = []
+        self.courses: List[str] = []
+        self._player_lookup: Dict[str, int] = {}
+        self._course_lookup: Dict[str, int] = {}
+
+    @classmethod
+    def from_rounds(cls, rounds: List[Dict]) -> 'ColumnarRoundStore':
+        """라운드 딕셔너리 목록으로 저장소 생성"""
+        store = cls(capacity=len(rounds))
+        store.extend(rounds)
+        return store
+
+    def extend(self, rounds: Iterable[Dict]):
+        """라운드 여러 개 추가"""
+        for round_data in rounds:
+            self.append(round_data)
+
+    def append(self, round_data: Dict):
+        """라운드 하나 추가 (배열이 가득 차면 두 배로 늘림)"""
+        if self.size == len(self.total_scores):
+            self._grow(self.size * 2)
+
+        position = self.size
+        if isinstance(round_data, GolfRound):
+            # 홀별 값이 이미 연속 배열이므로 그대로 복사
+            hole_values = np.frombuffer(round_data.hole_values(), dtype=round_data.hole_values().typecode)
+            hole_values = hole_values.reshape(-1, len(HOLE_FIELDS))[:HOLE_COUNT]
+        else:
+            hole_values = [[hole.get(field, 0) for field in HOLE_FIELDS]
+                           for hole in round_data['detailed_scores'][:HOLE_COUNT]]
+        self.holes[position, :len(hole_values)] = hole_values
+        self.total_scores[position] = round_data['total_score']
+        self.handicaps[position] = round_data.get('handicap', 0)
+        self.dates[position] = self._parse_date(round_data.get('date'))
+        self.player_codes[position] = self._code(round_data['player_name'], self.players, self._player_lookup)
+        self.course_codes[position] = self._code(round_data['course_name'], self.courses, self._course_lookup)
+        self.size += 1
+
+    def player_mask(self, player_name: str) -> Optional['np.ndarray']:
+        """해당 플레이어 라운드 위치의 불리언 마스크 (기록이 없으면 None)"""
+        code = self._player_lookup.get(player_name)
+        if code is None:
+            return None
+        return self.player_codes[:self.size] == code
+
+    def player_statistics(self, player_name: str, positions: Optional[List[int]] = None) -> Dict:
+        """플레이어 통계를 벡터 연산으로 계산 (GolfScoreManager.get_player_statistics와 같은 형식)
+
+        positions(플레이어 색인의 날짜순 위치)를 주면 전체 마스크 대신 해당 위치만 읽고,
+        최근 5라운드도 그 순서 기준으로 계산합니다.
+        """
+        if positions is not None:
+            scores = self.total_scores[np.asarray(positions, dtype=np.intp)]
+        else:
+            mask = self.player_mask(player_name)
+            scores = self.total_scores[:self.size][mask] if mask is not None else None
+        if scores is None or not len(scores):
+            return {"message": f"{player_name}의 라운드 기록이 없습니다."}
+
+        return {
+            'player_name': player_name,
+            'total_rounds': int(len(scores)),
+            'average_score': round(float(scores.mean()), 1),
+            'best_score': int(scores.min()),
+            'worst_score': int(scores.max()),
+            'recent_5_rounds_avg': round(float(scores[-5:].mean()), 1)
+        }
+
+    def nbytes(self) -> int:
+        """배열이 사용하는 메모리 (바이트)"""
+        return sum(array.nbytes for array in (self.holes, self.total_scores, self.handicaps,
+                                              self.dates, self.player_codes, self.course_codes))
+
+    def _grow(self, capacity: int):
+        """모든 배열의 용량 확장"""
+        capacity = max(1, capacity)
+        extra = capacity - len(self.total_scores)
+        self.holes = np.concatenate([self.holes, np.zeros((extra, HOLE_COUNT, len(HOLE_FIELDS)), dtype=HOLE_DTYPE)])
+        self.total_scores = np.concatenate([self.total_scores, np.zeros(extra, dtype=np.int64)])
+        self.handicaps = np.concatenate([self.handicaps, np.zeros(extra, dtype=np.int64)])
+        self.dates = np.concatenate([self.dates, np.full(extra, np.datetime64('NaT'), dtype='datetime64[D]')])
+        self.player_codes = np.concatenate([self.player_codes, np.zeros(extra, dtype=np.int32)])
+        self.course_codes = np.concatenate([self.course_codes, np.zeros(extra, dtype=np.int32)])
+
+    def _code(self, name: str, names: List[str], lookup: Dict[str, int]) -> int:
+        """이름을 정수 코드로 변환 (처음 보는 이름이면 새 코드 부여)"""
+        code = lookup.get(name)
+        if code is None:
+            code = len(names)
+            names.append(name)
+            lookup[name] = code
+        return code
+
+    def _parse_date(self, date: str):
+        """'YYYY-MM-DD' 날짜를 datetime64로 변환 (실패하면 NaT)"""
+        try:
+            return np.datetime64(str(date)[:10], 'D')
+        except ValueError:
+            return np.datetime64('NaT')
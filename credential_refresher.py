@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+백그라운드 인증 정보 갱신
+Background OAuth credential refresher
+"""
+
+import json
+import os
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Dict, Optional
+
+from google.auth.exceptions import RefreshError, TransportError
+from google.auth.transport.requests import Request
+from google.oauth2.credentials import Credentials
+
+# 만료 몇 초 전에 미리 갱신할지 (0이면 백그라운드 갱신 비활성화)
+CREDENTIAL_REFRESH_MARGIN = float(os.getenv('GOLF_CREDENTIAL_REFRESH_MARGIN', '300'))
+CREDENTIAL_CHECK_INTERVAL = 60.0  # 만료 시각을 다시 확인하는 최대 간격 (초)
+CREDENTIAL_RETRY_INTERVAL = 30.0  # 갱신 실패 후 재시도 간격 (초)
+
+
+def seconds_until_expiry(credentials) -> Optional[float]:
+    """토큰 만료까지 남은 시간 (만료 시각이 없으면 None)"""
+    expiry = getattr(credentials, 'expiry', None)
+    if expiry is None:
+        return None
+    # google-auth의 expiry는 시간대 정보가 없는 UTC 시각
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    return (expiry - now).total_seconds()
+
+
+class CredentialRefresher:
+    """만료 전에 인증 정보를 갱신해 팩토리에 통째로 교체하는 백그라운드 스레드
+
+    사용 중인 인증 정보 객체를 직접 갱신하지 않고 복사본을 갱신한 뒤
+    factory.swap_credentials()로 바꿔 넣으므로, 요청 스레드는 항상 갱신 전이나 후의
+    완전한 토큰만 보게 되고 만료 시점에 걸린 요청이 갱신 지연을 떠안지 않습니다.
+    """
+
+    def __init__(self, factory, margin: float = None, check_interval: float = None,
+                 retry_interval: float = None, name: str = 'credential-refresher'):
+        self.factory = factory
+        self.margin = CREDENTIAL_REFRESH_MARGIN if margin is None else margin
+        self.check_interval = check_interval or CREDENTIAL_CHECK_INTERVAL
+        self.retry_interval = retry_interval or CREDENTIAL_RETRY_INTERVAL
+        self.name = name
+
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._refresh_lock = threading.Lock()
+
+        # 모니터링용 지표
+        self._stats_lock = threading.Lock()
+        self._refresh_count = 0
+        self._failed_refreshes = 0
+        self._last_refresh_at = None
+        self._last_refresh_latency = 0.0
+        self._max_refresh_latency = 0.0
+        self._last_error = None
+
+    def start(self):
+        """백그라운드 스레드 시작 (이미 실행 중이면 무시)"""
+        if self._thread is None or not self._thread.is_alive():
+            self._stop_event.clear()
+            self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: Optional[float] = 5.0):
+        """백그라운드 스레드 종료"""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def refresh_now(self) -> bool:
+        """지금 바로 갱신하고 성공 여부 반환"""
+        with self._refresh_lock:
+            current = self.factory.credentials
+            started = time.monotonic()
+            try:
+                fresh = Credentials.from_authorized_user_info(json.loads(current.to_json()), current.scopes)
+                fresh.refresh(Request())
+            except (RefreshError, TransportError, ValueError) as error:
+                with self._stats_lock:
+                    self._failed_refreshes += 1
+                    self._last_error = str(error)
+                print(f"인증 정보 갱신 실패: {error}")
+                return False
+
+            self.factory.swap_credentials(fresh)
+            latency = time.monotonic() - started
+            with self._stats_lock:
+                self._refresh_count += 1
+                self._last_refresh_at = time.time()
+                self._last_refresh_latency = latency
+                self._max_refresh_latency = max(self._max_refresh_latency, latency)
+                self._last_error = None
+            return True
+
+    def stats(self) -> Dict:
+        """갱신 횟수, 마지막 갱신 시각/지연 시간, 만료까지 남은 시간"""
+        remaining = seconds_until_expiry(self.factory.credentials)
+        with self._stats_lock:
+            last_refresh_at = self._last_refresh_at
+            return {
+                'running': self._thread is not None and self._thread.is_alive(),
+                'refresh_count': self._refresh_count,
+                'failed_refreshes': self._failed_refreshes,
+                'last_refresh_at': (datetime.fromtimestamp(last_refresh_at).isoformat()
+                                    if last_refresh_at else None),
+                'last_refresh_latency_ms': round(self._last_refresh_latency * 1000, 2),
+                'max_refresh_latency_ms': round(self._max_refresh_latency * 1000, 2),
+                'expires_in_seconds': round(remaining) if remaining is not None else None,
+                'last_error': self._last_error
+            }
+
+    def _run(self):
+        while not self._stop_event.is_set():
+            credentials = self.factory.credentials
+            remaining = seconds_until_expiry(credentials)
+            if remaining is None or not getattr(credentials, 'refresh_token', None):
+                wait = self.check_interval  # 만료 시각이 없거나 갱신할 수 없는 인증 정보
+            elif remaining <= self.margin:
+                wait = self.check_interval if self.refresh_now() else self.retry_interval
+            else:
+                wait = min(remaining - self.margin, self.check_interval)
+            self._stop_event.wait(wait)
@@ -5,118 +5,224 @@ Golf Score Manager with Google Sheets Integration
 """
 
 import os
-import json
+import argparse
+import atexit
+import base64
+import threading
+import time
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import Dict, Iterator, List, Mapping, Optional, Tuple
 
-from google.auth.transport.requests import Request
-from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build
-from googleapiclient.errors import HttpError
+
+from columnar_store import ColumnarRoundStore, numpy_available
+from metrics import observe_phase
+from player_index import PlayerRoundIndex, select_entries
+from player_stats import PlayerStatsStore
+from quota_scheduler import PRIORITY_READ, PRIORITY_REFRESH, request_priority
+from read_cache import VersionedReadCache
+from round_model import GolfRound
+from score_parser import parse_score_row
+from sheets_client import get_client_factory
+from storage import QuotaExhausted, StorageBackend, StorageError, create_backend, storage_backend_name
+from write_behind import WriteBehindQueue
 
 # Google Sheets API 설정
-SCOPES = ['https://www.googleapis.com/auth/spreadsheets']
 SPREADSHEET_ID = os.getenv('GOOGLE_SPREADSHEET_ID')
-SCORE_RANGE_NAME = 'Score!A1:DI1000'  # 스코어 데이터를 저장할 시트 범위 (113개 컬럼)
+SCORE_RANGE_NAME = 'Score!A:DI'  # 스코어 데이터를 저장할 시트 범위 (113개 컬럼, 행 수 제한 없음)
+SCORE_LAST_COLUMN = 'DI'
+SCORE_HEADER_LENGTH = 113  # 5개 기본 + 18홀 * 6개 항목
+SCORE_SCHEMA_VERSION = 1  # 헤더/열 구성이 바뀌면 올리고 migrate_schema() 실행
+SCORE_SCHEMA_COLUMN = 'DJ'  # 헤더 오른쪽 셀에 스키마 버전 기록 (데이터 범위 A:DI 밖)
+
+# 쓰기 지연(write-behind) 모드 설정
+WRITE_BEHIND_ENABLED = os.getenv('GOLF_WRITE_BEHIND', '').lower() in ('1', 'true', 'yes')
+WRITE_BEHIND_BATCH_SIZE = int(os.getenv('GOLF_WRITE_BEHIND_BATCH_SIZE', '50'))  # 한 번에 추가할 최대 행 수
+WRITE_BEHIND_INTERVAL = float(os.getenv('GOLF_WRITE_BEHIND_INTERVAL', '2.0'))  # 최대 대기 시간 (초)
+WRITE_BEHIND_MAX_QUEUE = int(os.getenv('GOLF_WRITE_BEHIND_MAX_QUEUE', '1000'))  # 큐에 쌓을 수 있는 최대 라운드 수
+WRITE_BEHIND_MAX_ATTEMPTS = int(os.getenv('GOLF_WRITE_BEHIND_MAX_ATTEMPTS', '10'))  # 배치 연속 실패 허용 횟수, 넘으면 행별 전송 후 포기
+WRITE_BEHIND_ENQUEUE_TIMEOUT = 0.5  # 큐가 가득 찼을 때 기다리는 시간 (초), 초과 시 바로 저장
+
+# 라운드 읽기 캐시 설정 (TTL 0이면 비활성화)
+READ_CACHE_TTL = float(os.getenv('GOLF_READ_CACHE_TTL', '30'))  # 초
+# 파싱한 라운드(GolfRound.nbytes() 합계) 기준 캐시 크기 한도, 라운드 10만 개(약 35MB)가 들어가는 크기
+READ_CACHE_MAX_BYTES = int(os.getenv('GOLF_READ_CACHE_MAX_BYTES', str(64 * 1024 * 1024)))
+FULL_RESYNC_INTERVAL = float(os.getenv('GOLF_FULL_RESYNC_INTERVAL', '300'))  # 시트 전체 재동기화 주기 (초)
+
+# 라운드 목록 페이지 크기 (GET /api/rounds의 limit 기본값/최댓값)
+ROUNDS_PAGE_SIZE = 20
+ROUNDS_MAX_PAGE_SIZE = 100
+
+# 플레이어 통계를 누적 통계 대신 열 지향(NumPy) 배열의 벡터 연산으로 계산할지 여부 (numpy 필요)
+COLUMNAR_STATS_ENABLED = os.getenv('GOLF_COLUMNAR_STATS', '').lower() in ('1', 'true', 'yes')
+
+# 헤더/스키마 확인을 마친 (저장소, 스프레드시트) 목록 - 프로세스당 한 번만 확인
+_verified_schemas = set()
+_schema_lock = threading.Lock()
+
+
+def _score_headers() -> List[str]:
+    """Score 시트 헤더 (113개 컬럼)"""
+    headers = [
+        '날짜', '플레이어', '코스', '총 스코어', '핸디캡'
+    ]
+    # 홀별 상세 스코어 헤더 추가
+    for i in range(18):
+        hole_num = i + 1
+        headers.extend([
+            f'홀{hole_num}_Par', f'홀{hole_num}_Driver', f'홀{hole_num}_Wood/Util', 
+            f'홀{hole_num}_Iron', f'홀{hole_num}_Putter', f'홀{hole_num}_Total'
+        ])
+    return headers
+
+
+def encode_round_cursor(entry: Tuple[str, int]) -> str:
+    """페이지의 마지막 (날짜, 위치)를 다음 페이지 요청용 커서 문자열로 변환"""
+    date, position = entry
+    return base64.urlsafe_b64encode(f'{date}|{position}'.encode('utf-8')).decode('ascii')
+
+
+def decode_round_cursor(cursor: str) -> Tuple[str, int]:
+    """커서 문자열을 (날짜, 위치)로 변환 (형식이 잘못되면 ValueError)"""
+    try:
+        date, position = base64.urlsafe_b64decode(cursor.encode('ascii')).decode('utf-8').rsplit('|', 1)
+        return date, int(position)
+    except (ValueError, UnicodeError) as e:
+        raise ValueError(f"잘못된 커서입니다: {cursor}") from e
+
+
+def parse_rounds_query(args: Mapping) -> Dict:
+    """라운드 목록 조회 조건(from, to, course, cursor, limit)을 get_player_rounds 인자로 변환
+    
+    값이 잘못되면 ValueError를 던집니다 (API의 400 응답 메시지로 사용).
+    """
+    query = {}
+    for name, key in (('from', 'date_from'), ('to', 'date_to')):
+        value = (args.get(name) or '').strip()
+        if value:
+            try:
+                datetime.strptime(value, '%Y-%m-%d')
+            except ValueError:
+                raise ValueError(f'{name} 값은 YYYY-MM-DD 형식이어야 합니다.')
+            query[key] = value
+    course_name = (args.get('course') or '').strip()
+    if course_name:
+        query['course_name'] = course_name
+    cursor = (args.get('cursor') or '').strip()
+    if cursor:
+        decode_round_cursor(cursor)
+        query['cursor'] = cursor
+    try:
+        limit = int(args.get('limit') or ROUNDS_PAGE_SIZE)
+    except ValueError:
+        raise ValueError('limit은 정수여야 합니다.')
+    if not 1 <= limit <= ROUNDS_MAX_PAGE_SIZE:
+        raise ValueError(f'limit은 1~{ROUNDS_MAX_PAGE_SIZE} 사이여야 합니다.')
+    query['limit'] = limit
+    return query
+
+
+def compute_player_statistics(player_name: str, player_rounds: List[Dict]) -> Dict:
+    """날짜순으로 정렬된 플레이어 라운드 목록으로 통계 계산 (마지막 5개가 최근 5라운드)"""
+    if not player_rounds:
+        return {"message": f"{player_name}의 라운드 기록이 없습니다."}
+    
+    total_rounds = len(player_rounds)
+    total_scores = [r['total_score'] for r in player_rounds]
+    avg_score = sum(total_scores) / total_rounds
+    best_score = min(total_scores)
+    worst_score = max(total_scores)
+    
+    # 최근 5라운드 평균
+    recent_rounds = player_rounds[-5:]
+    recent_avg = sum([r['total_score'] for r in recent_rounds]) / len(recent_rounds)
+    
+    return {
+        'player_name': player_name,
+        'total_rounds': total_rounds,
+        'average_score': round(avg_score, 1),
+        'best_score': best_score,
+        'worst_score': worst_score,
+        'recent_5_rounds_avg': round(recent_avg, 1)
+    }
+
+
+def _schema_marker() -> str:
+    """시트에 기록하는 스키마 버전 값"""
+    return f'schema_v{SCORE_SCHEMA_VERSION}'
+
 
 class GolfScoreManager:
     """골프 스코어 관리 클래스"""
     
-    def __init__(self, spreadsheet_id: str = None):
+    def __init__(self, spreadsheet_id: str = None, write_behind: bool = None,
+                 backend: StorageBackend = None):
         self.spreadsheet_id = spreadsheet_id or SPREADSHEET_ID
         self.service = None
         self.credentials = None
-        self._authenticate()
+        
+        # 저장소: 직접 지정하지 않으면 GOLF_STORAGE_BACKEND(sheets/sqlite)에 따라 생성
+        if backend is None and storage_backend_name() == 'sheets':
+            self._authenticate()
+        self.backend = backend or create_backend(self.spreadsheet_id, self.service)
+        
+        # 라운드 읽기 캐시: 같은 프로세스에서 저장에 성공하면 무효화
+        self._read_cache = VersionedReadCache(ttl=READ_CACHE_TTL, max_bytes=READ_CACHE_MAX_BYTES)
+        
+        # 메모리에 보관하는 라운드 목록과 다음에 읽을 시트 행 번호 (새 행만 이어서 읽기 위함)
+        self._rounds_lock = threading.Lock()
+        self._columnar = None
+        if COLUMNAR_STATS_ENABLED and not numpy_available():
+            print("⚠️ GOLF_COLUMNAR_STATS가 설정되었지만 numpy가 없어 누적 통계를 사용합니다 (pip install numpy).")
+        self._cache_overflow_logged = False
+        self._reset_rounds()
+        
+        # 쓰기 지연 모드: 저장할 라운드를 큐에 모아 여러 행을 한 번에 추가
+        self._write_queue = None
+        if write_behind if write_behind is not None else WRITE_BEHIND_ENABLED:
+            self._write_queue = WriteBehindQueue(
+                self._append_rows,
+                max_batch_size=WRITE_BEHIND_BATCH_SIZE,
+                flush_interval=WRITE_BEHIND_INTERVAL,
+                max_queue_size=WRITE_BEHIND_MAX_QUEUE,
+                name='score-write-behind',
+                max_attempts=WRITE_BEHIND_MAX_ATTEMPTS
+            )
+            atexit.register(self.close)
     
     def _authenticate(self):
-        """Google Sheets API 인증"""
-        creds = None
-        
-        # 환경변수에서 인증 정보 확인
-        if os.getenv('GOOGLE_CREDENTIALS_JSON'):
-            # 환경변수에서 JSON 문자열로 인증 정보 받기
-            creds_data = json.loads(os.getenv('GOOGLE_CREDENTIALS_JSON'))
-            creds = Credentials.from_authorized_user_info(creds_data, SCOPES)
-        elif os.path.exists('token.json'):
-            # 로컬 개발용: token.json 파일이 있으면 기존 인증 정보 사용
-            creds = Credentials.from_authorized_user_file('token.json', SCOPES)
-        
-        # 유효한 인증 정보가 없으면 새로 인증
-        if not creds or not creds.valid:
-            if creds and creds.expired and creds.refresh_token:
-                creds.refresh(Request())
-            else:
-                # 환경변수에서 credentials 정보 확인
-                if os.getenv('GOOGLE_CLIENT_ID') and os.getenv('GOOGLE_CLIENT_SECRET'):
-                    # 환경변수에서 OAuth 클라이언트 정보 사용
-                    client_config = {
-                        "installed": {
-                            "client_id": os.getenv('GOOGLE_CLIENT_ID'),
-                            "client_secret": os.getenv('GOOGLE_CLIENT_SECRET'),
-                            "auth_uri": "https://accounts.google.com/o/oauth2/auth",
-                            "token_uri": "https://oauth2.googleapis.com/token",
-                            "redirect_uris": ["http://localhost"]
-                        }
-                    }
-                    flow = InstalledAppFlow.from_client_config(client_config, SCOPES)
-                else:
-                    # 로컬 개발용: credentials.json 파일 사용
-                    flow = InstalledAppFlow.from_client_secrets_file(
-                        'credentials.json', SCOPES)
-                creds = flow.run_local_server(port=0)
-            
-            # 인증 정보를 token.json에 저장 (로컬 개발용)
-            if not os.getenv('GOOGLE_CREDENTIALS_JSON'):
-                with open('token.json', 'w') as token:
-                    token.write(creds.to_json())
-        
-        self.credentials = creds
-        self.service = build('sheets', 'v4', credentials=creds)
+        """Google Sheets API 인증 (프로세스 공유 인증 정보와 연결 풀, 만료 전 자동 갱신)"""
+        factory = get_client_factory()
+        self.credentials = factory.credentials
+        self.service = factory.service_pool()
+        factory.start_refresher()
     
     def create_golf_round(self, player_name: str, course_name: str, 
-                         date: str = None, holes: int = 18) -> Dict:
-        """새로운 골프 라운드 생성"""
+                         date: str = None, holes: int = 18) -> GolfRound:
+        """새로운 골프 라운드 생성 (홀별 상세 스코어는 기본 파4로 초기화)"""
         if date is None:
             date = datetime.now().strftime('%Y-%m-%d')
         
-        # 홀별 상세 스코어 초기화 (Par, Driver, Wood/Util, Iron, Putter)
-        detailed_scores = []
-        for hole in range(holes):
-            detailed_scores.append({
-                'par': 4,  # 기본 파4
-                'driver': 0,
-                'wood_util': 0,
-                'iron': 0,
-                'putter': 0,
-                'total': 4  # 기본값
-            })
-        
-        round_data = {
-            'player_name': player_name,
-            'course_name': course_name,
-            'date': date,
-            'holes': holes,
-            'scores': [0] * holes,
-            'detailed_scores': detailed_scores,
-            'total_score': 0,
-            'par_scores': [4] * holes,  # 기본 파 스코어 (실제로는 코스별로 다름)
-            'handicap': 0
-        }
-        
-        return round_data
+        return GolfRound.new(player_name, course_name, date, holes)
     
     def add_score(self, round_data: Dict, hole: int, score: int) -> Dict:
         """특정 홀의 스코어 추가"""
         if 1 <= hole <= round_data['holes']:
-            round_data['scores'][hole - 1] = score
-            round_data['total_score'] = sum(round_data['scores'])
+            if isinstance(round_data, GolfRound):
+                round_data.set_score(hole, score)
+            else:
+                round_data['scores'][hole - 1] = score
+                round_data['total_score'] = sum(round_data['scores'])
         
         return round_data
     
     def add_detailed_score(self, round_data: Dict, hole: int, par: int, driver: int, wood_util: int, iron: int, putter: int) -> Dict:
         """특정 홀의 상세 스코어 추가"""
         if 1 <= hole <= round_data['holes']:
+            if isinstance(round_data, GolfRound):
+                # 상세 스코어의 총합으로 일반 스코어와 총 스코어도 함께 갱신
+                round_data.set_hole(hole, par, driver, wood_util, iron, putter)
+                return round_data
+            
             total = driver + wood_util + iron + putter
             round_data['detailed_scores'][hole - 1] = {
                 'par': par,
@@ -141,170 +247,337 @@ class GolfScoreManager:
         return handicap
     
     def save_to_sheets(self, round_data: Dict):
-        """라운드 데이터를 Google Sheets에 저장"""
+        """라운드 데이터를 Google Sheets에 저장 (쓰기 지연 모드에서는 큐에 추가)"""
+        values = self._round_to_row(round_data)
+        
+        if self._write_queue and self._write_queue.put(values, timeout=WRITE_BEHIND_ENQUEUE_TIMEOUT):
+            return
+        
         try:
-            # 헤더 행이 있는지 확인하고 없으면 추가
-            self._ensure_headers()
-            
-            # 데이터 행 준비
-            values = [
-                round_data['date'],
-                round_data['player_name'],
-                round_data['course_name'],
-                round_data['total_score'],
-                round_data['handicap']
-            ]
-            
-            # 홀별 상세 스코어 추가
-            for detailed_score in round_data['detailed_scores']:
-                values.extend([
-                    detailed_score['par'],
-                    detailed_score['driver'],
-                    detailed_score['wood_util'],
-                    detailed_score['iron'],
-                    detailed_score['putter'],
-                    detailed_score['total']
-                ])
-            
-            # 데이터 추가
-            body = {'values': [values]}
-            result = self.service.spreadsheets().values().append(
-                spreadsheetId=self.spreadsheet_id,
-                range=SCORE_RANGE_NAME,
-                valueInputOption='USER_ENTERED',
-                body=body
-            ).execute()
-            
-            print(f"데이터가 성공적으로 저장되었습니다. {result.get('updates', {}).get('updatedRows', 0)}행이 추가되었습니다.")
-            
-        except HttpError as error:
+            self._append_rows([values])
+        except StorageError as error:
+            # 재시도 뒤에도 실패하면 호출자에게 알림 (라운드를 조용히 버리지 않음)
             print(f"Google Sheets API 오류: {error}")
+            raise
+    
+    def save_rounds(self, rounds: List[Dict]) -> Optional[int]:
+        """여러 라운드를 append 한 번으로 바로 저장하고 첫 행 번호 반환 (일괄 가져오기용, 오류는 호출자에게 전달)"""
+        return self._append_rows([self._round_to_row(round_data) for round_data in rounds])
+    
+    def _round_to_row(self, round_data: Dict) -> List:
+        """라운드 데이터를 시트 한 행으로 변환"""
+        if isinstance(round_data, GolfRound):
+            return round_data.to_row()
+        
+        values = [
+            round_data['date'],
+            round_data['player_name'],
+            round_data['course_name'],
+            round_data['total_score'],
+            round_data['handicap']
+        ]
+        
+        # 홀별 상세 스코어 추가
+        for detailed_score in round_data['detailed_scores']:
+            values.extend([
+                detailed_score['par'],
+                detailed_score['driver'],
+                detailed_score['wood_util'],
+                detailed_score['iron'],
+                detailed_score['putter'],
+                detailed_score['total']
+            ])
+        
+        return values
+    
+    def _append_rows(self, rows: List[List]) -> Optional[int]:
+        """여러 행을 한 번의 append 요청으로 추가하고 첫 행 번호 반환 (오류는 호출자에게 전달)"""
+        # 헤더 행이 있는지 확인하고 없으면 추가
+        self._ensure_headers()
+        
+        first_row = self.backend.append(SCORE_RANGE_NAME, rows)
+        self._read_cache.invalidate(SCORE_RANGE_NAME)
+        self._merge_saved_rows(first_row, rows)
+        
+        print(f"데이터가 성공적으로 저장되었습니다. {len(rows)}행이 추가되었습니다.")
+        return first_row
+    
+    def flush(self) -> int:
+        """쓰기 지연 큐에 쌓인 라운드를 즉시 저장하고 저장한 라운드 수 반환"""
+        if not self._write_queue:
+            return 0
+        return self._write_queue.flush()
+    
+    def close(self):
+        """쓰기 지연 큐를 비우고 백그라운드 스레드 종료"""
+        if self._write_queue:
+            self._write_queue.close()
+    
+    def get_read_cache_stats(self) -> Dict:
+        """라운드 읽기 캐시 지표 (적중/실패 횟수, 캐시 크기)"""
+        return self._read_cache.stats()
+    
+    def get_write_queue_stats(self) -> Optional[Dict]:
+        """쓰기 지연 큐 지표 (큐 깊이, 플러시 지연 시간 등), 비활성화 시 None"""
+        if not self._write_queue:
+            return None
+        return self._write_queue.stats()
     
     def _ensure_headers(self):
-        """스프레드시트에 헤더가 있는지 확인하고 없으면 추가"""
-        try:
-            # Score 시트의 첫 번째 행 읽기
-            result = self.service.spreadsheets().values().get(
-                spreadsheetId=self.spreadsheet_id,
-                range='Score!A1:DI1'
-            ).execute()
-            
-            values = result.get('values', [])
-            
-            # 헤더가 없으면 추가
-            if not values or not values[0]:
-                headers = [
-                    '날짜', '플레이어', '코스', '총 스코어', '핸디캡'
-                ]
-                # 홀별 상세 스코어 헤더 추가
-                for i in range(18):
-                    hole_num = i + 1
-                    headers.extend([
-                        f'홀{hole_num}_Par', f'홀{hole_num}_Driver', f'홀{hole_num}_Wood/Util', 
-                        f'홀{hole_num}_Iron', f'홀{hole_num}_Putter', f'홀{hole_num}_Total'
-                    ])
-                
-                # 헤더 행의 범위를 정확히 계산 (총 113개 컬럼: 5 + 18*6)
-                range_name = 'Score!A1:DI1'  # 113개 컬럼 (A=1, DI=113)
+        """스프레드시트 헤더와 스키마 버전 확인 (프로세스당 한 번, 없거나 오래되었으면 추가/갱신)"""
+        schema_key = (self.backend.name, self.spreadsheet_id)
+        if schema_key in _verified_schemas:
+            return
+        
+        with _schema_lock:
+            if schema_key in _verified_schemas:
+                return
+            try:
+                # Score 시트의 첫 번째 행 전체 읽기 (열 범위를 지정하지 않아 시트 격자 크기와 무관)
+                values = self.backend.get('Score!1:1')
+                header = values[0] if values else []
                 
-                body = {'values': [headers]}
-                self.service.spreadsheets().values().update(
-                    spreadsheetId=self.spreadsheet_id,
-                    range=range_name,
-                    valueInputOption='USER_ENTERED',
-                    body=body
-                ).execute()
-                print(f"Score 시트에 헤더가 추가되었습니다. 범위: {range_name}")
+                if len(header) <= SCORE_HEADER_LENGTH or header[SCORE_HEADER_LENGTH] != _schema_marker():
+                    self._write_schema(rewrite_header=not header)
+                _verified_schemas.add(schema_key)
                 
-        except HttpError as error:
-            print(f"헤더 확인 중 오류: {error}")
+            except StorageError as error:
+                print(f"헤더 확인 중 오류: {error}")
+    
+    def migrate_schema(self):
+        """헤더를 현재 스키마로 다시 쓰고 스키마 버전 기록 (스키마를 바꿨을 때 명시적으로 실행)"""
+        with _schema_lock:
+            self._write_schema(rewrite_header=True)
+            _verified_schemas.add((self.backend.name, self.spreadsheet_id))
+    
+    def _write_schema(self, rewrite_header: bool):
+        """스키마 버전 셀을 기록하고 필요하면 헤더 행도 함께 씀"""
+        if rewrite_header:
+            # 헤더 행의 범위를 정확히 계산 (총 113개 컬럼: 5 + 18*6) + 스키마 버전 1개
+            range_name = f'Score!A1:{SCORE_SCHEMA_COLUMN}1'  # A=1, DI=113, DJ=114
+            self.backend.update(range_name, [_score_headers() + [_schema_marker()]])
+            print(f"Score 시트에 헤더가 추가되었습니다. 범위: {range_name}")
+        else:
+            # 기존 헤더는 그대로 두고 스키마 버전만 기록
+            self.backend.update(f'Score!{SCORE_SCHEMA_COLUMN}1', [[_schema_marker()]])
+            print(f"Score 시트 스키마 버전을 기록했습니다: {_schema_marker()}")
     
     def load_from_sheets(self) -> List[Dict]:
-        """Google Sheets에서 모든 라운드 데이터 로드"""
-        try:
-            result = self.service.spreadsheets().values().get(
-                spreadsheetId=self.spreadsheet_id,
-                range=SCORE_RANGE_NAME
-            ).execute()
-            
-            values = result.get('values', [])
-            
-            if not values:
-                return []
-            
-            # 헤더 제거
-            headers = values[0]
-            data_rows = values[1:]
-            
-            rounds = []
-            for row in data_rows:
-                if len(row) >= 5:  # 최소 필수 데이터 확인
-                    # 상세 스코어 파싱 (5개 기본 + 18홀 * 6개 항목 = 113개)
-                    detailed_scores = []
-                    scores = []
-                    
-                    for i in range(18):
-                        start_idx = 5 + (i * 6)
-                        if start_idx + 5 < len(row):
-                            detailed_score = {
-                                'par': int(row[start_idx]) if row[start_idx].isdigit() else 4,
-                                'driver': int(row[start_idx + 1]) if row[start_idx + 1].isdigit() else 0,
-                                'wood_util': int(row[start_idx + 2]) if row[start_idx + 2].isdigit() else 0,
-                                'iron': int(row[start_idx + 3]) if row[start_idx + 3].isdigit() else 0,
-                                'putter': int(row[start_idx + 4]) if row[start_idx + 4].isdigit() else 0,
-                                'total': int(row[start_idx + 5]) if row[start_idx + 5].isdigit() else 0
-                            }
-                            detailed_scores.append(detailed_score)
-                            scores.append(detailed_score['total'])
-                        else:
-                            detailed_scores.append({
-                                'par': 4, 'driver': 0, 'wood_util': 0, 'iron': 0, 'putter': 0, 'total': 0
-                            })
-                            scores.append(0)
-                    
-                    round_data = {
-                        'date': row[0],
-                        'player_name': row[1],
-                        'course_name': row[2],
-                        'total_score': int(row[3]) if row[3].isdigit() else 0,
-                        'handicap': int(row[4]) if row[4].isdigit() else 0,
-                        'scores': scores,
-                        'detailed_scores': detailed_scores
-                    }
-                    rounds.append(round_data)
-            
-            return rounds
+        """Google Sheets에서 모든 라운드 데이터 로드
+        
+        TTL 안에서는 캐시를 사용하고, 그 뒤에는 이미 읽은 행 이후의 새 행만 읽어
+        메모리의 라운드 목록에 이어 붙입니다. 시트를 직접 수정한 경우를 반영하기 위해
+        FULL_RESYNC_INTERVAL마다 전체를 다시 읽습니다.
+        """
+        return list(self._refresh_rounds())
+    
+    def preload(self) -> int:
+        """라운드 목록과 캐시를 미리 채우고 라운드 수 반환 (시작 전 점검용, 저장소 오류는 그대로 던짐)"""
+        return len(self._refresh_rounds(strict=True))
+    
+    def iter_rounds(self) -> Iterator[GolfRound]:
+        """시트의 라운드를 페이지 단위로 읽으며 하나씩 반환 (내보내기용)
+        
+        메모리 목록과 캐시를 거치지 않으므로 시트 크기와 관계없이 페이지 몇 개 분량의
+        메모리만 사용합니다. 쓰기 지연 큐에 남은 라운드는 먼저 저장합니다.
+        """
+        self.flush()
+        rows = self.backend.iter_rows('Score', SCORE_LAST_COLUMN, start_row=2, unformatted=True)
+        for _, row in rows:
+            round_data = parse_score_row(row)
+            if round_data is not None:
+                yield round_data
+    
+    def _refresh_rounds(self, strict: bool = False) -> List[GolfRound]:
+        """캐시가 유효하면 그대로, 아니면 시트와 동기화한 라운드 목록 (복사하지 않으므로 수정 금지)
+        
+        저장소 오류가 나면 가진 목록을 반환하며, strict이면 오류를 그대로 던집니다.
+        """
+        cached = self._read_cache.get(SCORE_RANGE_NAME)
+        if cached is not None:
+            return cached
+        
+        cache_version = self._read_cache.begin_load()
+        with self._rounds_lock:
+            # 이미 읽은 라운드가 있으면 갱신은 할당량이 남을 때만 하고, 부족하면 가진 목록을 그대로 반환
+            priority = PRIORITY_READ if self._last_full_sync is None else PRIORITY_REFRESH
+            try:
+                with request_priority(priority):
+                    self._sync_rounds()
+            except QuotaExhausted:
+                if strict:
+                    raise
+                return self._rounds
+            except StorageError as error:
+                print(f"데이터 로드 중 오류: {error}")
+                if strict:
+                    raise
+                return self._rounds
             
-        except HttpError as error:
-            print(f"데이터 로드 중 오류: {error}")
-            return []
+            # 크기 한도를 넘으면 캐시에만 넣지 않음: 라운드 목록과 색인/누적 통계는 그대로 두고
+            # 다음 요청은 TTL 없이 새 행만 이어 읽음 (전체 다시 읽기는 재동기화 주기에만)
+            if (not self._read_cache.put(SCORE_RANGE_NAME, self._rounds, self._rounds_bytes, cache_version)
+                    and self._rounds_bytes > READ_CACHE_MAX_BYTES and not self._cache_overflow_logged):
+                self._cache_overflow_logged = True
+                print(f"라운드 {len(self._rounds):,}개({self._rounds_bytes:,}바이트)가 읽기 캐시 한도 "
+                      f"GOLF_READ_CACHE_MAX_BYTES({READ_CACHE_MAX_BYTES:,})를 넘어 요청마다 새 행을 확인합니다.")
+            return self._rounds
+    
+    def _sync_rounds(self):
+        """새로 추가된 행만 읽어 병합 (처음이거나 재동기화 주기가 지났으면 전체 읽기)"""
+        full_sync = (self._last_full_sync is None or
+                     time.monotonic() - self._last_full_sync > FULL_RESYNC_INTERVAL)
+        if full_sync:
+            rounds_bytes = 0
+            next_row = 2  # 헤더 다음 행
+        else:
+            rounds_bytes = self._rounds_bytes
+            next_row = self._next_row
+        
+        # 페이지 단위로 받은 행을 바로 파싱 (중간의 빈 행도 포함되므로 마지막 행 번호로 다음 위치 결정)
+        # 숫자 셀은 서식 없는 값(int)으로 받아 문자열 변환/검사를 건너뜀
+        new_rounds = []
+        parse_seconds = 0.0  # 저장소 호출 시간과 구분하기 위해 파싱 시간만 따로 누적
+        rows = self.backend.iter_rows('Score', SCORE_LAST_COLUMN, start_row=next_row, unformatted=True)
+        for row_number, row in rows:
+            started = time.perf_counter()
+            next_row = row_number + 1
+            round_data = parse_score_row(row)
+            if round_data is not None:
+                rounds_bytes += round_data.nbytes()
+                new_rounds.append(round_data)
+            parse_seconds += time.perf_counter() - started
+        observe_phase('parse_score_rows', parse_seconds)
+        
+        # 읽기가 끝까지 성공한 뒤에만 반영 (중간에 실패하면 다음 로드에서 같은 위치부터 다시 읽음)
+        self._rounds_bytes = rounds_bytes
+        self._next_row = next_row
+        self._apply_rounds(new_rounds, full_sync)
+        if full_sync:
+            self._last_full_sync = time.monotonic()
+    
+    def _apply_rounds(self, new_rounds: List[GolfRound], full_sync: bool):
+        """새 라운드를 메모리 목록과 색인/열 지향 저장소에 반영 (전체 읽기면 교체)"""
+        if full_sync:
+            self._rounds = new_rounds
+            self._player_index = PlayerRoundIndex.from_rounds(new_rounds)
+            self._player_stats = PlayerStatsStore.from_rounds(new_rounds)
+            if self._columnar is not None:
+                self._columnar = ColumnarRoundStore.from_rounds(new_rounds)
+            return
+        
+        self._player_index.extend(new_rounds, len(self._rounds))
+        self._player_stats.extend(new_rounds, len(self._rounds))
+        self._rounds.extend(new_rounds)
+        if self._columnar is not None:
+            self._columnar.extend(new_rounds)
+    
+    def _merge_saved_rows(self, first_row: Optional[int], rows: List[List]):
+        """저장한 행이 메모리 목록 바로 뒤에 추가됐으면 다시 읽지 않고 목록과 색인에 반영"""
+        with self._rounds_lock:
+            if first_row is None or self._last_full_sync is None or first_row != self._next_row:
+                return  # 위치를 알 수 없거나 사이에 다른 행이 있으면 다음 로드에서 읽음
+            new_rounds = [round_data for round_data in map(parse_score_row, rows) if round_data is not None]
+            self._rounds_bytes += sum(round_data.nbytes() for round_data in new_rounds)
+            self._next_row = first_row + len(rows)
+            self._apply_rounds(new_rounds, full_sync=False)
+    
+    def _reset_rounds(self):
+        """메모리의 라운드 목록 초기화 (다음 로드는 전체 읽기)"""
+        self._rounds = []
+        self._rounds_bytes = 0
+        self._player_index = PlayerRoundIndex()
+        self._player_stats = PlayerStatsStore()
+        if COLUMNAR_STATS_ENABLED and numpy_available():
+            self._columnar = ColumnarRoundStore()
+        self._next_row = 2
+        self._last_full_sync = None
     
     def get_player_statistics(self, player_name: str) -> Dict:
-        """특정 플레이어의 통계 계산"""
-        rounds = self.load_from_sheets()
-        player_rounds = [r for r in rounds if r['player_name'] == player_name]
-        
-        if not player_rounds:
-            return {"message": f"{player_name}의 라운드 기록이 없습니다."}
-        
-        total_rounds = len(player_rounds)
-        total_scores = [r['total_score'] for r in player_rounds]
-        avg_score = sum(total_scores) / total_rounds
-        best_score = min(total_scores)
-        worst_score = max(total_scores)
-        
-        # 최근 5라운드 평균
-        recent_rounds = player_rounds[-5:]
-        recent_avg = sum([r['total_score'] for r in recent_rounds]) / len(recent_rounds)
-        
-        return {
-            'player_name': player_name,
-            'total_rounds': total_rounds,
-            'average_score': round(avg_score, 1),
-            'best_score': best_score,
-            'worst_score': worst_score,
-            'recent_5_rounds_avg': round(recent_avg, 1)
-        }
+        """특정 플레이어의 통계
+        
+        기본은 라운드를 반영할 때 갱신한 누적 통계를 그대로 반환하고,
+        GOLF_COLUMNAR_STATS=1이면 열 지향 저장소에서 플레이어 색인의 위치로 계산합니다.
+        """
+        rounds = self._refresh_rounds()
+        with self._rounds_lock:
+            if len(self._rounds) >= len(rounds):
+                if self._columnar is not None:
+                    return self._columnar.player_statistics(
+                        player_name, self._player_index.positions(player_name))
+                return self._player_stats.statistics(player_name)
+        
+        # 다른 요청의 전체 재동기화로 목록이 줄어든 사이에 받은 이전 목록이면 직접 필터링 (드문 경우)
+        player_rounds = sorted((r for r in rounds if r['player_name'] == player_name),
+                               key=lambda r: str(r['date']))
+        return compute_player_statistics(player_name, player_rounds)
+    
+    def get_player_rounds(self, player_name: str, date_from: str = None, date_to: str = None,
+                          course_name: str = None, cursor: str = None,
+                          limit: int = ROUNDS_PAGE_SIZE) -> Dict:
+        """플레이어 라운드를 최신순으로 한 페이지 조회
+        
+        date_from~date_to(YYYY-MM-DD, 양 끝 포함)와 코스로 거르고, 최대 limit개와
+        다음 페이지의 커서(next_cursor, 마지막 페이지면 None)를 반환합니다.
+        플레이어 색인에서 날짜 범위를 이분 탐색하므로 다른 플레이어의 라운드는 보지 않습니다.
+        커서는 (날짜, 목록 위치) 기준이라 전체 재동기화로 목록이 바뀌면 경계가 조금 달라질 수 있습니다.
+        """
+        limit = max(1, min(limit, ROUNDS_MAX_PAGE_SIZE))
+        before = decode_round_cursor(cursor) if cursor else None
+        rounds = self._refresh_rounds()
+        
+        with self._rounds_lock:
+            if len(self._rounds) >= len(rounds):
+                rounds = self._rounds
+                entries = self._player_index.select(player_name, date_from, date_to, before)
+                return self._rounds_page(rounds, entries, course_name, limit)
+        
+        # 다른 요청의 전체 재동기화로 목록이 줄어든 사이에 받은 이전 목록이면 정렬된 항목을 직접 만듦 (드문 경우)
+        player_entries = sorted((str(r['date']), position) for position, r in enumerate(rounds)
+                                if r['player_name'] == player_name)
+        entries = select_entries(player_entries, date_from, date_to, before)
+        return self._rounds_page(rounds, entries, course_name, limit)
+    
+    def _rounds_page(self, rounds: List[GolfRound], entries: Iterator[Tuple[str, int]],
+                     course_name: Optional[str], limit: int) -> Dict:
+        """최신순 항목에서 코스 조건에 맞는 라운드를 limit개까지 모으고 다음 커서 계산"""
+        page = []
+        last_entry = None
+        for entry in entries:
+            round_data = rounds[entry[1]]
+            if course_name and round_data['course_name'] != course_name:
+                continue
+            if len(page) == limit:
+                # 한 개 더 있으면 다음 페이지가 있음
+                return {'rounds': page, 'next_cursor': encode_round_cursor(last_entry)}
+            page.append(round_data)
+            last_entry = entry
+        return {'rounds': page, 'next_cursor': None}
+    
+    def rebuild_player_statistics(self) -> Dict:
+        """누적 통계를 라운드 데이터에서 다시 만들고, 기존 누적값과 다른 플레이어를 보고
+        
+        플레이어 색인으로 모은 라운드에 compute_player_statistics를 적용한 결과, 그리고
+        처음부터 다시 쌓은 누적값(반올림 전)과 비교하므로 누적 갱신 로직의 일관성 검사로
+        사용할 수 있습니다.
+        """
+        self._refresh_rounds()
+        with self._rounds_lock:
+            rebuilt = PlayerStatsStore.from_rounds(self._rounds)
+            players = set(rebuilt.players()) | set(self._player_stats.players())
+            mismatches = []
+            for player_name in sorted(players):
+                expected = compute_player_statistics(
+                    player_name, [self._rounds[p] for p in self._player_index.positions(player_name)])
+                if (self._player_stats.statistics(player_name) != expected or
+                        self._player_stats.state(player_name) != rebuilt.state(player_name)):
+                    mismatches.append(player_name)
+            self._player_stats = rebuilt
+            return {
+                'rounds': len(self._rounds),
+                'players': len(self._player_stats),
+                'mismatched_players': mismatches
+            }
     
     def display_round_summary(self, round_data: Dict):
         """라운드 요약 정보 출력"""
@@ -317,13 +590,39 @@ class GolfScoreManager:
         print(f"홀별 스코어: {round_data['scores']}")
 
 
+def rebuild_statistics(spreadsheet_id: str = None):
+    """플레이어 누적 통계를 다시 계산하고 일관성 검사 결과 출력"""
+    manager = GolfScoreManager(spreadsheet_id)
+    try:
+        result = manager.rebuild_player_statistics()
+    finally:
+        manager.close()
+    
+    print(f"라운드 {result['rounds']}개, 플레이어 {result['players']}명의 통계를 다시 계산했습니다.")
+    if result['mismatched_players']:
+        print(f"누적 통계가 달랐던 플레이어: {', '.join(result['mismatched_players'])}")
+    else:
+        print("누적 통계가 모두 일치합니다.")
+    return result
+
+
 def main():
     """메인 함수 - 사용자 인터페이스"""
+    parser = argparse.ArgumentParser(description='골프 스코어 관리 프로그램')
+    parser.add_argument('--rebuild-stats', action='store_true',
+                        help='플레이어 누적 통계를 다시 계산하고 일관성 검사 후 종료')
+    parser.add_argument('--spreadsheet-id', help='스프레드시트 ID (기본값: GOOGLE_SPREADSHEET_ID)')
+    args = parser.parse_args()
+    
+    if args.rebuild_stats:
+        rebuild_statistics(args.spreadsheet_id)
+        return
+    
     print("=== 골프 스코어 관리 프로그램 ===")
     print("Google Sheets와 연동하여 스코어를 관리합니다.")
     
     # 스프레드시트 ID 입력
-    spreadsheet_id = input("Google Sheets 스프레드시트 ID를 입력하세요: ").strip()
+    spreadsheet_id = args.spreadsheet_id or input("Google Sheets 스프레드시트 ID를 입력하세요: ").strip()
     if not spreadsheet_id:
         print("스프레드시트 ID가 필요합니다.")
         return
@@ -369,8 +668,11 @@ def main():
             # Google Sheets에 저장
             save_choice = input("\nGoogle Sheets에 저장하시겠습니까? (y/n): ").strip().lower()
             if save_choice == 'y':
-                manager.save_to_sheets(round_data)
-                print("저장이 완료되었습니다!")
+                try:
+                    manager.save_to_sheets(round_data)
+                    print("저장이 완료되었습니다!")
+                except StorageError:
+                    print("저장에 실패했습니다. 잠시 후 다시 시도하세요.")
         
         elif choice == '2':
             # 라운드 기록 조회
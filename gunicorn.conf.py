@@ -0,0 +1,22 @@
+"""
+gunicorn 설정 - 워커가 요청을 받기 전에 Manager 초기화와 캐시 로드를 끝냄
+gunicorn settings: warm each worker before it accepts requests
+"""
+
+import threading
+
+
+def post_worker_init(worker):
+    """워커 프로세스마다 초기화 (백그라운드 스레드는 fork 뒤에 만들어야 하므로 preload 대신 사용)
+
+    이 함수가 끝나기 전에는 워커가 마스터에 살아 있다고 알리지 못하므로, 큰 시트를 읽느라
+    timeout(기본 30초)을 넘기면 워커가 종료됩니다. timeout의 절반까지만 기다리고
+    남은 캐시 로드는 백그라운드에서 계속합니다 (그 사이 요청은 로드가 끝날 때까지 대기).
+    """
+    from app import warmup
+
+    thread = threading.Thread(target=warmup, name='warmup', daemon=True)
+    thread.start()
+    thread.join(max(1.0, worker.cfg.timeout / 2) if worker.cfg.timeout else None)
+    if thread.is_alive():
+        worker.log.warning("워커 준비가 %.0f초 안에 끝나지 않아 백그라운드에서 계속합니다.", worker.cfg.timeout / 2)
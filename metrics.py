@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+요청/저장소 호출 지표 수집과 Prometheus 텍스트 형식 출력
+Request and storage-call metrics in Prometheus text format
+
+지표는 프로세스마다 따로 모입니다 (gunicorn 워커가 여러 개면 워커별 값).
+"""
+
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, List, Sequence, Tuple
+
+# 히스토그램 구간 상한 (초)
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# 수집기가 반환하는 지표 묶음: (이름, 종류, 설명, [(레이블, 값), ...])
+MetricFamily = Tuple[str, str, str, List[Tuple[Dict[str, str], float]]]
+
+
+def _escape(value: str) -> str:
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = '') -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+def _format_value(value: float) -> str:
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    """레이블 조합별로 증가만 하는 값"""
+
+    kind = 'counter'
+
+    def __init__(self, name: str, help_text: str, label_names: Sequence[str] = ()):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = tuple(label_names)
+        self._values = {}  # 레이블 값 튜플 -> 누적 값
+        self._lock = threading.Lock()
+
+    def inc(self, *label_values: str, amount: float = 1):
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0) + amount
+
+    def value(self, *label_values: str) -> float:
+        with self._lock:
+            return self._values.get(label_values, 0)
+
+    def render(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [f'{self.name}{_format_labels(self.label_names, labels)} {_format_value(value)}'
+                for labels, value in items]
+
+
+class Histogram:
+    """레이블 조합별 관측값 분포 (구간별 개수, 합계, 개수)"""
+
+    kind = 'histogram'
+
+    def __init__(self, name: str, help_text: str, label_names: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = tuple(label_names)
+        self.buckets = tuple(sorted(buckets))
+        self._series = {}  # 레이블 값 튜플 -> [구간별 개수(+Inf 포함), 합계, 개수]
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *label_values: str):
+        index = bisect_left(self.buckets, value)  # value <= 상한인 첫 구간
+        with self._lock:
+            series = self._series.get(label_values)
+            if series is None:
+                series = self._series[label_values] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+    def count(self, *label_values: str) -> int:
+        with self._lock:
+            series = self._series.get(label_values)
+            return series[2] if series else 0
+
+    def render(self) -> List[str]:
+        with self._lock:
+            items = sorted((labels, (list(series[0]), series[1], series[2]))
+                           for labels, series in self._series.items())
+        lines = []
+        for labels, (bucket_counts, total, count) in items:
+            cumulative = 0
+            for upper, bucket_count in zip(self.buckets + (float('inf'),), bucket_counts):
+                cumulative += bucket_count
+                le = f'le="{_format_value(upper)}"'
+                lines.append(f'{self.name}_bucket{_format_labels(self.label_names, labels, le)} {cumulative}')
+            label_text = _format_labels(self.label_names, labels)
+            lines.append(f'{self.name}_sum{label_text} {_format_value(total)}')
+            lines.append(f'{self.name}_count{label_text} {count}')
+        return lines
+
+
+class MetricsRegistry:
+    """지표 목록과 출력 시점에 값을 읽어 오는 수집기 목록"""
+
+    def __init__(self):
+        self._metrics = []
+        self._collectors = []
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, help_text: str, label_names: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, help_text, label_names))
+
+    def histogram(self, name: str, help_text: str, label_names: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, help_text, label_names, buckets))
+
+    def register_collector(self, collector: Callable[[], Iterable[MetricFamily]]):
+        """출력할 때마다 호출되어 지표 묶음을 반환하는 함수 등록 (캐시 통계 등)"""
+        with self._lock:
+            self._collectors.append(collector)
+
+    def render(self) -> str:
+        """Prometheus 텍스트 형식 (text/plain; version=0.0.4)"""
+        with self._lock:
+            metrics = list(self._metrics)
+            collectors = list(self._collectors)
+        lines = []
+        for metric in metrics:
+            lines.append(f'# HELP {metric.name} {metric.help_text}')
+            lines.append(f'# TYPE {metric.name} {metric.kind}')
+            lines.extend(metric.render())
+        for collector in collectors:
+            try:
+                families = list(collector())
+            except Exception as e:
+                print(f"⚠️ 지표 수집 오류: {e}")
+                continue
+            for name, kind, help_text, samples in families:
+                lines.append(f'# HELP {name} {help_text}')
+                lines.append(f'# TYPE {name} {kind}')
+                for labels, value in samples:
+                    lines.append(f'{name}{_format_labels(list(labels), list(labels.values()))} '
+                                 f'{_format_value(value)}')
+        return '\n'.join(lines) + '\n'
+
+    def _register(self, metric):
+        with self._lock:
+            self._metrics.append(metric)
+        return metric
+
+
+REGISTRY = MetricsRegistry()
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+HTTP_REQUESTS = REGISTRY.counter(
+    'golf_http_requests_total', 'HTTP 요청 수', ('method', 'route', 'status'))
+HTTP_REQUEST_DURATION = REGISTRY.histogram(
+    'golf_http_request_duration_seconds', 'HTTP 요청 처리 시간 (초)', ('method', 'route'))
+SHEETS_REQUESTS = REGISTRY.counter(
+    'golf_sheets_requests_total', 'Sheets API 호출 수 (status: HTTP 상태 코드 또는 error)', ('method', 'status'))
+SHEETS_REQUEST_DURATION = REGISTRY.histogram(
+    'golf_sheets_request_duration_seconds', 'Sheets API 호출 시간 (초)', ('method',))
+SHEETS_BYTES = REGISTRY.counter(
+    'golf_sheets_bytes_total', 'Sheets API 요청/응답 본문 크기 (바이트)', ('method', 'direction'))
+SHEETS_RETRIES = REGISTRY.counter(
+    'golf_sheets_retries_total', '429/5xx 응답 뒤 Sheets API 재시도 수', ('method', 'status'))
+SHEETS_QUOTA_WAIT = REGISTRY.histogram(
+    'golf_sheets_quota_wait_seconds', 'Sheets 할당량(토큰)을 기다린 시간 (초)', ('priority',))
+SHEETS_QUOTA_REJECTED = REGISTRY.counter(
+    'golf_sheets_quota_rejected_total', '할당량이 부족해 보내지 않은 Sheets 요청 수', ('priority',))
+EXPORT_ERRORS = REGISTRY.counter(
+    'golf_export_errors_total', '응답을 보내는 도중 중단된 라운드 내보내기 수', ('format',))
+PHASE_DURATION = REGISTRY.histogram(
+    'golf_phase_duration_seconds', '요청 처리 단계별 시간 (초, 행 파싱/JSON 인코딩 등)', ('phase',))
+
+
+def observe_http_request(method: str, route: str, status: int, seconds: float):
+    """라우트 하나의 처리 결과 기록 (route는 /api/rounds 같은 URL 규칙)"""
+    HTTP_REQUESTS.inc(method, route, str(status))
+    HTTP_REQUEST_DURATION.observe(seconds, method, route)
+
+
+def observe_sheets_call(method: str, seconds: float, status: str, sent: int = 0, received: int = 0):
+    """Sheets API 호출 하나의 결과 기록 (method는 values.get 같은 API 메서드 이름)"""
+    SHEETS_REQUESTS.inc(method, status)
+    SHEETS_REQUEST_DURATION.observe(seconds, method)
+    if sent:
+        SHEETS_BYTES.inc(method, 'sent', amount=sent)
+    if received:
+        SHEETS_BYTES.inc(method, 'received', amount=received)
+
+
+def observe_sheets_retry(method: str, status: str):
+    SHEETS_RETRIES.inc(method, status)
+
+
+def observe_quota_wait(priority: str, seconds: float, acquired: bool):
+    """할당량 대기 시간 기록 (할당량을 얻지 못했으면 거부 수도 증가)"""
+    SHEETS_QUOTA_WAIT.observe(seconds, priority)
+    if not acquired:
+        SHEETS_QUOTA_REJECTED.inc(priority)
+
+
+def observe_export_error(fmt: str):
+    EXPORT_ERRORS.inc(fmt)
+
+
+def observe_phase(phase: str, seconds: float):
+    PHASE_DURATION.observe(seconds, phase)
+
+
+@contextmanager
+def timed_phase(phase: str):
+    """with 블록의 실행 시간을 단계 히스토그램에 기록"""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        PHASE_DURATION.observe(time.perf_counter() - started, phase)
+
+
+def stats_families(prefix: str, stats: Dict, counters: Sequence[str], gauges: Sequence[str],
+                   labels: Dict[str, str] = None) -> List[MetricFamily]:
+    """get_read_cache_stats() 같은 통계 딕셔너리를 지표 묶음으로 변환 (숫자 항목만)"""
+    labels = labels or {}
+    families = []
+    for key in counters:
+        if isinstance(stats.get(key), (int, float)):
+            families.append((f'{prefix}_{key}_total', 'counter', f'{prefix} {key}', [(labels, stats[key])]))
+    for key in gauges:
+        if isinstance(stats.get(key), (int, float)):
+            families.append((f'{prefix}_{key}', 'gauge', f'{prefix} {key}', [(labels, stats[key])]))
+    return families
+
+
+def golf_manager_families(golf_manager) -> List[MetricFamily]:
+    """GolfScoreManager의 읽기 캐시/쓰기 큐 통계를 지표 묶음으로 변환"""
+    families = stats_families('golf_read_cache', golf_manager.get_read_cache_stats(),
+                              counters=('hits', 'misses', 'evictions', 'invalidations'),
+                              gauges=('entries', 'bytes', 'max_bytes'))
+    write_queue_stats = golf_manager.get_write_queue_stats()
+    if write_queue_stats is not None:
+        families += stats_families('golf_write_queue', write_queue_stats,
+                                   counters=('enqueued', 'flushed_items', 'flush_count', 'failed_flushes', 'dead_lettered'),
+                                   gauges=('queue_depth', 'queue_capacity'))
+    return families
+
+
+def render_metrics() -> str:
+    return REGISTRY.render()
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+비밀번호 해시 모듈 (PBKDF2, 워커 풀 실행)
+Password hashing with a PBKDF2 worker pool
+"""
+
+import hashlib
+import hmac
+import multiprocessing
+import os
+import secrets
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Iterable, List, Optional, Tuple
+
+# 비밀번호 해시 설정
+HASH_ALGORITHM = 'pbkdf2_sha256'
+LEGACY_ITERATIONS = 100000  # 'salt:hash' 형식(반복 횟수 미기록)으로 저장된 기존 해시의 반복 횟수
+DEFAULT_ITERATIONS = int(os.getenv('GOLF_PASSWORD_HASH_ITERATIONS', str(LEGACY_ITERATIONS)))
+DEFAULT_EXECUTOR = os.getenv('GOLF_PASSWORD_HASH_EXECUTOR', 'process')  # process | thread | inline
+DEFAULT_WORKERS = int(os.getenv('GOLF_PASSWORD_HASH_WORKERS', '0')) or (os.cpu_count() or 1)
+
+
+def _process_context():
+    """워커 프로세스 시작 방식 (fork는 백그라운드 스레드가 잡고 있던 잠금까지 복사해 자식이 멈출 수 있음)"""
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
+
+
+def pbkdf2_hex(password: str, salt: str, iterations: int) -> str:
+    """PBKDF2-HMAC-SHA256 해시 (워커 프로세스에서 실행되도록 모듈 수준 함수로 둠)"""
+    return hashlib.pbkdf2_hmac('sha256', password.encode('utf-8'), salt.encode('utf-8'), iterations).hex()
+
+
+def parse_password_hash(password_hash: str) -> Tuple[int, str, str]:
+    """저장된 해시를 (반복 횟수, salt, 해시값)으로 분리
+
+    새 형식: 'pbkdf2_sha256$<반복 횟수>$<salt>$<해시값>'
+    기존 형식: '<salt>:<해시값>' (반복 횟수 100,000)
+    """
+    if password_hash.startswith(HASH_ALGORITHM + '$'):
+        _, iterations, salt, hash_value = password_hash.split('$')
+        return int(iterations), salt, hash_value
+    salt, hash_value = password_hash.split(':')
+    return LEGACY_ITERATIONS, salt, hash_value
+
+
+class PasswordHasher:
+    """PBKDF2 해시 계산을 요청 스레드 밖의 워커 풀에서 실행하는 해시기"""
+
+    def __init__(self, iterations: int = None, executor: str = None, workers: int = None):
+        self.iterations = iterations or DEFAULT_ITERATIONS
+        self.executor_kind = executor or DEFAULT_EXECUTOR
+        self.workers = workers or DEFAULT_WORKERS
+        self._executor: Optional[Executor] = None
+        self._executor_lock = threading.Lock()
+
+    def hash(self, password: str) -> str:
+        """새 salt와 현재 반복 횟수로 비밀번호 해시 생성"""
+        salt = secrets.token_hex(16)
+        hash_value = self._run(pbkdf2_hex, password, salt, self.iterations)
+        return self._format(salt, hash_value, self.iterations)
+
+    def hash_many(self, passwords: Iterable[str]) -> List[str]:
+        """여러 비밀번호를 워커 풀에서 병렬로 해시"""
+        salts_and_passwords = [(secrets.token_hex(16), password) for password in passwords]
+        executor = self._get_executor()
+        if executor is None:
+            return [self.hash(password) for _, password in salts_and_passwords]
+
+        futures = [executor.submit(pbkdf2_hex, password, salt, self.iterations)
+                   for salt, password in salts_and_passwords]
+        return [self._format(salt, future.result(), self.iterations)
+                for (salt, _), future in zip(salts_and_passwords, futures)]
+
+    def verify(self, password: str, password_hash: str) -> bool:
+        """비밀번호 검증 (저장된 해시에 기록된 반복 횟수 사용)"""
+        try:
+            iterations, salt, hash_value = parse_password_hash(password_hash)
+        except ValueError:
+            return False
+        return hmac.compare_digest(self._run(pbkdf2_hex, password, salt, iterations), hash_value)
+
+    def needs_rehash(self, password_hash: str) -> bool:
+        """저장된 해시가 현재 설정과 다른 형식이나 반복 횟수인지 확인"""
+        if not password_hash.startswith(HASH_ALGORITHM + '$'):
+            return True
+        try:
+            iterations, _, _ = parse_password_hash(password_hash)
+        except ValueError:
+            return False
+        return iterations != self.iterations
+
+    def shutdown(self):
+        """워커 풀 종료"""
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+                self._executor = None
+
+    def _format(self, salt: str, hash_value: str, iterations: int) -> str:
+        return f"{HASH_ALGORITHM}${iterations}${salt}${hash_value}"
+
+    def _run(self, func, *args):
+        """워커 풀에서 실행하고 결과를 기다림 (풀이 없으면 현재 스레드에서 실행)"""
+        executor = self._get_executor()
+        if executor is None:
+            return func(*args)
+        return executor.submit(func, *args).result()
+
+    def _get_executor(self) -> Optional[Executor]:
+        """설정에 맞는 워커 풀을 처음 사용할 때 생성"""
+        if self.executor_kind == 'inline':
+            return None
+        if self._executor is None:
+            with self._executor_lock:
+                if self._executor is None:
+                    try:
+                        if self.executor_kind == 'thread':
+                            self._executor = ThreadPoolExecutor(max_workers=self.workers,
+                                                                thread_name_prefix='password-hash')
+                        else:
+                            self._executor = ProcessPoolExecutor(max_workers=self.workers,
+                                                                 mp_context=_process_context())
+                    except (OSError, NotImplementedError) as e:
+                        # 프로세스 풀을 만들 수 없는 환경에서는 현재 스레드에서 계산
+                        print(f"비밀번호 해시 워커 풀 생성 실패, 요청 스레드에서 계산합니다: {e}")
+                        self.executor_kind = 'inline'
+                        return None
+        return self._executor
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+플레이어별 라운드 색인
+Per-player secondary index over the in-memory round list
+"""
+
+from bisect import bisect_left, bisect_right, insort
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+def select_entries(entries: List[Tuple[str, int]], date_from: str = None, date_to: str = None,
+                   before: Optional[Tuple[str, int]] = None) -> Iterator[Tuple[str, int]]:
+    """(날짜, 위치)순으로 정렬된 항목 중 date_from~date_to(양 끝 포함)이면서 before보다
+    앞선 항목을 최신순으로 반환 (이분 탐색으로 범위를 찾으므로 건너뛴 항목은 보지 않음)"""
+    low = bisect_left(entries, (date_from, -1)) if date_from else 0
+    high = bisect_right(entries, (date_to, float('inf'))) if date_to else len(entries)
+    if before is not None:
+        high = min(high, bisect_left(entries, before))
+    for i in range(high - 1, low - 1, -1):
+        yield entries[i]
+
+
+class PlayerRoundIndex:
+    """플레이어 이름 -> 라운드 위치 색인
+
+    위치는 GolfScoreManager가 메모리에 보관하는 라운드 목록의 인덱스이며, 플레이어마다
+    (날짜, 위치) 순으로 정렬해 둡니다. 같은 날짜의 라운드는 시트 순서를 유지합니다.
+    라운드 목록은 뒤에 추가만 되므로 위치는 목록을 새로 읽기 전까지 바뀌지 않습니다.
+    """
+
+    def __init__(self):
+        self._entries: Dict[str, List[Tuple[str, int]]] = {}
+        self._size = 0
+
+    @classmethod
+    def from_rounds(cls, rounds: List) -> 'PlayerRoundIndex':
+        """라운드 목록 전체로 색인 생성"""
+        index = cls()
+        index.extend(rounds, 0)
+        return index
+
+    def add(self, round_data, position: int):
+        """라운드 하나를 색인에 추가"""
+        entry = (str(round_data['date']), position)
+        entries = self._entries.setdefault(round_data['player_name'], [])
+        if not entries or entries[-1] <= entry:
+            entries.append(entry)  # 대부분 가장 최근 날짜이므로 끝에 추가
+        else:
+            insort(entries, entry)
+        self._size += 1
+
+    def extend(self, rounds: Iterable, start_position: int):
+        """start_position부터 이어지는 라운드들을 색인에 추가"""
+        for offset, round_data in enumerate(rounds):
+            self.add(round_data, start_position + offset)
+
+    def positions(self, player_name: str) -> List[int]:
+        """플레이어 라운드 위치 목록 (날짜순, 기록이 없으면 빈 목록)"""
+        return [position for _, position in self._entries.get(player_name, ())]
+
+    def select(self, player_name: str, date_from: str = None, date_to: str = None,
+               before: Optional[Tuple[str, int]] = None) -> Iterator[Tuple[str, int]]:
+        """플레이어의 (날짜, 위치)를 최신순으로 반환 (select_entries 조건 적용)"""
+        return select_entries(self._entries.get(player_name, []), date_from, date_to, before)
+
+    def players(self) -> List[str]:
+        """색인된 플레이어 이름 목록"""
+        return list(self._entries)
+
+    def __len__(self) -> int:
+        return self._size
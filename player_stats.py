@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+플레이어별 누적 통계 (라운드가 추가될 때마다 O(1) 갱신)
+Incrementally maintained per-player aggregates
+"""
+
+from bisect import bisect_right
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Tuple
+
+RECENT_WINDOW = 5  # 최근 N라운드 평균의 N
+
+
+class PlayerAggregate:
+    """한 플레이어의 누적 합계/개수/최고/최악 스코어와 최근 라운드 링 버퍼
+
+    recent에는 (날짜, 위치, 스코어)를 날짜순으로 최대 RECENT_WINDOW개 보관합니다.
+    날짜순으로 추가되면 deque가 가장 오래된 항목을 밀어내고, 더 오래된 날짜의 라운드는
+    창에 들어갈 때만 제자리에 끼워 넣습니다.
+    """
+
+    __slots__ = ('count', 'total', 'best', 'worst', 'recent')
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0
+        self.best = None
+        self.worst = None
+        self.recent = deque(maxlen=RECENT_WINDOW)
+
+    def add(self, date: str, position: int, score: int):
+        """라운드 하나 반영"""
+        self.count += 1
+        self.total += score
+        self.best = score if self.best is None else min(self.best, score)
+        self.worst = score if self.worst is None else max(self.worst, score)
+
+        entry = (date, position, score)
+        recent = self.recent
+        if not recent or recent[-1] <= entry:
+            recent.append(entry)
+        elif len(recent) < RECENT_WINDOW or recent[0] < entry:
+            if len(recent) == RECENT_WINDOW:
+                recent.popleft()
+            recent.insert(bisect_right(list(recent), entry), entry)
+
+    def state(self) -> Tuple:
+        """반올림 전 누적값 (일관성 검사용)"""
+        return self.count, self.total, self.best, self.worst, tuple(self.recent)
+
+    def statistics(self, player_name: str) -> Dict:
+        """compute_player_statistics와 같은 형식의 통계"""
+        recent_scores = [score for _, _, score in self.recent]
+        return {
+            'player_name': player_name,
+            'total_rounds': self.count,
+            'average_score': round(self.total / self.count, 1),
+            'best_score': self.best,
+            'worst_score': self.worst,
+            'recent_5_rounds_avg': round(sum(recent_scores) / len(recent_scores), 1)
+        }
+
+
+class PlayerStatsStore:
+    """플레이어 이름 -> PlayerAggregate
+
+    위치는 GolfScoreManager가 메모리에 보관하는 라운드 목록의 인덱스로, 같은 날짜의
+    라운드를 시트 순서로 정렬하는 데 사용합니다.
+    """
+
+    def __init__(self):
+        self._players: Dict[str, PlayerAggregate] = {}
+
+    @classmethod
+    def from_rounds(cls, rounds: List) -> 'PlayerStatsStore':
+        """라운드 목록 전체로 통계 생성"""
+        store = cls()
+        store.extend(rounds, 0)
+        return store
+
+    def add(self, round_data, position: int):
+        """라운드 하나 반영"""
+        aggregate = self._players.get(round_data['player_name'])
+        if aggregate is None:
+            aggregate = self._players[round_data['player_name']] = PlayerAggregate()
+        aggregate.add(str(round_data['date']), position, round_data['total_score'])
+
+    def extend(self, rounds: Iterable, start_position: int):
+        """start_position부터 이어지는 라운드들을 반영"""
+        for offset, round_data in enumerate(rounds):
+            self.add(round_data, start_position + offset)
+
+    def statistics(self, player_name: str) -> Dict:
+        """플레이어 통계 (기록이 없으면 message만 있는 딕셔너리)"""
+        aggregate = self._players.get(player_name)
+        if aggregate is None:
+            return {"message": f"{player_name}의 라운드 기록이 없습니다."}
+        return aggregate.statistics(player_name)
+
+    def state(self, player_name: str) -> Optional[Tuple]:
+        """플레이어의 반올림 전 누적값 (기록이 없으면 None)"""
+        aggregate = self._players.get(player_name)
+        return aggregate.state() if aggregate is not None else None
+
+    def players(self) -> List[str]:
+        """통계가 있는 플레이어 이름 목록"""
+        return list(self._players)
+
+    def __len__(self) -> int:
+        return len(self._players)
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+Sheets API 할당량 스케줄러 (토큰 버킷, 우선순위, 지터 백오프)
+Quota-aware scheduler for Sheets API calls
+"""
+
+import heapq
+import itertools
+import os
+import random
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Optional
+
+from metrics import observe_quota_wait, observe_sheets_retry
+
+# 분당 요청 한도 (Google 기본값: 사용자당 읽기 60, 쓰기 60), 0이면 제한 없음
+READ_QUOTA_PER_MINUTE = float(os.getenv('GOLF_SHEETS_READ_QUOTA_PER_MINUTE', '60'))
+WRITE_QUOTA_PER_MINUTE = float(os.getenv('GOLF_SHEETS_WRITE_QUOTA_PER_MINUTE', '60'))
+QUOTA_MAX_WAIT = float(os.getenv('GOLF_SHEETS_QUOTA_MAX_WAIT', '30'))  # 할당량이 생길 때까지 기다리는 최대 시간 (초)
+MAX_RETRIES = int(os.getenv('GOLF_SHEETS_MAX_RETRIES', '5'))  # 429/5xx 응답 재시도 횟수
+BACKOFF_BASE = float(os.getenv('GOLF_SHEETS_BACKOFF_BASE', '1.0'))  # 첫 재시도 대기 시간 상한 (초)
+BACKOFF_MAX = float(os.getenv('GOLF_SHEETS_BACKOFF_MAX', '32'))  # 재시도 대기 시간 상한 (초)
+
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# 우선순위 (작을수록 먼저): 쓰기 > 데이터가 없어 기다려야 하는 읽기 > 오래된 값으로 대신할 수 있는 갱신
+PRIORITY_WRITE = 0
+PRIORITY_READ = 1
+PRIORITY_REFRESH = 2
+PRIORITY_NAMES = {PRIORITY_WRITE: 'write', PRIORITY_READ: 'read', PRIORITY_REFRESH: 'refresh'}
+
+_context = threading.local()
+
+
+@contextmanager
+def request_priority(priority: int):
+    """with 블록 안의 읽기 요청 우선순위 지정 (쓰기는 항상 PRIORITY_WRITE)"""
+    previous = getattr(_context, 'priority', None)
+    _context.priority = priority
+    try:
+        yield
+    finally:
+        _context.priority = previous
+
+
+def current_priority(write: bool) -> int:
+    if write:
+        return PRIORITY_WRITE
+    priority = getattr(_context, 'priority', None)
+    return PRIORITY_READ if priority is None else priority
+
+
+class TokenBucket:
+    """분당 한도를 초당 보충 속도로 나눈 토큰 버킷 (기다리는 요청은 우선순위 순서로 토큰을 받음)"""
+
+    def __init__(self, per_minute: float, capacity: float = None):
+        self.rate = per_minute / 60.0
+        self.capacity = capacity or per_minute
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._condition = threading.Condition()
+        self._waiters = []  # (우선순위, 순번) 힙
+        self._sequence = itertools.count()
+        self._acquired = 0
+        self._throttled = 0
+
+    def acquire(self, priority: int, timeout: Optional[float]) -> bool:
+        """토큰 하나를 가져감 (timeout 안에 차례가 오지 않으면 False, 0이면 기다리지 않음)"""
+        if self.rate <= 0:
+            return True
+        deadline = None if timeout is None else time.monotonic() + timeout
+        ticket = (priority, next(self._sequence))
+        with self._condition:
+            heapq.heappush(self._waiters, ticket)
+            try:
+                while True:
+                    self._refill()
+                    is_next = self._waiters[0] == ticket
+                    if is_next and self._tokens >= 1:
+                        self._tokens -= 1
+                        self._acquired += 1
+                        return True
+                    # 차례가 되었으면 토큰이 찰 때까지, 아니면 앞 요청이 끝날 때까지 대기
+                    wait = (1 - self._tokens) / self.rate if is_next else None
+                    if deadline is not None:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            self._throttled += 1
+                            return False
+                        wait = remaining if wait is None else min(wait, remaining)
+                    self._condition.wait(wait)
+            finally:
+                self._waiters.remove(ticket)
+                heapq.heapify(self._waiters)
+                self._condition.notify_all()
+
+    def drain(self):
+        """남은 토큰을 비움 (429 응답을 받으면 다른 요청도 보충될 때까지 쉬도록)"""
+        with self._condition:
+            self._refill()
+            self._tokens = min(self._tokens, 0.0)
+
+    def stats(self) -> Dict:
+        with self._condition:
+            self._refill()
+            return {
+                'per_minute': round(self.rate * 60, 1),
+                'tokens': round(self._tokens, 2) if self.rate > 0 else None,
+                'waiting': len(self._waiters),
+                'acquired': self._acquired,
+                'throttled': self._throttled
+            }
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+
+class QuotaScheduler:
+    """모든 Sheets 호출이 거쳐 가는 읽기/쓰기 할당량과 재시도 정책
+
+    - 읽기/쓰기 토큰 버킷이 설정한 분당 한도를 넘지 않게 요청을 늦춥니다.
+    - 토큰이 부족하면 쓰기가 읽기보다, 읽기가 백그라운드 갱신보다 먼저 토큰을 받습니다.
+    - PRIORITY_REFRESH 요청은 기다리거나 재시도하지 않고 바로 실패하므로
+      호출자는 이미 가진 (오래된) 데이터를 그대로 사용합니다.
+    - 429/5xx 응답은 지터를 더한 지수 백오프로 재시도합니다.
+    """
+
+    def __init__(self, read_per_minute: float = None, write_per_minute: float = None,
+                 max_wait: float = None, max_retries: int = None,
+                 backoff_base: float = None, backoff_max: float = None):
+        self._buckets = {
+            False: TokenBucket(READ_QUOTA_PER_MINUTE if read_per_minute is None else read_per_minute),
+            True: TokenBucket(WRITE_QUOTA_PER_MINUTE if write_per_minute is None else write_per_minute)
+        }
+        self.max_wait = QUOTA_MAX_WAIT if max_wait is None else max_wait
+        self.max_retries = MAX_RETRIES if max_retries is None else max_retries
+        self.backoff_base = BACKOFF_BASE if backoff_base is None else backoff_base
+        self.backoff_max = BACKOFF_MAX if backoff_max is None else backoff_max
+        self._stats_lock = threading.Lock()
+        self._retries = 0
+        self._rate_limited = 0
+
+    def acquire(self, write: bool, priority: int) -> bool:
+        """요청 하나를 보낼 할당량 확보 (갱신 요청은 기다리지 않음)"""
+        timeout = 0 if priority >= PRIORITY_REFRESH else self.max_wait
+        started = time.perf_counter()
+        acquired = self._buckets[write].acquire(priority, timeout)
+        observe_quota_wait(PRIORITY_NAMES.get(priority, str(priority)), time.perf_counter() - started, acquired)
+        return acquired
+
+    def retry_delay(self, method: str, status: int, attempt: int, write: bool, priority: int) -> Optional[float]:
+        """attempt번째 실패 뒤 다시 보내기 전 대기 시간 (재시도하지 않으면 None)"""
+        if status not in RETRY_STATUSES:
+            return None
+        if status == 429:
+            self._buckets[write].drain()
+            with self._stats_lock:
+                self._rate_limited += 1
+        if priority >= PRIORITY_REFRESH or attempt >= self.max_retries:
+            return None
+        # 동시에 실패한 요청들이 같은 시점에 다시 몰리지 않도록 상한의 절반~전체 사이에서 무작위 선택
+        ceiling = min(self.backoff_max, self.backoff_base * (2 ** attempt))
+        with self._stats_lock:
+            self._retries += 1
+        observe_sheets_retry(method, str(status))
+        return ceiling / 2 + random.uniform(0, ceiling / 2)
+
+    def stats(self) -> Dict:
+        with self._stats_lock:
+            return {
+                'read': self._buckets[False].stats(),
+                'write': self._buckets[True].stats(),
+                'retries': self._retries,
+                'rate_limited': self._rate_limited
+            }
+
+
+_scheduler = None
+_scheduler_lock = threading.Lock()
+
+
+def get_quota_scheduler() -> QuotaScheduler:
+    """프로세스 공유 스케줄러 (GolfScoreManager와 UserManager가 같은 할당량을 나눠 씀)"""
+    global _scheduler
+    if _scheduler is None:
+        with _scheduler_lock:
+            if _scheduler is None:
+                _scheduler = QuotaScheduler()
+    return _scheduler
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+버전 기반 읽기 캐시
+Versioned read cache
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+
+class VersionedReadCache:
+    """TTL과 명시적 무효화를 지원하는 크기 제한 캐시
+
+    읽기 전에 begin_load()로 버전을 받아 두고, 읽는 동안 invalidate()가
+    호출되면 put()이 그 결과를 버립니다. 따라서 쓰기 직전에 시작된 느린 읽기가
+    오래된 데이터를 캐시에 다시 채우는 일이 없습니다.
+    """
+
+    def __init__(self, ttl: float = 30.0, max_bytes: int = 16 * 1024 * 1024):
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()  # key -> (value, size, stored_at)
+        self._lock = threading.Lock()
+        self._version = 0
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    def begin_load(self) -> int:
+        """읽기 시작 시점의 캐시 버전"""
+        with self._lock:
+            return self._version
+
+    def get(self, key: str) -> Optional[Any]:
+        """TTL 안에 있는 캐시 값 조회 (없으면 None)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or time.monotonic() - entry[2] > self.ttl:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[0]
+
+    def put(self, key: str, value: Any, size: int, version: int) -> bool:
+        """값 저장 (읽는 동안 무효화되었거나 크기 한도를 넘으면 저장하지 않음)"""
+        if self.ttl <= 0 or size > self.max_bytes:
+            return False
+        with self._lock:
+            if version != self._version:
+                return False
+            self._remove(key)
+            self._entries[key] = (value, size, time.monotonic())
+            self._bytes += size
+            # 크기 한도를 넘으면 가장 오래 사용하지 않은 항목부터 제거
+            while self._bytes > self.max_bytes and self._entries:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self._evictions += 1
+            return True
+
+    def invalidate(self, key: str = None):
+        """캐시 무효화 (key가 없으면 전체), 진행 중인 읽기 결과도 버려짐"""
+        with self._lock:
+            self._version += 1
+            self._invalidations += 1
+            if key is None:
+                self._entries.clear()
+                self._bytes = 0
+            else:
+                self._remove(key)
+
+    def stats(self) -> Dict:
+        """캐시 적중/실패 지표"""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                'hits': self._hits,
+                'misses': self._misses,
+                'hit_ratio': round(self._hits / lookups, 3) if lookups else 0.0,
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'max_bytes': self.max_bytes,
+                'evictions': self._evictions,
+                'invalidations': self._invalidations,
+                'version': self._version
+            }
+
+    def _remove(self, key: str):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry[1]
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+라운드 스트리밍 내보내기 (CSV / JSON Lines)
+Streaming round export to CSV or JSON Lines
+
+사용법:
+  python round_export.py > rounds.csv
+  python round_export.py --format jsonl --output rounds.jsonl
+  python round_export.py --player 홍길동 --output hong.csv
+
+CSV는 Score 시트와 같은 헤더/열 순서, JSON Lines는 GET /api/rounds의 라운드 형식이라
+round_import.py로 다시 가져올 수 있습니다.
+"""
+
+import argparse
+import csv
+import io
+import json
+import sys
+from typing import Iterable, Iterator
+
+from golf_score_manager import GolfScoreManager, _score_headers
+from metrics import observe_export_error
+from round_model import GolfRound
+
+EXPORT_FORMATS = {
+    'csv': 'text/csv; charset=utf-8',
+    'jsonl': 'application/x-ndjson; charset=utf-8'
+}
+EXPORT_CHUNK_ROUNDS = 500  # 출력 한 조각에 담는 라운드 수 (조각마다 HTTP 청크/쓰기 1회)
+CSV_ERROR_MARKER = '#error'  # 중단된 CSV 내보내기의 마지막 행 첫 칸
+
+
+def csv_chunks(rounds: Iterable[GolfRound], headers: list) -> Iterator[str]:
+    """헤더와 라운드 행을 CSV 텍스트 조각으로 반환"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator='\n')
+    writer.writerow(headers)
+    count = 0
+    for round_data in rounds:
+        writer.writerow(round_data.to_row())
+        count += 1
+        if count % EXPORT_CHUNK_ROUNDS == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
+
+
+def jsonl_chunks(rounds: Iterable[GolfRound]) -> Iterator[str]:
+    """라운드를 한 줄에 하나씩 JSON으로 쓴 텍스트 조각으로 반환"""
+    lines = []
+    for round_data in rounds:
+        lines.append(json.dumps(round_data.to_dict(), ensure_ascii=False))
+        if len(lines) >= EXPORT_CHUNK_ROUNDS:
+            yield '\n'.join(lines) + '\n'
+            lines = []
+    if lines:
+        yield '\n'.join(lines) + '\n'
+
+
+def export_rounds(manager, player_name: str = None) -> Iterator[GolfRound]:
+    """내보낼 라운드를 페이지 단위로 읽으며 반환 (player_name이 있으면 그 플레이어만)"""
+    rounds = manager.iter_rounds()
+    if player_name:
+        return (round_data for round_data in rounds if round_data.player_name == player_name)
+    return rounds
+
+
+def export_chunks(rounds: Iterable[GolfRound], fmt: str) -> Iterator[str]:
+    """라운드를 fmt 형식 텍스트 조각으로 반환"""
+    if fmt == 'csv':
+        return csv_chunks(rounds, _score_headers())
+    if fmt == 'jsonl':
+        return jsonl_chunks(rounds)
+    raise ValueError(f"지원하지 않는 형식입니다: {fmt} (csv 또는 jsonl)")
+
+
+def error_marker(fmt: str, message: str) -> str:
+    """중단된 내보내기 끝에 붙이는 표시 (JSON Lines는 {"error": ...} 한 줄, CSV는 '#error' 행)"""
+    if fmt == 'jsonl':
+        return json.dumps({'error': message}, ensure_ascii=False) + '\n'
+    buffer = io.StringIO()
+    csv.writer(buffer, lineterminator='\n').writerow([CSV_ERROR_MARKER, message])
+    return buffer.getvalue()
+
+
+def guarded_chunks(chunks: Iterable[str], fmt: str) -> Iterator[str]:
+    """HTTP 응답용 조각 반환 - 도중에 실패하면 로그와 지표를 남기고 오류 표시로 끝냄
+
+    응답 상태(200)와 앞부분은 이미 보냈으므로 받는 쪽이 잘린 파일을 완전한 내보내기로
+    오해하지 않도록 마지막 줄에 오류를 남깁니다.
+    """
+    try:
+        yield from chunks
+    except Exception as e:
+        print(f"❌ 내보내기 중단 ({fmt}): {e}")
+        observe_export_error(fmt)
+        yield error_marker(fmt, str(e))
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='Score 시트의 라운드를 CSV/JSON Lines로 내보내기')
+    parser.add_argument('--format', choices=tuple(EXPORT_FORMATS), default='csv', help='출력 형식 (기본값: csv)')
+    parser.add_argument('--output', help='출력 파일 (기본값: 표준 출력)')
+    parser.add_argument('--player', help='이 플레이어의 라운드만 내보내기')
+    parser.add_argument('--spreadsheet-id', help='스프레드시트 ID (기본값: GOOGLE_SPREADSHEET_ID)')
+    args = parser.parse_args(argv)
+
+    manager = GolfScoreManager(args.spreadsheet_id, write_behind=False)
+    output = open(args.output, 'w', encoding='utf-8', newline='') if args.output else sys.stdout
+    exported = 0
+
+    def counted(rounds):
+        nonlocal exported
+        for round_data in rounds:
+            exported += 1
+            yield round_data
+
+    try:
+        for chunk in export_chunks(counted(export_rounds(manager, args.player)), args.format):
+            output.write(chunk)
+    except Exception as e:
+        print(f"❌ 내보내기 중단: {e}", file=sys.stderr)
+        return 1
+    finally:
+        if args.output:
+            output.close()
+        manager.close()
+
+    print(f"✅ 내보내기 완료: 라운드 {exported:,}개", file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,325 @@
+#!/usr/bin/env python3
+"""
+라운드 일괄 가져오기 (CSV / JSON Lines → 여러 행 append)
+Bulk round import from CSV or JSON Lines
+
+사용법:
+  python round_import.py history.csv                 # 중단되면 같은 명령으로 이어서 가져오기
+  python round_import.py history.jsonl --chunk-rows 5000
+  python round_import.py history.csv --dry-run       # 저장하지 않고 검증만
+
+CSV는 Score 시트와 같은 열 순서(날짜, 플레이어, 코스, 총 스코어, 핸디캡, 홀별 6개 항목)를
+사용하며 첫 행이 헤더면 건너뜁니다. JSON Lines는 한 줄에 하나씩
+{"date", "player_name", "course_name", "detailed_scores": [{"par", "driver", "wood_util",
+"iron", "putter"}, ...18개]} 객체를 씁니다. 총 스코어/핸디캡/홀별 total은 입력값과 관계없이
+다시 계산합니다.
+"""
+
+import argparse
+import csv
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+from datetime import datetime
+from typing import Callable, Dict, IO, Iterator, List, Optional, Sequence, Tuple
+
+from round_model import FIELD_COUNT, GolfRound, compact_array
+from score_parser import BASE_COLUMNS, HOLE_COUNT
+
+IMPORT_CHUNK_ROWS = int(os.getenv('GOLF_IMPORT_CHUNK_ROWS', '2000'))  # append 한 번에 보낼 최대 행 수
+MAX_REPORTED_ERRORS = 100  # 결과에 담는 오류 상세 최대 개수 (개수는 모두 셈)
+PAR_RANGE = (3, 6)
+DATE_FORMAT = '%Y-%m-%d'
+HEADER_FIRST_CELLS = ('날짜', 'date')
+STROKE_FIELDS = ('driver', 'wood_util', 'iron', 'putter')
+FORMATS = ('csv', 'jsonl')
+UPLOAD_SPOOL_SIZE = 1024 * 1024  # 업로드를 옮겨 둘 임시 파일의 메모리 보관 한도 (넘으면 디스크)
+
+
+def detect_format(name: str) -> Optional[str]:
+    """파일 이름 또는 Content-Type으로 형식 판단 (알 수 없으면 None)"""
+    name = (name or '').lower()
+    extension = os.path.splitext(name)[1]
+    if extension == '.csv':
+        return 'csv'
+    if extension in ('.jsonl', '.ndjson', '.json'):
+        return 'jsonl'
+    # Content-Type (text/csv, application/x-ndjson, application/json 등)
+    if 'csv' in name:
+        return 'csv'
+    if 'json' in name:
+        return 'jsonl'
+    return None
+
+
+def spool_upload(stream: IO[bytes]) -> IO[bytes]:
+    """multipart 업로드 파일을 임시 파일로 복사해서 처음 위치로 되돌려 반환
+
+    Flask 3.1+/Quart는 핸들러가 응답을 돌려주면 (스트리밍 응답을 보내기 전에) 업로드 파일을
+    닫으므로, 응답을 보내면서 읽을 내용은 요청과 상관없는 파일로 옮겨 둡니다.
+    """
+    spooled = tempfile.SpooledTemporaryFile(max_size=UPLOAD_SPOOL_SIZE)
+    shutil.copyfileobj(stream, spooled)
+    spooled.seek(0)
+    return spooled
+
+
+def _stroke(value, hole: int, field: str) -> int:
+    if value is None or value == '':
+        return 0
+    try:
+        number = int(value)
+    except (TypeError, ValueError):
+        try:
+            number = float(str(value).strip())
+        except ValueError:
+            raise ValueError(f"{hole}번 홀 {field} 값이 숫자가 아닙니다: {value!r}")
+        if not number.is_integer():
+            raise ValueError(f"{hole}번 홀 {field} 값이 정수가 아닙니다: {value!r}")
+        number = int(number)
+    if number < 0:
+        raise ValueError(f"{hole}번 홀 {field} 값이 음수입니다: {number}")
+    return number
+
+
+def build_round(date, player_name, course_name, holes: Sequence[Sequence]) -> GolfRound:
+    """검증 후 총 스코어/핸디캡을 계산한 GolfRound 생성 (holes: 홀마다 par, driver, wood_util, iron, putter)
+
+    잘못된 값이 있으면 ValueError를 던집니다.
+    """
+    date = str(date or '').strip()
+    player_name = str(player_name or '').strip()
+    course_name = str(course_name or '').strip()
+    try:
+        datetime.strptime(date, DATE_FORMAT)
+    except ValueError:
+        raise ValueError(f"날짜 형식이 올바르지 않습니다 (YYYY-MM-DD): {date!r}")
+    if not player_name or not course_name:
+        raise ValueError("플레이어와 코스 이름이 필요합니다.")
+    if len(holes) != HOLE_COUNT:
+        raise ValueError(f"홀 수가 {HOLE_COUNT}개가 아닙니다: {len(holes)}")
+
+    details = []
+    total_score = 0
+    total_par = 0
+    for hole, values in enumerate(holes, 1):
+        par = _stroke(values[0], hole, 'par')
+        if not PAR_RANGE[0] <= par <= PAR_RANGE[1]:
+            raise ValueError(f"{hole}번 홀 par 값이 범위({PAR_RANGE[0]}~{PAR_RANGE[1]})를 벗어났습니다: {par}")
+        strokes = [_stroke(value, hole, field) for value, field in zip(values[1:5], STROKE_FIELDS)]
+        hole_total = sum(strokes)
+        details.extend([par, *strokes, hole_total])
+        total_score += hole_total
+        total_par += par
+
+    # calculate_handicap과 같은 계산
+    return GolfRound(date, player_name, course_name, compact_array(details),
+                     total_score=total_score, handicap=max(0, total_score - total_par))
+
+
+def parse_csv_row(row: List[str]) -> GolfRound:
+    """Score 시트 열 순서의 CSV 행을 라운드로 변환 (총 스코어/핸디캡/홀별 total 열은 무시)"""
+    if len(row) < BASE_COLUMNS:
+        raise ValueError(f"열이 부족합니다: {len(row)}개")
+    holes = []
+    for start in range(BASE_COLUMNS, BASE_COLUMNS + HOLE_COUNT * FIELD_COUNT, FIELD_COUNT):
+        hole = row[start:start + 5]
+        if not hole:
+            break  # 홀 열이 없으면 build_round가 홀 수 오류로 처리
+        holes.append(hole + [''] * (5 - len(hole)))
+    return build_round(row[0], row[1], row[2], holes)
+
+
+def parse_json_record(line: str) -> GolfRound:
+    """JSON Lines 한 줄을 라운드로 변환"""
+    try:
+        record = json.loads(line)
+    except ValueError as e:
+        raise ValueError(f"JSON 형식 오류: {e}")
+    if not isinstance(record, dict):
+        raise ValueError("각 줄은 JSON 객체여야 합니다.")
+    detailed_scores = record.get('detailed_scores')
+    if not isinstance(detailed_scores, list) or not all(isinstance(hole, dict) for hole in detailed_scores):
+        raise ValueError("detailed_scores 목록이 필요합니다.")
+    holes = [[hole.get('par'), *(hole.get(field) for field in STROKE_FIELDS)] for hole in detailed_scores]
+    return build_round(record.get('date'), record.get('player_name'), record.get('course_name'), holes)
+
+
+def read_records(stream: IO[str], fmt: str) -> Iterator[Tuple[int, object]]:
+    """(줄 번호, 원본 레코드)를 차례로 반환 (빈 줄과 CSV 헤더 행은 건너뜀)"""
+    if fmt == 'csv':
+        reader = csv.reader(stream)
+        first = True
+        for row in reader:
+            if not any(cell.strip() for cell in row):
+                continue
+            if first and row[0].strip().lower() in HEADER_FIRST_CELLS:
+                first = False
+                continue
+            first = False
+            yield reader.line_num, row
+    elif fmt == 'jsonl':
+        for line_number, line in enumerate(stream, 1):
+            if line.strip():
+                yield line_number, line
+    else:
+        raise ValueError(f"지원하지 않는 형식입니다: {fmt} (csv 또는 jsonl)")
+
+
+def import_rounds(stream: IO[str], fmt: str, save_rounds: Callable[[List[GolfRound]], object],
+                  chunk_rows: int = None, skip_records: int = 0,
+                  on_chunk: Callable[[Dict], None] = None, player_name: str = None) -> Iterator[Dict]:
+    """입력을 읽으며 chunk_rows개씩 save_rounds로 저장하고, 묶음마다 진행 상황을 반환
+
+    메모리에는 묶음 하나만 보관합니다. 진행 상황의 records는 저장이 끝난 위치까지 읽은
+    레코드 수(오류 포함)이므로 skip_records로 넘기면 그 다음부터 이어서 가져옵니다.
+    on_chunk는 묶음을 저장한 직후 같은 진행 상황으로 호출됩니다 (체크포인트 기록용).
+    player_name을 주면 다른 플레이어의 레코드는 저장하지 않고 오류로 셉니다 (API 가져오기용).
+    묶음 저장 도중 중단되면 그 묶음은 재개할 때 다시 저장될 수 있습니다.
+    마지막으로 done=True와 오류 상세(errors)가 담긴 결과를 반환합니다.
+    """
+    chunk_rows = max(1, chunk_rows or IMPORT_CHUNK_ROWS)
+    parse = parse_csv_row if fmt == 'csv' else parse_json_record
+    started = time.perf_counter()
+    progress = {'records': skip_records, 'imported': 0, 'failed': 0}
+    errors = []
+    chunk = []
+    position = 0
+
+    def flush():
+        if chunk:
+            save_rounds(chunk)
+            progress['imported'] += len(chunk)
+            chunk.clear()
+        progress['records'] = position
+        elapsed = time.perf_counter() - started
+        progress['elapsed_seconds'] = round(elapsed, 2)
+        progress['rounds_per_second'] = round(progress['imported'] / elapsed, 1) if elapsed > 0 else 0.0
+        if on_chunk:
+            on_chunk(dict(progress))
+        return dict(progress)
+
+    for line_number, raw in read_records(stream, fmt):
+        position += 1
+        if position <= skip_records:
+            continue
+        try:
+            round_data = parse(raw)
+            if player_name is not None and round_data.player_name != player_name:
+                raise ValueError(f"다른 플레이어({round_data.player_name})의 라운드는 가져올 수 없습니다.")
+            chunk.append(round_data)
+        except ValueError as e:
+            progress['failed'] += 1
+            if len(errors) < MAX_REPORTED_ERRORS:
+                errors.append({'line': line_number, 'message': str(e)})
+        if len(chunk) >= chunk_rows:
+            yield flush()
+
+    result = flush()
+    result.update(done=True, errors=errors)
+    yield result
+
+
+# ===== 명령행 도구 =====
+
+def load_checkpoint(path: str, source: str) -> Optional[Dict]:
+    """같은 입력 파일에 대한 체크포인트 (없거나 다른 파일이면 None)"""
+    try:
+        with open(path, encoding='utf-8') as f:
+            checkpoint = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if checkpoint.get('source') != os.path.abspath(source) or checkpoint.get('size') != os.path.getsize(source):
+        print(f"⚠️ 체크포인트가 다른 입력 파일의 것이라 처음부터 가져옵니다: {path}")
+        return None
+    return checkpoint
+
+
+def save_checkpoint(path: str, checkpoint: Dict):
+    """체크포인트를 임시 파일에 쓴 뒤 교체 (쓰는 도중 중단돼도 이전 체크포인트 유지)"""
+    temp_path = f'{path}.tmp'
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(checkpoint, f, ensure_ascii=False)
+    os.replace(temp_path, path)
+
+
+def main(argv: Sequence[str] = None) -> int:
+    parser = argparse.ArgumentParser(description='CSV/JSON Lines 라운드 기록을 Score 시트로 일괄 가져오기')
+    parser.add_argument('path', help='입력 파일 (.csv 또는 .jsonl)')
+    parser.add_argument('--format', choices=FORMATS, help='입력 형식 (기본값: 확장자로 판단)')
+    parser.add_argument('--chunk-rows', type=int, default=IMPORT_CHUNK_ROWS,
+                        help=f'append 한 번에 보낼 행 수 (기본값: {IMPORT_CHUNK_ROWS})')
+    parser.add_argument('--checkpoint', help='체크포인트 파일 (기본값: <입력 파일>.import-checkpoint.json)')
+    parser.add_argument('--restart', action='store_true', help='체크포인트를 무시하고 처음부터 가져오기')
+    parser.add_argument('--dry-run', action='store_true', help='저장하지 않고 검증만 수행')
+    parser.add_argument('--spreadsheet-id', help='스프레드시트 ID (기본값: GOOGLE_SPREADSHEET_ID)')
+    args = parser.parse_args(argv)
+
+    fmt = args.format or detect_format(args.path)
+    if fmt is None:
+        parser.error('입력 형식을 알 수 없습니다. --format csv 또는 --format jsonl을 지정하세요.')
+
+    checkpoint_path = args.checkpoint or f'{args.path}.import-checkpoint.json'
+    checkpoint = None if args.restart or args.dry_run else load_checkpoint(checkpoint_path, args.path)
+    if checkpoint and checkpoint.get('done'):
+        print(f"이미 가져오기를 마친 파일입니다 ({checkpoint['imported']}개). 다시 가져오려면 --restart를 사용하세요.")
+        return 0
+    skip_records = checkpoint['records'] if checkpoint else 0
+    base = {'imported': checkpoint['imported'], 'failed': checkpoint['failed']} if checkpoint else {'imported': 0, 'failed': 0}
+    if skip_records:
+        print(f"체크포인트에서 이어서 가져옵니다: 레코드 {skip_records:,}개 건너뜀")
+
+    manager = None
+    if args.dry_run:
+        def save_rounds(rounds):
+            pass
+    else:
+        from golf_score_manager import GolfScoreManager
+        manager = GolfScoreManager(args.spreadsheet_id, write_behind=False)
+        save_rounds = manager.save_rounds
+
+    def record_checkpoint(progress: Dict):
+        if args.dry_run:
+            return
+        save_checkpoint(checkpoint_path, {
+            'source': os.path.abspath(args.path),
+            'size': os.path.getsize(args.path),
+            'format': fmt,
+            'records': progress['records'],
+            'imported': base['imported'] + progress['imported'],
+            'failed': base['failed'] + progress['failed'],
+            'done': bool(progress.get('done')),
+            'updated_at': datetime.now().isoformat()
+        })
+
+    result = None
+    try:
+        with open(args.path, encoding='utf-8-sig', newline='') as stream:
+            for progress in import_rounds(stream, fmt, save_rounds, args.chunk_rows, skip_records, record_checkpoint):
+                result = progress
+                print(f"진행: 레코드 {progress['records']:,}개 처리, 저장 {base['imported'] + progress['imported']:,}개, "
+                      f"오류 {base['failed'] + progress['failed']:,}개 ({progress['rounds_per_second']:,.0f}개/초)")
+        record_checkpoint(result)
+    except Exception as e:
+        print(f"❌ 가져오기 중단: {e}")
+        print(f"   같은 명령을 다시 실행하면 체크포인트({checkpoint_path})부터 이어서 가져옵니다.")
+        return 1
+    finally:
+        if manager:
+            manager.close()
+
+    for error in result['errors']:
+        print(f"  {error['line']}행: {error['message']}")
+    if result['failed'] > len(result['errors']):
+        print(f"  ... 외 {result['failed'] - len(result['errors'])}개")
+    action = '검증' if args.dry_run else '저장'
+    print(f"✅ 완료: {base['imported'] + result['imported']:,}개 {action}, 오류 {base['failed'] + result['failed']:,}개, "
+          f"{result['elapsed_seconds']}초")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
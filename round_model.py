@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+메모리 절약형 라운드 데이터 모델
+Compact round data model
+"""
+
+import sys
+from array import array
+from collections.abc import Mapping
+from typing import Dict, Iterator, List, Optional
+
+HOLE_FIELDS = ('par', 'driver', 'wood_util', 'iron', 'putter', 'total')
+FIELD_COUNT = len(HOLE_FIELDS)
+
+# to_dict()/JSON 키 구성 - 기존 딕셔너리 형식과 동일하게 유지
+# create_golf_round로 만든 라운드는 holes/par_scores가 있고, 시트에서 읽은 라운드는 없음
+CREATED_KEYS = ('player_name', 'course_name', 'date', 'holes', 'scores', 'detailed_scores',
+                'total_score', 'par_scores', 'handicap')
+LOADED_KEYS = ('date', 'player_name', 'course_name', 'total_score', 'handicap', 'scores',
+               'detailed_scores')
+
+
+ARRAY_TYPECODES = ('b', 'h', 'i', 'q')  # 1/2/4/8바이트 부호 있는 정수
+
+
+def compact_array(values) -> array:
+    """값 범위에 맞는 가장 작은 정수 배열로 저장 (작은 정수는 1바이트, 최대 8바이트)
+
+    8바이트 범위도 넘는 값이 있으면 OverflowError를 던집니다.
+    """
+    values = list(values)
+    for typecode in ARRAY_TYPECODES[:-1]:
+        try:
+            return array(typecode, values)
+        except OverflowError:
+            continue
+    return array(ARRAY_TYPECODES[-1], values)
+
+
+def _store(values: array, index: int, value: int) -> array:
+    """배열 원소 저장 (현재 크기 범위를 넘으면 더 큰 정수 배열로 바꿔서 반환)"""
+    try:
+        values[index] = value
+    except OverflowError:
+        values = values.tolist()
+        values[index] = value
+        values = compact_array(values)
+    return values
+
+
+class GolfRound(Mapping):
+    """__slots__와 array 기반 라운드 (딕셔너리 라운드와 같은 키로 읽기 가능)
+
+    홀별 상세 스코어는 홀마다 6개 정수(par, driver, wood_util, iron, putter, total)를
+    이어 붙인 배열 하나에 보관합니다. round_data['detailed_scores'] 처럼 읽으면 기존과
+    같은 딕셔너리/리스트를 만들어 돌려주고, JSON 응답에는 to_dict()를 사용합니다.
+    값을 바꿀 때는 set_hole()/set_score()를 사용하며, 스칼라 필드
+    (total_score, handicap 등)는 round_data['handicap'] = 3 처럼 설정할 수 있습니다.
+    """
+
+    __slots__ = ('date', 'player_name', 'course_name', 'holes', 'total_score', 'handicap',
+                 '_details', '_scores', '_pars')
+
+    _SCALAR_FIELDS = ('date', 'player_name', 'course_name', 'holes', 'total_score', 'handicap')
+
+    def __init__(self, date: str, player_name: str, course_name: str, details: array,
+                 total_score: int = 0, handicap: int = 0, scores: Optional[array] = None,
+                 pars: Optional[array] = None):
+        self.date = date
+        self.player_name = sys.intern(player_name)
+        self.course_name = sys.intern(course_name)
+        self.holes = len(details) // FIELD_COUNT
+        self.total_score = total_score
+        self.handicap = handicap
+        self._details = details
+        self._scores = scores  # None이면 홀별 total 값을 스코어로 사용
+        self._pars = pars  # None이면 시트에서 읽은 라운드 (par_scores 키 없음)
+
+    @classmethod
+    def new(cls, player_name: str, course_name: str, date: str, holes: int = 18) -> 'GolfRound':
+        """빈 라운드 생성 (기본 파4, create_golf_round와 같은 초기값)"""
+        details = compact_array([4, 0, 0, 0, 0, 4] * holes)
+        return cls(date, player_name, course_name, details,
+                   scores=compact_array([0] * holes), pars=compact_array([4] * holes))
+
+    def hole(self, index: int) -> Dict:
+        """0부터 시작하는 홀 번호의 상세 스코어 딕셔너리"""
+        start = index * FIELD_COUNT
+        return dict(zip(HOLE_FIELDS, self._details[start:start + FIELD_COUNT]))
+
+    def hole_values(self) -> array:
+        """홀별 상세 스코어 원본 배열 (holes × 6개 정수)"""
+        return self._details
+
+    def set_hole(self, hole: int, par: int, driver: int, wood_util: int, iron: int, putter: int):
+        """1부터 시작하는 홀의 상세 스코어 설정 (스코어와 총 스코어도 갱신)"""
+        total = driver + wood_util + iron + putter
+        start = (hole - 1) * FIELD_COUNT
+        for offset, value in enumerate((par, driver, wood_util, iron, putter, total)):
+            self._details = _store(self._details, start + offset, value)
+        if self._scores is not None:
+            self._scores = _store(self._scores, hole - 1, total)
+        self.total_score = sum(self._score_values())
+
+    def set_score(self, hole: int, score: int):
+        """1부터 시작하는 홀의 스코어 설정 (총 스코어도 갱신)"""
+        if self._scores is None:
+            self._scores = compact_array(self._score_values())
+        self._scores = _store(self._scores, hole - 1, score)
+        self.total_score = sum(self._scores)
+
+    def nbytes(self) -> int:
+        """라운드가 차지하는 대략적인 메모리 (이름 문자열은 intern되어 공유하므로 제외)"""
+        size = sys.getsizeof(self) + sys.getsizeof(self._details) + sys.getsizeof(self.date)
+        for values in (self._scores, self._pars):
+            if values is not None:
+                size += sys.getsizeof(values)
+        return size
+
+    def to_dict(self) -> Dict:
+        """기존 딕셔너리 라운드와 같은 형식으로 변환 (JSON 응답용)"""
+        return {key: self[key] for key in self._keys()}
+
+    def to_row(self) -> List:
+        """Score 시트 한 행 (기본 5개 + 홀별 6개 항목)"""
+        return [self.date, self.player_name, self.course_name, self.total_score, self.handicap,
+                *self._details]
+
+    def _score_values(self):
+        if self._scores is not None:
+            return self._scores
+        return self._details[FIELD_COUNT - 1::FIELD_COUNT]
+
+    def _keys(self) -> tuple:
+        return CREATED_KEYS if self._pars is not None else LOADED_KEYS
+
+    def __getitem__(self, key: str):
+        if key in self._SCALAR_FIELDS and key in self._keys():
+            return getattr(self, key)
+        if key == 'scores':
+            return list(self._score_values())
+        if key == 'detailed_scores':
+            return [self.hole(index) for index in range(self.holes)]
+        if key == 'par_scores' and self._pars is not None:
+            return list(self._pars)
+        raise KeyError(key)
+
+    def __setitem__(self, key: str, value):
+        if key not in self._SCALAR_FIELDS or key == 'holes':
+            raise KeyError(f"{key}는 직접 바꿀 수 없습니다. set_hole()/set_score()를 사용하세요.")
+        setattr(self, key, value)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._keys())
+
+    def __len__(self) -> int:
+        return len(self._keys())
+
+    def __repr__(self) -> str:
+        return (f"GolfRound(date={self.date!r}, player_name={self.player_name!r}, "
+                f"course_name={self.course_name!r}, total_score={self.total_score})")
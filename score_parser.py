@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Score 시트 행 파서
+Fast parser for Score sheet rows
+"""
+
+from typing import List, Optional
+
+from round_model import FIELD_COUNT, GolfRound, compact_array
+
+HOLE_COUNT = 18
+BASE_COLUMNS = 5  # 날짜, 플레이어, 코스, 총 스코어, 핸디캡
+ROW_LENGTH = BASE_COLUMNS + HOLE_COUNT * FIELD_COUNT  # 113
+# 비어 있거나 숫자가 아닌 셀의 기본값 (홀마다 par 4, 나머지 0)
+DETAIL_DEFAULTS = [4, 0, 0, 0, 0, 0] * HOLE_COUNT
+
+
+def to_int(value, default: int = 0) -> int:
+    """셀 값을 정수로 변환
+
+    UNFORMATTED_VALUE 응답의 int/float, 음수('-2'), 부호('+3'), 공백(' 5 '),
+    천 단위 구분 기호('1,234'), 소수 표기('4.0')를 처리하고, 변환할 수 없으면 default
+    """
+    if type(value) is int:
+        return value
+    if type(value) is float:
+        try:
+            return int(value) if value == value else default  # NaN 제외
+        except OverflowError:  # inf
+            return default
+    if not value:
+        return default
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        pass
+    try:
+        return int(float(str(value).replace(',', '').strip()))
+    except (TypeError, ValueError, OverflowError):
+        return default
+
+
+def parse_score_row(row: List) -> Optional[GolfRound]:
+    """Score 시트 한 행을 GolfRound로 변환 (필수 5개 열이 없으면 None)
+
+    113개를 넘는 셀은 무시하고, 모자라는 홀별 셀은 기본값으로 채웁니다.
+    홀별 값이 8바이트 정수 범위를 넘는 행도 로그를 남기고 None을 반환하므로
+    잘못 입력된 셀 하나가 시트 전체 읽기를 실패시키지 않습니다.
+    """
+    if len(row) < BASE_COLUMNS:
+        return None
+
+    cells = row[BASE_COLUMNS:ROW_LENGTH]
+    try:
+        # 대부분의 행은 모든 셀이 정수(또는 정수 문자열)이므로 한 번에 변환
+        details = list(map(int, cells))
+    except (TypeError, ValueError, OverflowError):
+        details = [to_int(cell, default) for cell, default in zip(cells, DETAIL_DEFAULTS)]
+    if len(details) < len(DETAIL_DEFAULTS):
+        details.extend(DETAIL_DEFAULTS[len(details):])
+
+    try:
+        details = compact_array(details)
+    except OverflowError:
+        print(f"Score 행을 건너뜁니다 (홀별 값이 너무 큼): {row[:BASE_COLUMNS]}")
+        return None
+
+    return GolfRound(
+        str(row[0]), str(row[1]), str(row[2]), details,
+        total_score=to_int(row[3]),
+        handicap=to_int(row[4])
+    )
+
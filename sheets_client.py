@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+Google Sheets API 클라이언트 팩토리 (인증 정보 공유, HTTP 연결 풀)
+Shared Google Sheets client factory
+"""
+
+import json
+import os
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from google.auth.transport.requests import Request
+from google.oauth2.credentials import Credentials
+from google_auth_httplib2 import AuthorizedHttp
+from google_auth_oauthlib.flow import InstalledAppFlow
+from googleapiclient.discovery import build, build_from_document
+from googleapiclient.discovery_cache import get_static_doc
+from googleapiclient.http import build_http
+
+from credential_refresher import CREDENTIAL_REFRESH_MARGIN, CredentialRefresher
+
+# Google Sheets API 설정
+SCOPES = ['https://www.googleapis.com/auth/spreadsheets']
+SERVICE_POOL_SIZE = int(os.getenv('GOLF_SHEETS_POOL_SIZE', '8'))  # 동시에 열어 둘 Sheets HTTP 연결(서비스 객체) 수
+
+_discovery_document: Optional[Dict] = None
+_discovery_lock = threading.Lock()
+_shared_factory: Optional['SheetsClientFactory'] = None
+_factory_lock = threading.Lock()
+
+
+def load_credentials(scopes=None) -> Credentials:
+    """Google Sheets API 인증 정보 로드 (만료됐으면 갱신, 없으면 OAuth 인증)"""
+    scopes = scopes or SCOPES
+    creds = None
+
+    # 환경변수에서 인증 정보 확인
+    if os.getenv('GOOGLE_CREDENTIALS_JSON'):
+        # 환경변수에서 JSON 문자열로 인증 정보 받기
+        creds_data = json.loads(os.getenv('GOOGLE_CREDENTIALS_JSON'))
+        creds = Credentials.from_authorized_user_info(creds_data, scopes)
+    elif os.path.exists('token.json'):
+        # 로컬 개발용: token.json 파일이 있으면 기존 인증 정보 사용
+        creds = Credentials.from_authorized_user_file('token.json', scopes)
+
+    # 유효한 인증 정보가 없으면 새로 인증
+    if not creds or not creds.valid:
+        if creds and creds.expired and creds.refresh_token:
+            creds.refresh(Request())
+        else:
+            # 환경변수에서 credentials 정보 확인
+            if os.getenv('GOOGLE_CLIENT_ID') and os.getenv('GOOGLE_CLIENT_SECRET'):
+                # 환경변수에서 OAuth 클라이언트 정보 사용
+                client_config = {
+                    "installed": {
+                        "client_id": os.getenv('GOOGLE_CLIENT_ID'),
+                        "client_secret": os.getenv('GOOGLE_CLIENT_SECRET'),
+                        "auth_uri": "https://accounts.google.com/o/oauth2/auth",
+                        "token_uri": "https://oauth2.googleapis.com/token",
+                        "redirect_uris": ["http://localhost"]
+                    }
+                }
+                flow = InstalledAppFlow.from_client_config(client_config, scopes)
+            else:
+                # 로컬 개발용: credentials.json 파일 사용
+                flow = InstalledAppFlow.from_client_secrets_file('credentials.json', scopes)
+            creds = flow.run_local_server(port=0)
+
+        # 인증 정보를 token.json에 저장 (로컬 개발용)
+        if not os.getenv('GOOGLE_CREDENTIALS_JSON'):
+            with open('token.json', 'w') as token:
+                token.write(creds.to_json())
+
+    return creds
+
+
+def sheets_discovery_document() -> Optional[Dict]:
+    """google-api-python-client에 포함된 Sheets v4 discovery 문서 (한 번만 파싱해 재사용)
+
+    패키지에 문서가 없는 버전이면 None (build()가 네트워크에서 받아 옴)
+    """
+    global _discovery_document
+    if _discovery_document is None:
+        with _discovery_lock:
+            if _discovery_document is None:
+                document = get_static_doc('sheets', 'v4')
+                if document is None:
+                    return None
+                _discovery_document = json.loads(document)
+    return _discovery_document
+
+
+class SheetsClientFactory:
+    """인증 정보를 공유하고 제한된 크기의 풀에서 Sheets 서비스를 빌려 주는 팩토리
+
+    httplib2.Http는 스레드 안전하지 않으므로 서비스 객체(각자 HTTP 연결 하나)는 한 번에
+    한 스레드만 사용합니다. 요청마다 스레드를 새로 만드는 서버에서도 연결을 재사용하도록
+    스레드에 묶지 않고 풀에서 빌렸다가 돌려받습니다. 서비스 생성에는 미리 파싱해 둔
+    discovery 문서를 사용합니다. swap_credentials()로 인증 정보가 바뀌면 이전 인증 정보로
+    만든 서비스는 반납될 때 버리고 새로 만듭니다.
+    """
+
+    def __init__(self, credentials: Credentials = None, pool_size: int = None):
+        self._credentials = credentials
+        self._generation = 0  # 인증 정보가 교체될 때마다 증가
+        self._credentials_lock = threading.Lock()
+        self._refresher: Optional[CredentialRefresher] = None
+        self._pool = SheetsServicePool(self, pool_size or SERVICE_POOL_SIZE)
+
+    @property
+    def credentials(self) -> Credentials:
+        """공유 인증 정보 (처음 사용할 때 로드)"""
+        return self._current_credentials()[0]
+
+    @property
+    def generation(self) -> int:
+        with self._credentials_lock:
+            return self._generation
+
+    def swap_credentials(self, credentials: Credentials):
+        """공유 인증 정보를 새 객체로 교체"""
+        with self._credentials_lock:
+            self._credentials = credentials
+            self._generation += 1
+
+    def start_refresher(self, margin: float = None) -> Optional[CredentialRefresher]:
+        """만료 전에 인증 정보를 갱신하는 백그라운드 스레드 시작 (margin 0이면 시작하지 않음)"""
+        margin = CREDENTIAL_REFRESH_MARGIN if margin is None else margin
+        if margin <= 0:
+            return None
+        with self._credentials_lock:
+            if self._refresher is None:
+                self._refresher = CredentialRefresher(self, margin=margin)
+            self._refresher.start()
+            return self._refresher
+
+    def credential_stats(self) -> Optional[Dict]:
+        """백그라운드 갱신 지표 (갱신 스레드를 시작하지 않았으면 None)"""
+        if self._refresher is None:
+            return None
+        return self._refresher.stats()
+
+    def service_pool(self) -> 'SheetsServicePool':
+        """프로세스 공유 서비스 풀 (SheetsBackend에 서비스 대신 넘김)"""
+        return self._pool
+
+    def pool_stats(self) -> Dict:
+        return self._pool.stats()
+
+    def new_service(self) -> Tuple[int, object]:
+        """현재 인증 정보로 새 HTTP 연결의 서비스 생성 (인증 정보 세대와 함께 반환)"""
+        credentials, generation = self._current_credentials()
+        return generation, self._build_service(credentials)
+
+    def _current_credentials(self) -> Tuple[Credentials, int]:
+        """인증 정보와 교체 세대를 함께 읽기 (처음 사용할 때 로드)"""
+        with self._credentials_lock:
+            if self._credentials is None:
+                self._credentials = load_credentials()
+            return self._credentials, self._generation
+
+    def _build_service(self, credentials: Credentials):
+        http = AuthorizedHttp(credentials, http=build_http())
+        document = sheets_discovery_document()
+        if document is None:
+            return build('sheets', 'v4', http=http, cache_discovery=False)
+        return build_from_document(document, http=http)
+
+
+class SheetsServicePool:
+    """최대 size개의 Sheets 서비스를 빌려 주고 돌려받는 풀
+
+    with pool.lease() as service: 블록 안에서만 서비스를 사용합니다. 모두 사용 중이면
+    다른 스레드가 반납할 때까지 기다리므로 열린 연결 수는 size를 넘지 않습니다.
+    """
+
+    def __init__(self, factory: SheetsClientFactory, size: int):
+        self.factory = factory
+        self.size = max(1, size)
+        self._idle: List[Tuple[int, object]] = []  # (인증 정보 세대, 서비스), 최근 반납한 것이 뒤
+        self._created = 0  # 현재 풀에 속한 (사용 중 + 대기) 서비스 수
+        self._condition = threading.Condition()
+        self._leases = 0
+        self._waits = 0
+        self._builds = 0
+
+    @contextmanager
+    def lease(self) -> Iterator[object]:
+        """서비스 하나를 빌려 블록이 끝나면 반납 (끊어진 연결은 httplib2가 다음 요청 때 다시 연결)"""
+        entry = self._checkout()
+        try:
+            yield entry[1]
+        finally:
+            self._checkin(entry)
+
+    def stats(self) -> Dict:
+        with self._condition:
+            return {
+                'size': self.size,
+                'open': self._created,
+                'idle': len(self._idle),
+                'leases': self._leases,
+                'waits': self._waits,
+                'builds': self._builds
+            }
+
+    def _checkout(self) -> Tuple[int, object]:
+        generation = self.factory.generation
+        with self._condition:
+            self._leases += 1
+            waited = False
+            while True:
+                while self._idle:
+                    entry = self._idle.pop()
+                    if entry[0] == generation:
+                        return entry
+                    self._created -= 1  # 인증 정보가 바뀌기 전에 만든 서비스는 버림
+                if self._created < self.size:
+                    self._created += 1
+                    self._builds += 1
+                    break
+                if not waited:
+                    self._waits += 1
+                    waited = True
+                self._condition.wait()
+        try:
+            return self.factory.new_service()
+        except BaseException:
+            self._discard()
+            raise
+
+    def _checkin(self, entry: Tuple[int, object]):
+        with self._condition:
+            if entry[0] == self.factory.generation:
+                self._idle.append(entry)
+            else:
+                self._created -= 1
+            self._condition.notify()
+
+    def _discard(self):
+        with self._condition:
+            self._created -= 1
+            self._condition.notify()
+
+
+def get_client_factory() -> SheetsClientFactory:
+    """프로세스 전체에서 공유하는 클라이언트 팩토리"""
+    global _shared_factory
+    if _shared_factory is None:
+        with _factory_lock:
+            if _shared_factory is None:
+                _shared_factory = SheetsClientFactory()
+    return _shared_factory
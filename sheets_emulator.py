@@ -0,0 +1,315 @@
+#!/usr/bin/env python3
+"""
+메모리 기반 Google Sheets v4 에뮬레이터 (지연/할당량 오류 주입)
+In-memory Google Sheets v4 emulator with injectable latency and quota errors
+
+build('sheets', 'v4')로 만든 서비스 대신 SheetsBackend에 넣어 Google 계정 없이
+GolfScoreManager/UserManager를 실행하거나 성능을 측정할 때 사용합니다.
+
+    emulator = SheetsEmulator(latency=0.05, error_rate=0.01)
+    manager = GolfScoreManager('bench', backend=emulator.backend('bench'))
+"""
+
+import json
+import os
+import random
+import re
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+import httplib2
+from googleapiclient.errors import HttpError
+
+from quota_scheduler import QuotaScheduler
+from storage import SheetsBackend, column_letter, parse_a1_range
+
+DEFAULT_SHEETS = ('Score', 'Member')
+DEFAULT_ROW_COUNT = 1000  # 새 시트의 격자 행 수 (Google Sheets 기본값)
+EMULATOR_LATENCY_MS = float(os.getenv('GOLF_EMULATOR_LATENCY_MS', '0'))
+EMULATOR_ERROR_RATE = float(os.getenv('GOLF_EMULATOR_ERROR_RATE', '0'))
+
+_INT_PATTERN = re.compile(r'^[+-]?\d+$')
+_FLOAT_PATTERN = re.compile(r'^[+-]?(\d+\.\d*|\.\d+)$')
+
+_shared_emulator: Optional['SheetsEmulator'] = None
+_shared_lock = threading.Lock()
+
+
+def quota_error(status: int = 429, message: str = 'Quota exceeded') -> HttpError:
+    """Sheets API와 같은 형식의 HttpError"""
+    content = json.dumps({'error': {'code': status, 'message': message,
+                                    'status': 'RESOURCE_EXHAUSTED' if status == 429 else 'UNAVAILABLE'}})
+    return HttpError(httplib2.Response({'status': status}), content.encode('utf-8'), uri='emulator')
+
+
+def _user_entered(value):
+    """USER_ENTERED 입력처럼 숫자 문자열은 숫자로 저장"""
+    if isinstance(value, str):
+        text = value.strip()
+        if _INT_PATTERN.match(text):
+            return int(text)
+        if _FLOAT_PATTERN.match(text):
+            return float(text)
+        return value
+    if value is None:
+        return ''
+    return value
+
+
+def _formatted(value):
+    """FORMATTED_VALUE 응답처럼 문자열로 변환"""
+    if isinstance(value, bool):
+        return 'TRUE' if value else 'FALSE'
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+
+class _Request:
+    """googleapiclient HttpRequest처럼 execute()로 실행되는 요청"""
+
+    def __init__(self, emulator: 'SheetsEmulator', method: str, func: Callable[[], Dict]):
+        self._emulator = emulator
+        self._method = method
+        self._func = func
+
+    def execute(self, num_retries: int = 0) -> Dict:
+        return self._emulator._execute(self._method, self._func)
+
+
+class _ValuesResource:
+    def __init__(self, emulator: 'SheetsEmulator'):
+        self._emulator = emulator
+
+    def get(self, spreadsheetId: str, range: str, valueRenderOption: str = 'FORMATTED_VALUE',
+            dateTimeRenderOption: str = None, **kwargs) -> _Request:
+        emulator = self._emulator
+        return _Request(emulator, 'values.get',
+                        lambda: emulator._get(spreadsheetId, range, valueRenderOption))
+
+    def batchGet(self, spreadsheetId: str, ranges: Sequence[str], valueRenderOption: str = 'FORMATTED_VALUE',
+                 dateTimeRenderOption: str = None, **kwargs) -> _Request:
+        emulator = self._emulator
+        return _Request(emulator, 'values.batchGet', lambda: {
+            'spreadsheetId': spreadsheetId,
+            'valueRanges': [emulator._get(spreadsheetId, range_name, valueRenderOption)
+                            for range_name in ranges]
+        })
+
+    def append(self, spreadsheetId: str, range: str, body: Dict, valueInputOption: str = 'RAW',
+               **kwargs) -> _Request:
+        emulator = self._emulator
+        return _Request(emulator, 'values.append',
+                        lambda: emulator._append(spreadsheetId, range, body.get('values', []), valueInputOption))
+
+    def update(self, spreadsheetId: str, range: str, body: Dict, valueInputOption: str = 'RAW',
+               **kwargs) -> _Request:
+        emulator = self._emulator
+        return _Request(emulator, 'values.update',
+                        lambda: emulator._update(spreadsheetId, range, body.get('values', []), valueInputOption))
+
+    def batchUpdate(self, spreadsheetId: str, body: Dict, **kwargs) -> _Request:
+        emulator = self._emulator
+        value_input = body.get('valueInputOption', 'RAW')
+
+        def run():
+            responses = [emulator._update(spreadsheetId, data['range'], data.get('values', []), value_input)
+                         for data in body.get('data', [])]
+            return {'spreadsheetId': spreadsheetId, 'totalUpdatedCells':
+                    sum(response['updatedCells'] for response in responses), 'responses': responses}
+        return _Request(emulator, 'values.batchUpdate', run)
+
+
+class _SpreadsheetsResource:
+    def __init__(self, emulator: 'SheetsEmulator'):
+        self._emulator = emulator
+
+    def get(self, spreadsheetId: str, fields: str = None, **kwargs) -> _Request:
+        emulator = self._emulator
+        return _Request(emulator, 'spreadsheets.get', lambda: emulator._metadata(spreadsheetId))
+
+    def values(self) -> _ValuesResource:
+        return _ValuesResource(self._emulator)
+
+
+class _Sheet:
+    """시트 한 장: 행 목록과 격자 행 수"""
+
+    __slots__ = ('rows', 'row_count')
+
+    def __init__(self, row_count: int):
+        self.rows: List[List] = []
+        self.row_count = row_count
+
+    def last_data_row(self) -> int:
+        """값이 있는 마지막 행 번호 (없으면 0)"""
+        end = len(self.rows)
+        while end and not any(cell != '' for cell in self.rows[end - 1]):
+            end -= 1
+        return end
+
+
+class SheetsEmulator:
+    """Sheets v4 values API(get/batchGet/append/update/batchUpdate)와 시트 크기 조회를 흉내 내는 서비스
+
+    latency: 요청마다 기다릴 시간(초) 또는 (최소, 최대) 범위
+    error_rate: 요청이 429 할당량 오류로 실패할 확률 (0~1)
+    fail_next(): 다음 요청 몇 개를 지정한 상태 코드로 실패시킴
+    """
+
+    def __init__(self, latency: Union[float, Tuple[float, float]] = None, error_rate: float = None,
+                 sheets: Sequence[str] = DEFAULT_SHEETS, row_count: int = DEFAULT_ROW_COUNT, seed: int = None):
+        self.latency = EMULATOR_LATENCY_MS / 1000 if latency is None else latency
+        self.error_rate = EMULATOR_ERROR_RATE if error_rate is None else error_rate
+        self.default_sheets = tuple(sheets)
+        self.default_row_count = row_count
+        self._spreadsheets: Dict[str, Dict[str, _Sheet]] = {}
+        self._lock = threading.Lock()
+        self._random = random.Random(seed)
+        self._forced_failures: List[int] = []
+
+        # 지표
+        self.calls: Dict[str, int] = {}
+        self.injected_errors = 0
+
+    def spreadsheets(self) -> _SpreadsheetsResource:
+        return _SpreadsheetsResource(self)
+
+    def backend(self, spreadsheet_id: str = 'emulator', scheduler: QuotaScheduler = None) -> SheetsBackend:
+        """이 에뮬레이터를 사용하는 SheetsBackend (Manager의 backend 인자로 전달)
+
+        scheduler를 주지 않으면 할당량 제한 없이 429/5xx 재시도만 하는 스케줄러를 사용합니다.
+        """
+        return SheetsBackend(self, spreadsheet_id,
+                             scheduler or QuotaScheduler(read_per_minute=0, write_per_minute=0))
+
+    def fail_next(self, count: int = 1, status: int = 429):
+        """다음 count개 요청을 status 오류로 실패시킴"""
+        with self._lock:
+            self._forced_failures.extend([status] * count)
+
+    def load_rows(self, spreadsheet_id: str, sheet: str, rows: List[List], start_row: int = 1,
+                  value_input: str = 'USER_ENTERED'):
+        """지연/오류 없이 시트에 행을 바로 채움 (벤치마크 준비용, 숫자를 그대로 넣으려면 RAW)"""
+        with self._lock:
+            target = self._sheet(spreadsheet_id, sheet)
+            self._write_rows(target, start_row, 0, rows, value_input)
+
+    def reset_stats(self):
+        with self._lock:
+            self.calls = {}
+            self.injected_errors = 0
+
+    def stats(self) -> Dict:
+        """메서드별 호출 수와 주입한 오류 수"""
+        with self._lock:
+            return {'calls': dict(self.calls), 'injected_errors': self.injected_errors}
+
+    # ===== 요청 처리 =====
+
+    def _execute(self, method: str, func: Callable[[], Dict]) -> Dict:
+        with self._lock:
+            self.calls[method] = self.calls.get(method, 0) + 1
+            status = self._forced_failures.pop(0) if self._forced_failures else None
+            if status is None and self.error_rate and self._random.random() < self.error_rate:
+                status = 429
+            if status is not None:
+                self.injected_errors += 1
+            delay = self._random.uniform(*self.latency) if isinstance(self.latency, tuple) else self.latency
+
+        if delay:
+            time.sleep(delay)
+        if status is not None:
+            raise quota_error(status, 'Quota exceeded' if status == 429 else 'Injected error')
+        with self._lock:
+            return func()
+
+    def _get(self, spreadsheet_id: str, range_name: str, render_option: str) -> Dict:
+        sheet_name, first_column, last_column, first_row, last_row = parse_a1_range(range_name)
+        sheet = self._sheet(spreadsheet_id, sheet_name)
+        if first_row > sheet.row_count or (last_row is not None and last_row > sheet.row_count):
+            raise quota_error(400, f'Range ({range_name}) exceeds grid limits. Max rows: {sheet.row_count}')
+
+        end_row = min(last_row or sheet.row_count, len(sheet.rows))
+        convert = (lambda value: value) if render_option == 'UNFORMATTED_VALUE' else _formatted
+        values = []
+        for row in sheet.rows[first_row - 1:end_row]:
+            cells = row[first_column:] if last_column is None else row[first_column:last_column + 1]
+            end = len(cells)
+            while end and cells[end - 1] == '':
+                end -= 1
+            values.append([convert(cell) for cell in cells[:end]])
+        while values and not values[-1]:
+            values.pop()
+
+        result = {'range': range_name, 'majorDimension': 'ROWS'}
+        if values:
+            result['values'] = values
+        return result
+
+    def _append(self, spreadsheet_id: str, range_name: str, rows: List[List], value_input: str) -> Dict:
+        sheet_name, first_column, _, _, _ = parse_a1_range(range_name)
+        sheet = self._sheet(spreadsheet_id, sheet_name)
+        start_row = sheet.last_data_row() + 1
+        self._write_rows(sheet, start_row, first_column, rows, value_input)
+        end_row = start_row + len(rows) - 1
+        width = max((len(row) for row in rows), default=1)
+        updated_range = (f'{sheet_name}!{column_letter(first_column + 1)}{start_row}:'
+                         f'{column_letter(first_column + width)}{end_row}')
+        return {
+            'spreadsheetId': spreadsheet_id,
+            'tableRange': f'{sheet_name}!A1:{column_letter(first_column + width)}{start_row - 1}',
+            'updates': {'updatedRange': updated_range, 'updatedRows': len(rows),
+                        'updatedCells': sum(len(row) for row in rows)}
+        }
+
+    def _update(self, spreadsheet_id: str, range_name: str, rows: List[List], value_input: str) -> Dict:
+        sheet_name, first_column, _, first_row, _ = parse_a1_range(range_name)
+        sheet = self._sheet(spreadsheet_id, sheet_name)
+        self._write_rows(sheet, first_row, first_column, rows, value_input)
+        return {'spreadsheetId': spreadsheet_id, 'updatedRange': range_name,
+                'updatedRows': len(rows), 'updatedCells': sum(len(row) for row in rows)}
+
+    def _metadata(self, spreadsheet_id: str) -> Dict:
+        sheets = self._spreadsheet(spreadsheet_id)
+        return {'sheets': [{'properties': {'title': title, 'gridProperties': {'rowCount': sheet.row_count}}}
+                           for title, sheet in sheets.items()]}
+
+    def _write_rows(self, sheet: _Sheet, start_row: int, first_column: int, rows: List[List], value_input: str):
+        convert = _user_entered if value_input == 'USER_ENTERED' else (lambda value: '' if value is None else value)
+        needed = start_row - 1 + len(rows)
+        if len(sheet.rows) < needed:
+            sheet.rows.extend([] for _ in range(needed - len(sheet.rows)))
+        sheet.row_count = max(sheet.row_count, needed)  # append/update는 격자를 늘림
+
+        for offset, values in enumerate(rows):
+            row = sheet.rows[start_row - 1 + offset]
+            end = first_column + len(values)
+            if len(row) < end:
+                row.extend([''] * (end - len(row)))
+            row[first_column:end] = [convert(value) for value in values]
+
+    def _spreadsheet(self, spreadsheet_id: str) -> Dict[str, _Sheet]:
+        sheets = self._spreadsheets.get(spreadsheet_id)
+        if sheets is None:
+            sheets = self._spreadsheets[spreadsheet_id] = {
+                title: _Sheet(self.default_row_count) for title in self.default_sheets
+            }
+        return sheets
+
+    def _sheet(self, spreadsheet_id: str, sheet_name: str) -> _Sheet:
+        sheet = self._spreadsheet(spreadsheet_id).get(sheet_name)
+        if sheet is None:
+            raise quota_error(400, f'Unable to parse range: {sheet_name}')
+        return sheet
+
+
+def shared_emulator() -> SheetsEmulator:
+    """GOLF_STORAGE_BACKEND=emulator일 때 프로세스 전체에서 공유하는 에뮬레이터"""
+    global _shared_emulator
+    if _shared_emulator is None:
+        with _shared_lock:
+            if _shared_emulator is None:
+                _shared_emulator = SheetsEmulator()
+    return _shared_emulator
@@ -4,6 +4,7 @@ class GolfScoreApp {
     constructor() {
         this.currentTab = 'score-input';
         this.rounds = [];
+        this.nextCursor = null;
         this.currentUser = null;
         this.init();
     }
@@ -24,6 +25,15 @@ class GolfScoreApp {
             this.loadRounds();
         });
 
+        // 라운드 조회 조건 / 다음 페이지
+        document.getElementById('filter-rounds').addEventListener('click', () => {
+            this.loadRounds();
+        });
+
+        document.getElementById('more-rounds').addEventListener('click', () => {
+            this.loadRounds(false);
+        });
+
         // 통계 조회 버튼
         document.getElementById('get-stats').addEventListener('click', () => {
             this.getPlayerStatistics();
@@ -655,21 +665,37 @@ class GolfScoreApp {
         }
     }
 
-    async loadRounds() {
+    async loadRounds(reset = true) {
         if (!this.currentUser) {
             return;
         }
 
+        // 조회 조건 (reset이 아니면 이전 응답의 next_cursor로 다음 페이지 요청)
+        const params = new URLSearchParams();
+        const dateFrom = document.getElementById('rounds-from').value;
+        const dateTo = document.getElementById('rounds-to').value;
+        const course = document.getElementById('rounds-course').value.trim();
+        if (dateFrom) params.set('from', dateFrom);
+        if (dateTo) params.set('to', dateTo);
+        if (course) params.set('course', course);
+        if (!reset && this.nextCursor) params.set('cursor', this.nextCursor);
+
         try {
-            const response = await fetch('/api/rounds', {
+            const query = params.toString();
+            const response = await fetch(query ? `/api/rounds?${query}` : '/api/rounds', {
                 method: 'GET',
                 credentials: 'include'
             });
 
             if (response.ok) {
                 const data = await response.json();
-                this.rounds = data.rounds || [];
+                const rounds = data.rounds || [];
+                this.rounds = reset ? rounds : this.rounds.concat(rounds);
+                this.nextCursor = data.next_cursor || null;
                 this.displayRounds();
+            } else if (response.status === 400) {
+                const data = await response.json();
+                this.showNotification(data.error || '조회 조건이 올바르지 않습니다.', 'error');
             } else {
                 console.error('라운드 로드 실패:', response.statusText);
             }
@@ -681,6 +707,7 @@ class GolfScoreApp {
     displayRounds() {
         const tbody = document.getElementById('rounds-tbody');
         tbody.innerHTML = '';
+        document.getElementById('more-rounds').style.display = this.nextCursor ? '' : 'none';
 
         if (this.rounds.length === 0) {
             tbody.innerHTML = '<tr><td colspan="6" style="text-align: center; color: #6c757d;">저장된 라운드 기록이 없습니다.</td></tr>';
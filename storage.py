@@ -0,0 +1,492 @@
+#!/usr/bin/env python3
+"""
+저장소 백엔드 모듈 (Google Sheets / 로컬 SQLite)
+Storage backends: Google Sheets and local SQLite
+"""
+
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from googleapiclient.errors import HttpError
+
+from metrics import observe_sheets_call
+from quota_scheduler import QuotaScheduler, current_priority, get_quota_scheduler
+
+# 저장소 선택: sheets(기본), sqlite 또는 emulator(메모리 Sheets 에뮬레이터)
+STORAGE_BACKEND = os.getenv('GOLF_STORAGE_BACKEND', 'sheets').lower()
+SQLITE_PATH = os.getenv('GOLF_SQLITE_PATH', 'golf_score_manager.db')
+
+# 페이지 단위 읽기 설정: 한 범위에 담을 행 수와 batchGet 한 번에 묶을 범위 수
+READ_PAGE_ROWS = int(os.getenv('GOLF_READ_PAGE_ROWS', '1000'))
+READ_CONCURRENCY = int(os.getenv('GOLF_READ_CONCURRENCY', '4'))
+ROW_COUNT_CACHE_TTL = 60  # 시트 크기(행 수) 조회 결과를 재사용하는 시간 (초)
+
+# SQLite 테이블 구성: 시트 이름 -> (테이블 이름, 앞쪽 열 이름)
+# 정의한 열보다 뒤에 있는 셀(홀별 상세 스코어 등)은 extra 열에 JSON 배열로 저장합니다.
+# 모든 조회가 row_number(기본 키) 범위로 이루어지므로 다른 열에는 인덱스를 만들지 않습니다.
+SQLITE_TABLES = {
+    'Score': ('score_rows', ['date', 'player_name', 'course_name', 'total_score', 'handicap']),
+    'Member': ('member_rows', ['user_id', 'username', 'email', 'password_hash', 'created_at', 'last_login']),
+}
+
+_A1_PATTERN = re.compile(r'^(?:(?P<sheet>[^!]+)!)?(?P<c1>[A-Z]+)(?P<r1>\d+)?(?::(?P<c2>[A-Z]+)(?P<r2>\d+)?)?$')
+_ROW_RANGE_PATTERN = re.compile(r'^(?P<r1>\d+):(?P<r2>\d+)$')
+
+
+class StorageError(Exception):
+    """저장소 읽기/쓰기 오류 (status: HTTP 상태 코드, 알 수 없으면 None)"""
+
+    def __init__(self, message: str, status: int = None):
+        super().__init__(message)
+        self.status = status
+
+
+class QuotaExhausted(StorageError):
+    """할당량이 부족해 요청을 보내지 않음 (호출자는 이미 가진 데이터를 대신 사용할 수 있음)"""
+
+    def __init__(self, message: str):
+        super().__init__(message, status=429)
+
+
+def storage_backend_name() -> str:
+    """환경변수로 선택된 저장소 이름"""
+    return STORAGE_BACKEND
+
+
+def column_number(letters: str) -> int:
+    """열 문자를 1부터 시작하는 번호로 변환 (A=1, DI=113)"""
+    number = 0
+    for letter in letters:
+        number = number * 26 + ord(letter) - ord('A') + 1
+    return number
+
+
+def column_letter(number: int) -> str:
+    """1부터 시작하는 열 번호를 열 문자로 변환 (1=A, 113=DI)"""
+    letters = ''
+    while number > 0:
+        number, remainder = divmod(number - 1, 26)
+        letters = chr(ord('A') + remainder) + letters
+    return letters
+
+
+def parse_a1_range(range_name: str) -> Tuple[str, int, Optional[int], int, Optional[int]]:
+    """'Score!A2:DI1000' 형식 범위를 (시트, 시작 열, 끝 열, 시작 행, 끝 행)으로 분리
+
+    열 번호는 0부터 시작하며 끝 열/끝 행이 없으면 None (시트 끝까지)
+    'Score!1:1' 처럼 행 전체를 지정하면 열 범위는 (0, None)
+    """
+    sheet, _, cells = range_name.rpartition('!')
+    row_match = _ROW_RANGE_PATTERN.match(cells)
+    if row_match:
+        return sheet, 0, None, int(row_match.group('r1')), int(row_match.group('r2'))
+
+    match = _A1_PATTERN.match(f'{sheet}!{cells}' if sheet else cells)
+    if not match:
+        raise StorageError(f"지원하지 않는 범위 형식입니다: {range_name}")
+
+    first_column = column_number(match.group('c1')) - 1
+    first_row = int(match.group('r1') or 1)
+    if match.group('c2'):
+        last_column = column_number(match.group('c2')) - 1
+        last_row = int(match.group('r2')) if match.group('r2') else None
+    else:
+        # 'Member!F5' 처럼 셀 하나만 지정한 경우
+        last_column = first_column
+        last_row = first_row if match.group('r1') else None
+    return sheet, first_column, last_column, first_row, last_row
+
+
+def parse_updated_row(append_result: Dict) -> Optional[int]:
+    """append 응답의 updatedRange(예: 'Member!A5:F5')에서 시작 행 번호 추출"""
+    updated_range = append_result.get('updates', {}).get('updatedRange', '')
+    cells = updated_range.split('!')[-1].split(':')[0]
+    digits = ''.join(ch for ch in cells if ch.isdigit())
+    return int(digits) if digits else None
+
+
+class StorageBackend:
+    """시트 값 읽기/쓰기 인터페이스
+
+    Google Sheets values API와 같은 A1 범위 단위로 동작하며 행 번호는 헤더가 1행인
+    시트 기준입니다. 읽은 셀 값은 문자열이고 뒤쪽의 빈 셀은 생략됩니다.
+    unformatted=True로 읽으면 숫자 셀을 표시 형식 없이 int/float로 받을 수 있습니다
+    (지원하지 않는 백엔드는 문자열 그대로 반환하므로 호출하는 쪽에서 둘 다 처리해야 함).
+    """
+
+    name = 'base'
+
+    def get(self, range_name: str, unformatted: bool = False) -> List[List]:
+        """범위의 셀 값 읽기"""
+        raise NotImplementedError
+
+    def batch_get(self, range_names: Sequence[str], unformatted: bool = False) -> List[List[List]]:
+        """여러 범위를 한 번에 읽기"""
+        return [self.get(range_name, unformatted) for range_name in range_names]
+
+    def row_count(self, sheet: str) -> int:
+        """시트에서 읽을 수 있는 마지막 행 번호 (시트 격자 크기 이상)"""
+        raise NotImplementedError
+
+    def iter_rows(self, sheet: str, last_column: str, start_row: int = 1,
+                  page_rows: int = None, concurrency: int = None,
+                  unformatted: bool = False) -> Iterator[Tuple[int, List]]:
+        """start_row부터 시트 끝까지 (행 번호, 셀 목록)을 차례로 반환
+
+        시트를 page_rows행 단위 블록으로 나누고 concurrency개 블록을 batch_get 한 번으로
+        함께 읽습니다. 블록을 받는 대로 행을 내보내므로 전체를 메모리에 모으지 않습니다.
+        중간의 빈 행은 빈 목록으로, 마지막 데이터 행 뒤의 빈 행은 반환하지 않습니다.
+        """
+        page_rows = max(1, page_rows or READ_PAGE_ROWS)
+        concurrency = max(1, concurrency or READ_CONCURRENCY)
+        total_rows = self.row_count(sheet)
+        blocks = [(first_row, min(first_row + page_rows - 1, total_rows))
+                  for first_row in range(start_row, total_rows + 1, page_rows)]
+
+        for wave_start in range(0, len(blocks), concurrency):
+            wave = blocks[wave_start:wave_start + concurrency]
+            results = self.batch_get([f'{sheet}!A{first_row}:{last_column}{last_row}'
+                                      for first_row, last_row in wave], unformatted)
+            for (first_row, _), rows in zip(wave, results):
+                for offset, row in enumerate(rows):
+                    yield first_row + offset, row
+
+    def append(self, range_name: str, rows: List[List]) -> Optional[int]:
+        """범위의 표 끝에 행 추가 후 첫 번째로 추가된 행 번호 반환 (알 수 없으면 None)"""
+        raise NotImplementedError
+
+    def update(self, range_name: str, rows: List[List]):
+        """범위 시작 셀부터 값 덮어쓰기"""
+        raise NotImplementedError
+
+    def batch_update(self, data: List[Tuple[str, List[List]]]):
+        """(범위, 값) 목록을 한 번에 덮어쓰기"""
+        for range_name, rows in data:
+            self.update(range_name, rows)
+
+    def close(self):
+        """연결 정리"""
+
+
+class SheetsBackend(StorageBackend):
+    """Google Sheets values API 백엔드
+
+    service는 build('sheets', 'v4')로 만든 서비스(또는 같은 형태의 에뮬레이터)이거나
+    lease()로 서비스를 빌려 주는 풀(sheets_client.SheetsServicePool)입니다. 풀이면
+    요청 하나를 보내는 동안에만 서비스를 빌리므로 여러 스레드가 연결을 나눠 씁니다.
+    """
+
+    name = 'sheets'
+    write_methods = frozenset({'values.append', 'values.update', 'values.batchUpdate'})
+
+    def __init__(self, service, spreadsheet_id: str, scheduler: QuotaScheduler = None):
+        self.service = service
+        self.spreadsheet_id = spreadsheet_id
+        self.scheduler = scheduler or get_quota_scheduler()
+        self._row_counts = {}  # 시트 이름 -> (격자 행 수, 조회 시각)
+
+    def row_count(self, sheet: str) -> int:
+        """시트 격자의 행 수 (격자 밖 범위를 요청하면 API 오류가 나므로 먼저 확인)"""
+        cached = self._row_counts.get(sheet)
+        if cached and time.monotonic() - cached[1] < ROW_COUNT_CACHE_TTL:
+            return cached[0]
+
+        result = self._execute('spreadsheets.get', lambda service: service.spreadsheets().get(
+            spreadsheetId=self.spreadsheet_id,
+            fields='sheets.properties(title,gridProperties.rowCount)'
+        ))
+        for sheet_info in result.get('sheets', []):
+            properties = sheet_info.get('properties', {})
+            if properties.get('title') == sheet:
+                row_count = properties.get('gridProperties', {}).get('rowCount', 0)
+                self._row_counts[sheet] = (row_count, time.monotonic())
+                return row_count
+        raise StorageError(f"스프레드시트에 {sheet} 시트가 없습니다.")
+
+    def get(self, range_name: str, unformatted: bool = False) -> List[List]:
+        result = self._execute('values.get', lambda service: service.spreadsheets().values().get(
+            spreadsheetId=self.spreadsheet_id,
+            range=range_name,
+            **self._render_options(unformatted)
+        ))
+        return result.get('values', [])
+
+    def batch_get(self, range_names: Sequence[str], unformatted: bool = False) -> List[List[List]]:
+        result = self._execute('values.batchGet', lambda service: service.spreadsheets().values().batchGet(
+            spreadsheetId=self.spreadsheet_id,
+            ranges=list(range_names),
+            **self._render_options(unformatted)
+        ))
+        return [value_range.get('values', []) for value_range in result.get('valueRanges', [])]
+
+    def append(self, range_name: str, rows: List[List]) -> Optional[int]:
+        result = self._execute('values.append', lambda service: service.spreadsheets().values().append(
+            spreadsheetId=self.spreadsheet_id,
+            range=range_name,
+            valueInputOption='USER_ENTERED',
+            body={'values': rows}
+        ))
+        # 추가된 행이 격자를 늘렸을 수 있으므로 행 수 캐시를 비움
+        self._row_counts.pop(range_name.split('!')[0], None)
+        return parse_updated_row(result)
+
+    def update(self, range_name: str, rows: List[List]):
+        self._execute('values.update', lambda service: service.spreadsheets().values().update(
+            spreadsheetId=self.spreadsheet_id,
+            range=range_name,
+            valueInputOption='USER_ENTERED',
+            body={'values': rows}
+        ))
+
+    def batch_update(self, data: List[Tuple[str, List[List]]]):
+        body = {
+            'valueInputOption': 'USER_ENTERED',
+            'data': [{'range': range_name, 'values': rows} for range_name, rows in data]
+        }
+        self._execute('values.batchUpdate', lambda service: service.spreadsheets().values().batchUpdate(
+            spreadsheetId=self.spreadsheet_id,
+            body=body
+        ))
+
+    def _render_options(self, unformatted: bool) -> Dict:
+        """숫자는 서식 없는 값으로, 날짜는 표시 문자열로 받는 읽기 옵션"""
+        if not unformatted:
+            return {}
+        return {'valueRenderOption': 'UNFORMATTED_VALUE', 'dateTimeRenderOption': 'FORMATTED_STRING'}
+
+    @contextmanager
+    def _service(self):
+        """요청 하나에 사용할 서비스 (풀이면 빌렸다가 반납)"""
+        lease = getattr(self.service, 'lease', None)
+        if lease is None:
+            yield self.service
+            return
+        with lease() as service:
+            yield service
+
+    def _execute(self, method: str, build_request: Callable) -> Dict:
+        """할당량 스케줄러를 거쳐 요청 실행 (429/5xx는 백오프 후 재시도)
+
+        build_request(service)로 요청을 만들며, 재시도를 기다리는 동안에는 서비스를 반납합니다.
+        할당량을 얻지 못하면 QuotaExhausted, 재시도 뒤에도 실패하면 StorageError를 던집니다.
+        """
+        write = method in self.write_methods
+        priority = current_priority(write)
+        attempt = 0
+        while True:
+            if not self.scheduler.acquire(write, priority):
+                raise QuotaExhausted(f"Sheets {'쓰기' if write else '읽기'} 할당량이 부족해 {method} 요청을 보내지 않았습니다.")
+            try:
+                with self._service() as service:
+                    return self._execute_once(method, build_request(service))
+            except StorageError as error:
+                delay = self.scheduler.retry_delay(method, error.status, attempt, write, priority)
+                if delay is None:
+                    raise
+                print(f"Sheets {method} 요청 실패 ({error.status}), {delay:.1f}초 뒤 재시도합니다.")
+                time.sleep(delay)
+                attempt += 1
+
+    def _execute_once(self, method: str, request) -> Dict:
+        """요청 한 번 실행 (HttpError는 StorageError로 변환), 호출 시간/상태/본문 크기를 지표에 기록"""
+        received = []
+        postproc = getattr(request, 'postproc', None)
+        if postproc is not None:
+            # 응답 본문은 HttpRequest가 파싱하기 직전에 크기만 기록 (다시 직렬화하지 않음)
+            def measure(response, content):
+                received.append(len(content))
+                return postproc(response, content)
+            request.postproc = measure
+        body = getattr(request, 'body', None)
+        status = 'error'
+        started = time.perf_counter()
+        try:
+            result = request.execute()
+            status = '200'
+            return result
+        except HttpError as error:
+            status = str(error.resp.status)
+            raise StorageError(str(error), status=error.resp.status) from error
+        finally:
+            sent = len(body.encode('utf-8') if isinstance(body, str) else body) if body else 0
+            observe_sheets_call(method, time.perf_counter() - started, status, sent, sum(received))
+
+
+class SQLiteBackend(StorageBackend):
+    """로컬 SQLite 백엔드 (WAL 모드, 스레드별 연결)
+
+    시트 한 장을 테이블 하나로 저장하며 row_number 열이 시트 행 번호입니다.
+    """
+
+    name = 'sqlite'
+
+    def __init__(self, path: str = None, tables: Dict = None):
+        self.path = path or SQLITE_PATH
+        self.tables = tables or SQLITE_TABLES
+        self._local = threading.local()
+        self._connections = []
+        self._connections_lock = threading.Lock()
+        self._create_tables()
+
+    def get(self, range_name: str, unformatted: bool = False) -> List[List]:
+        sheet, first_column, last_column, first_row, last_row = parse_a1_range(range_name)
+        table, columns = self._table(sheet)
+        query = f"SELECT row_number, {', '.join(columns)}, extra FROM {table} WHERE row_number >= ?"
+        params = [first_row]
+        if last_row is not None:
+            query += " AND row_number <= ?"
+            params.append(last_row)
+        query += " ORDER BY row_number"
+
+        values = []
+        for record in self._connection().execute(query, params):
+            # 시트처럼 중간의 빈 행은 빈 목록으로 채움 (iter_rows가 위치로 행 번호를 계산)
+            values.extend([] for _ in range(record[0] - first_row - len(values)))
+            cells = self._record_to_cells(record[1:], len(columns))
+            cells = cells[first_column:] if last_column is None else cells[first_column:last_column + 1]
+            values.append(self._trim(cells))
+        while values and not values[-1]:
+            values.pop()
+        return values
+
+    def row_count(self, sheet: str) -> int:
+        table, _ = self._table(sheet)
+        return self._connection().execute(f"SELECT MAX(row_number) FROM {table}").fetchone()[0] or 0
+
+    def append(self, range_name: str, rows: List[List]) -> Optional[int]:
+        sheet, first_column, _, _, _ = parse_a1_range(range_name)
+        table, columns = self._table(sheet)
+        with self._write_transaction() as connection:
+            last_row = connection.execute(f"SELECT MAX(row_number) FROM {table}").fetchone()[0] or 0
+            records = [
+                (last_row + offset + 1, *self._cells_to_record([''] * first_column + list(row), len(columns)))
+                for offset, row in enumerate(rows)
+            ]
+            connection.executemany(
+                f"INSERT INTO {table} (row_number, {', '.join(columns)}, extra) "
+                f"VALUES ({', '.join('?' * (len(columns) + 2))})",
+                records
+            )
+        return last_row + 1
+
+    def update(self, range_name: str, rows: List[List]):
+        self.batch_update([(range_name, rows)])
+
+    def batch_update(self, data: List[Tuple[str, List[List]]]):
+        # 범위를 모두 확인한 뒤 트랜잭션 시작 (잘못된 범위면 아무것도 쓰지 않음)
+        targets = []
+        for range_name, rows in data:
+            sheet, first_column, _, first_row, _ = parse_a1_range(range_name)
+            targets.append((*self._table(sheet), first_row, first_column, rows))
+        with self._write_transaction() as connection:
+            for table, columns, first_row, first_column, rows in targets:
+                for offset, row in enumerate(rows):
+                    self._update_row(connection, table, columns, first_row + offset, first_column, row)
+
+    @contextmanager
+    def _write_transaction(self):
+        """쓰기 트랜잭션 (실패하면 되돌리고 SQLite 오류는 StorageError로 변환)"""
+        connection = self._connection()
+        try:
+            connection.execute("BEGIN IMMEDIATE")
+            yield connection
+            connection.execute("COMMIT")
+        except BaseException as error:
+            # BEGIN IMMEDIATE 자체가 실패했으면(database is locked 등) 되돌릴 트랜잭션이 없음
+            if connection.in_transaction:
+                connection.execute("ROLLBACK")
+            if isinstance(error, sqlite3.Error):
+                raise StorageError(f"SQLite 저장 오류: {error}") from error
+            raise
+
+    def close(self):
+        with self._connections_lock:
+            for connection in self._connections:
+                connection.close()
+            self._connections = []
+        self._local = threading.local()
+
+    def _update_row(self, connection, table: str, columns: List[str], row_number: int,
+                    first_column: int, row: List):
+        """한 행의 일부 셀 덮어쓰기 (행이 없으면 새로 만듦)"""
+        record = connection.execute(
+            f"SELECT {', '.join(columns)}, extra FROM {table} WHERE row_number = ?", (row_number,)
+        ).fetchone()
+        cells = self._record_to_cells(record, len(columns)) if record else []
+        if len(cells) < first_column + len(row):
+            cells.extend([''] * (first_column + len(row) - len(cells)))
+        cells[first_column:first_column + len(row)] = row
+
+        connection.execute(
+            f"INSERT OR REPLACE INTO {table} (row_number, {', '.join(columns)}, extra) "
+            f"VALUES ({', '.join('?' * (len(columns) + 2))})",
+            (row_number, *self._cells_to_record(cells, len(columns)))
+        )
+
+    def _cells_to_record(self, cells: List, column_count: int) -> List:
+        """셀 목록을 (앞쪽 열..., extra JSON) 레코드로 변환"""
+        cells = ['' if cell is None else str(cell) for cell in cells]
+        named = cells[:column_count] + [''] * (column_count - len(cells[:column_count]))
+        extra = json.dumps(cells[column_count:], ensure_ascii=False) if len(cells) > column_count else None
+        return named + [extra]
+
+    def _record_to_cells(self, record: Sequence, column_count: int) -> List:
+        """레코드를 셀 목록으로 변환"""
+        cells = [value or '' for value in record[:column_count]]
+        extra = record[column_count]
+        if extra:
+            cells.extend(json.loads(extra))
+        return cells
+
+    def _trim(self, cells: List) -> List:
+        """시트 API처럼 뒤쪽의 빈 셀 제거"""
+        end = len(cells)
+        while end and cells[end - 1] == '':
+            end -= 1
+        return cells[:end]
+
+    def _table(self, sheet: str) -> Tuple[str, List[str]]:
+        if sheet not in self.tables:
+            raise StorageError(f"SQLite 백엔드에 정의되지 않은 시트입니다: {sheet}")
+        return self.tables[sheet]
+
+    def _connection(self) -> sqlite3.Connection:
+        """현재 스레드의 SQLite 연결 (처음 사용할 때 생성)"""
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, isolation_level=None, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+            with self._connections_lock:
+                self._connections.append(connection)
+        return connection
+
+    def _create_tables(self):
+        """시트별 테이블 생성 (이전 버전이 만든 사용하지 않는 열 인덱스는 삭제)"""
+        connection = self._connection()
+        for table, columns in self.tables.values():
+            column_definitions = ', '.join(f"{column} TEXT" for column in columns)
+            connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {table} "
+                f"(row_number INTEGER PRIMARY KEY, {column_definitions}, extra TEXT)"
+            )
+            for column in columns:
+                connection.execute(f"DROP INDEX IF EXISTS idx_{table}_{column}")
+
+def create_backend(spreadsheet_id: str = None, service=None) -> StorageBackend:
+    """환경변수 GOLF_STORAGE_BACKEND에 맞는 저장소 생성"""
+    if STORAGE_BACKEND == 'sqlite':
+        return SQLiteBackend(SQLITE_PATH)
+    if STORAGE_BACKEND == 'emulator':
+        from sheets_emulator import shared_emulator
+        return shared_emulator().backend(spreadsheet_id or 'emulator')
+    if STORAGE_BACKEND != 'sheets':
+        raise ValueError(f"지원하지 않는 저장소입니다: {STORAGE_BACKEND} (sheets, sqlite 또는 emulator)")
+    return SheetsBackend(service, spreadsheet_id)
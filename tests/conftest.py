@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+테스트 공통 fixture (메모리 Sheets 에뮬레이터 사용, Google 계정 불필요)
+Shared fixtures backed by the in-memory Sheets emulator
+"""
+
+import os
+import random
+import sys
+import uuid
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from golf_score_manager import SCORE_SCHEMA_VERSION, GolfScoreManager, _score_headers
+from password_hasher import PasswordHasher
+from sheets_emulator import SheetsEmulator
+from user_manager import UserManager
+
+PLAYER_COUNT = 5
+MEMBER_HEADERS = ['user_id', 'username', 'email', 'password_hash', 'created_at', 'last_login']
+
+
+def make_score_rows(count: int, seed: int = 0):
+    """Score 시트 데이터 행 (플레이어 PLAYER_COUNT명, 날짜는 겹칠 수 있음)"""
+    rng = random.Random(seed)
+    rows = []
+    for _ in range(count):
+        holes = []
+        for _ in range(18):
+            hole = [rng.choice((3, 4, 5)), 1, rng.randint(0, 1), rng.randint(1, 2), rng.randint(1, 3)]
+            holes.extend(hole + [sum(hole[1:])])
+        total = sum(holes[5::6])
+        rows.append([f'2024-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}', f'player{rng.randrange(PLAYER_COUNT)}',
+                     f'course{rng.randrange(3)}', total, max(0, total - 72)] + holes)
+    return rows
+
+
+def new_spreadsheet_id() -> str:
+    """테스트마다 새 ID (헤더 확인 결과가 프로세스 단위로 ID별 캐시되므로 재사용하지 않음)"""
+    return f'test-{uuid.uuid4().hex}'
+
+
+@pytest.fixture
+def emulator():
+    return SheetsEmulator()
+
+
+@pytest.fixture
+def spreadsheet_id():
+    return new_spreadsheet_id()
+
+
+@pytest.fixture
+def score_sheet(emulator, spreadsheet_id):
+    """헤더만 있는 Score 시트와, 헤더 아래를 rows로 채우는 함수"""
+    header = _score_headers() + [f'schema_v{SCORE_SCHEMA_VERSION}']
+
+    def fill(rows):
+        emulator.load_rows(spreadsheet_id, 'Score', [header] + rows, value_input='RAW')
+    fill([])
+    return fill
+
+
+@pytest.fixture
+def golf_manager(emulator, spreadsheet_id, score_sheet):
+    manager = GolfScoreManager(spreadsheet_id, write_behind=False, backend=emulator.backend(spreadsheet_id))
+    yield manager
+    manager.close()
+
+
+@pytest.fixture
+def user_manager(emulator, spreadsheet_id):
+    emulator.load_rows(spreadsheet_id, 'Member', [MEMBER_HEADERS])
+    manager = UserManager(password_hasher=PasswordHasher(iterations=1000, executor='inline'),
+                          backend=emulator.backend(spreadsheet_id))
+    yield manager
+    manager.close()
+
+
+def build_round(manager: GolfScoreManager, player_name: str, course_name: str, date: str, putter: int = 2):
+    """모든 홀이 파4인 18홀 라운드"""
+    round_data = manager.create_golf_round(player_name, course_name, date=date)
+    for hole in range(1, 19):
+        manager.add_detailed_score(round_data, hole, 4, 1, 0, 1, putter)
+    manager.calculate_handicap(round_data)
+    return round_data
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+app.py 시작 단계 테스트 (warmup, 동시 초기화, --preflight)
+"""
+
+import os
+import subprocess
+import sys
+import threading
+
+import pytest
+
+import app
+import sheets_emulator
+import storage
+import user_manager as user_manager_module
+from conftest import make_score_rows
+from golf_score_manager import GolfScoreManager
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture
+def emulator_app(emulator, spreadsheet_id, monkeypatch):
+    """GOLF_STORAGE_BACKEND=emulator처럼 app이 테스트 에뮬레이터에 Manager를 만들도록 설정"""
+    monkeypatch.setattr(storage, 'STORAGE_BACKEND', 'emulator')
+    monkeypatch.setattr(sheets_emulator, '_shared_emulator', emulator)
+    monkeypatch.setenv('GOOGLE_SPREADSHEET_ID', spreadsheet_id)
+    monkeypatch.setattr(user_manager_module, 'USERS_SHEET_ID', spreadsheet_id)
+    monkeypatch.setattr(app, 'golf_manager', None)
+    monkeypatch.setattr(app, 'user_manager', None)
+    yield emulator
+    for manager in (app.golf_manager, app.user_manager):
+        if manager is not None:
+            manager.close()
+
+
+def test_warmup_preloads_caches(emulator_app, spreadsheet_id, score_sheet):
+    score_sheet(make_score_rows(30))
+
+    ok, timings = app.warmup()
+    assert ok
+    assert list(timings) == ['GolfScoreManager 초기화', 'UserManager 초기화', '라운드 캐시 로드', '사용자 인덱스 로드']
+
+    # 첫 요청은 저장소를 다시 읽지 않음
+    emulator_app.reset_stats()
+    assert len(app.golf_manager.load_from_sheets()) == 30
+    assert app.user_manager.get_user_by_id('nobody') is None
+    assert emulator_app.stats()['calls'] == {}
+
+
+def test_warmup_reports_storage_errors(emulator_app, user_manager, capsys):
+    app.user_manager = user_manager
+    emulator_app.fail_next(1, 403)
+
+    ok, timings = app.warmup()
+    assert not ok
+    assert '라운드 캐시 로드 단계 오류' in capsys.readouterr().out
+
+
+def test_concurrent_init_creates_one_manager(emulator_app, monkeypatch):
+    created = []
+
+    def counting_manager(*args, **kwargs):
+        created.append(args)
+        return GolfScoreManager(*args, **kwargs)
+
+    monkeypatch.setattr(app, 'GolfScoreManager', counting_manager)
+    threads = [threading.Thread(target=app.init_golf_manager) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(created) == 1
+
+
+def test_preflight_exit_code():
+    env = dict(os.environ, GOLF_STORAGE_BACKEND='emulator')
+    result = subprocess.run([sys.executable, 'app.py', '--preflight'], cwd=APP_DIR, env=env,
+                            capture_output=True, text=True, timeout=60)
+    assert result.returncode == 0, result.stdout + result.stderr
+    assert '사전 점검 통과' in result.stdout
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+비동기(Quart) API 테스트 (quart가 설치되어 있을 때만 실행)
+"""
+
+import asyncio
+import io
+import json
+
+import pytest
+
+pytest.importorskip('quart')
+
+from quart.datastructures import FileStorage
+
+import async_app
+from async_service import AsyncGolfService
+from conftest import build_round
+from round_export import export_chunks
+
+USERNAME = 'golfer'
+PASSWORD = 'secret-password'
+
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+
+@pytest.fixture
+def service(golf_manager, user_manager, monkeypatch):
+    """에뮬레이터 Manager를 쓰는 서비스 (before_serving 대신 직접 설정)"""
+    service = AsyncGolfService(golf_manager, user_manager, concurrency=4)
+    monkeypatch.setattr(async_app, 'service', service)
+    yield service
+    service._executor.shutdown(wait=True)
+
+
+async def login(client):
+    response = await client.post('/api/auth/register', json={
+        'username': USERNAME, 'email': f'{USERNAME}@example.com', 'password': PASSWORD})
+    assert response.status_code == 201
+    response = await client.post('/api/auth/login', json={'username_or_email': USERNAME, 'password': PASSWORD})
+    assert response.status_code == 200
+
+
+def save_rounds(manager, count: int):
+    manager.save_rounds([build_round(manager, USERNAME, 'course1', f'2024-05-{day:02d}') for day in range(1, count + 1)]
+                        + [build_round(manager, 'someone-else', 'course1', '2024-05-01')])
+
+
+def import_lines(manager, player_name: str, count: int) -> str:
+    rounds = [build_round(manager, player_name, 'course2', f'2024-06-{day:02d}') for day in range(1, count + 1)]
+    return ''.join(json.dumps(round_data.to_dict(), ensure_ascii=False) + '\n' for round_data in rounds)
+
+
+def test_requires_login(service):
+    async def scenario():
+        client = async_app.app.test_client()
+        for path in ('/api/rounds', '/api/statistics', '/api/dashboard', '/api/rounds/export'):
+            assert (await client.get(path)).status_code == 401
+        assert (await client.post('/api/rounds/import', data='x')).status_code == 401
+    run(scenario())
+
+
+def test_rounds_pages(service, golf_manager):
+    save_rounds(golf_manager, 5)
+
+    async def scenario():
+        client = async_app.app.test_client()
+        await login(client)
+        dates = []
+        cursor = ''
+        while True:
+            page = await (await client.get(f'/api/rounds?limit=2&cursor={cursor}')).get_json()
+            dates.extend(r['date'] for r in page['rounds'])
+            cursor = page['next_cursor']
+            if cursor is None:
+                return dates
+    assert run(scenario()) == [f'2024-05-{day:02d}' for day in range(5, 0, -1)]
+
+
+def test_dashboard_pages_with_statistics(service, golf_manager):
+    save_rounds(golf_manager, 3)
+
+    async def scenario():
+        client = async_app.app.test_client()
+        await login(client)
+        assert (await client.get('/api/dashboard?limit=0')).status_code == 400
+        return await (await client.get('/api/dashboard?limit=2')).get_json()
+    dashboard = run(scenario())
+
+    assert [r['date'] for r in dashboard['rounds']] == ['2024-05-03', '2024-05-02']
+    assert dashboard['next_cursor'] is not None
+    assert dashboard['statistics']['total_rounds'] == 3
+
+
+def test_concurrent_requests(service, golf_manager):
+    save_rounds(golf_manager, 3)
+
+    async def scenario():
+        client = async_app.app.test_client()
+        await login(client)
+        responses = await asyncio.gather(*(client.get('/api/statistics') for _ in range(8)))
+        return [await response.get_json() for response in responses]
+    assert all(statistics['total_rounds'] == 3 for statistics in run(scenario()))
+
+
+@pytest.mark.parametrize('fmt', ['csv', 'jsonl'])
+def test_export_only_own_rounds(service, golf_manager, fmt):
+    save_rounds(golf_manager, 3)
+    expected = ''.join(export_chunks((r for r in golf_manager.iter_rounds() if r.player_name == USERNAME), fmt))
+
+    async def scenario():
+        client = async_app.app.test_client()
+        await login(client)
+        assert (await client.get('/api/rounds/export?format=xml')).status_code == 400
+        assert (await client.get('/api/rounds/export?player=someone-else')).status_code == 403
+        response = await client.get(f'/api/rounds/export?format={fmt}&player={USERNAME}')
+        assert response.status_code == 200
+        assert 'attachment' in response.headers['Content-Disposition']
+        return await response.get_data(as_text=True)
+    assert run(scenario()) == expected
+
+
+def test_import_saves_own_rounds(service, golf_manager):
+    body = import_lines(golf_manager, USERNAME, 3) + import_lines(golf_manager, 'someone-else', 1)
+
+    async def scenario():
+        client = async_app.app.test_client()
+        await login(client)
+        response = await client.post('/api/rounds/import', data=body,
+                                     headers={'Content-Type': 'application/x-ndjson'})
+        assert response.status_code == 200
+        return [json.loads(line) for line in (await response.get_data(as_text=True)).splitlines()]
+    result = run(scenario())[-1]
+
+    assert result['done'] and (result['imported'], result['failed']) == (3, 1)
+    assert [r['player_name'] for r in golf_manager.load_from_sheets()] == [USERNAME] * 3
+
+
+def test_import_multipart_and_skip(service, golf_manager):
+    body = import_lines(golf_manager, USERNAME, 4).encode()
+
+    async def scenario():
+        client = async_app.app.test_client()
+        await login(client)
+        upload = FileStorage(io.BytesIO(body), filename='rounds.jsonl')
+        response = await client.post('/api/rounds/import?skip=1', files={'file': upload})
+        return [json.loads(line) for line in (await response.get_data(as_text=True)).splitlines()]
+    result = run(scenario())[-1]
+
+    assert (result['imported'], result['records']) == (3, 4)
+
+
+def test_import_rejects_bad_requests(service):
+    async def scenario():
+        client = async_app.app.test_client()
+        await login(client)
+        statuses = []
+        for kwargs in ({'form': {'data': 'x'}},
+                       {'files': {}, 'form': {'other': 'x'}},
+                       {'data': 'x', 'headers': {'Content-Type': 'text/plain'}},
+                       {'data': '', 'headers': {'Content-Type': 'text/csv'}}):
+            statuses.append((await client.post('/api/rounds/import', **kwargs)).status_code)
+        statuses.append((await client.post('/api/rounds/import?format=csv&skip=-x', data='x')).status_code)
+        return statuses
+    assert run(scenario()) == [415, 400, 400, 400, 400]
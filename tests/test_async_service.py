@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+비동기 서비스 계층 테스트 (Quart 없이 실행)
+"""
+
+import asyncio
+import io
+import json
+
+from async_service import AsyncBodyReader, AsyncGolfService
+from conftest import build_round
+from round_export import export_chunks
+from storage import StorageError
+
+
+async def body_chunks(chunks):
+    for chunk in chunks:
+        await asyncio.sleep(0)
+        yield chunk
+
+
+def test_body_reader_streams_chunks():
+    chunks = [b'date,player\n2024-', b'', b'05-01,kim\n', '한글'.encode()[:2], '한글'.encode()[2:] + b'\n']
+
+    async def scenario():
+        reader = AsyncBodyReader(body_chunks(chunks), asyncio.get_running_loop())
+        stream = io.TextIOWrapper(io.BufferedReader(reader, buffer_size=4), encoding='utf-8')
+        return await asyncio.to_thread(stream.read)
+    assert asyncio.run(scenario()) == 'date,player\n2024-05-01,kim\n한글\n'
+
+
+def test_import_and_export_through_executor(golf_manager, user_manager):
+    lines = ''.join(f'{line}\n' for line in ''.join(export_chunks(
+        [build_round(golf_manager, 'kim', 'course1', f'2024-05-0{day}') for day in range(1, 4)], 'jsonl')).splitlines())
+
+    async def scenario():
+        service = AsyncGolfService(golf_manager, user_manager, concurrency=2)
+        try:
+            assert await service.open_import_stream(AsyncBodyReader(body_chunks([]), asyncio.get_running_loop())) is None
+            stream = await service.open_import_stream(
+                AsyncBodyReader(body_chunks([lines.encode()]), asyncio.get_running_loop()))
+            progress = [item async for item in service.import_rounds(stream, 'jsonl', 'kim')]
+            exported = [chunk async for chunk in service.export_chunks('kim', 'jsonl')]
+            return progress, ''.join(exported)
+        finally:
+            service._executor.shutdown(wait=True)
+    progress, exported = asyncio.run(scenario())
+
+    assert progress[-1]['done'] and progress[-1]['imported'] == 3
+    assert [json.loads(line)['date'] for line in exported.splitlines()] == ['2024-05-01', '2024-05-02', '2024-05-03']
+
+
+def test_export_error_ends_with_marker(golf_manager, user_manager, monkeypatch):
+    def failing_rounds():
+        raise StorageError('Quota exceeded', status=429)
+        yield
+
+    monkeypatch.setattr(golf_manager, 'iter_rounds', failing_rounds)
+
+    async def scenario():
+        service = AsyncGolfService(golf_manager, user_manager, concurrency=1)
+        try:
+            return [chunk async for chunk in service.export_chunks('kim', 'jsonl')]
+        finally:
+            service._executor.shutdown(wait=True)
+    assert asyncio.run(scenario()) == ['{"error": "Quota exceeded"}\n']
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+열 지향 라운드 저장소 테스트 (numpy가 없으면 경고 테스트만 실행)
+"""
+
+import pytest
+
+import golf_score_manager
+from conftest import PLAYER_COUNT, make_score_rows
+from columnar_store import numpy_available
+from golf_score_manager import GolfScoreManager, compute_player_statistics
+from score_parser import parse_score_row
+
+LARGE_VALUE = 2 ** 40
+
+requires_numpy = pytest.mark.skipif(not numpy_available(), reason='numpy가 설치되어 있지 않음')
+
+
+def test_warns_when_numpy_is_missing(emulator, spreadsheet_id, score_sheet, monkeypatch, capsys):
+    monkeypatch.setattr(golf_score_manager, 'COLUMNAR_STATS_ENABLED', True)
+    monkeypatch.setattr(golf_score_manager, 'numpy_available', lambda: False)
+    score_sheet(make_score_rows(20))
+    manager = GolfScoreManager(spreadsheet_id, write_behind=False, backend=emulator.backend(spreadsheet_id))
+
+    assert 'numpy' in capsys.readouterr().out
+    assert manager._columnar is None
+    assert manager.get_player_statistics('player0')['player_name'] == 'player0'
+
+
+@requires_numpy
+def test_large_hole_values_are_not_truncated():
+    from columnar_store import ColumnarRoundStore
+
+    row = make_score_rows(1)[0]
+    row[6] = LARGE_VALUE  # 1번 홀 driver
+    round_data = parse_score_row(row)
+    store = ColumnarRoundStore.from_rounds([round_data])
+
+    assert store.holes[0, 0, 1] == LARGE_VALUE
+    assert store.holes[0].tolist() == [[hole[field] for field in ('par', 'driver', 'wood_util', 'iron',
+                                                                  'putter', 'total')]
+                                       for hole in round_data['detailed_scores']]
+
+
+@requires_numpy
+def test_statistics_match_aggregates(emulator, spreadsheet_id, score_sheet, monkeypatch):
+    monkeypatch.setattr(golf_score_manager, 'COLUMNAR_STATS_ENABLED', True)
+    score_sheet(make_score_rows(300))
+    manager = GolfScoreManager(spreadsheet_id, write_behind=False, backend=emulator.backend(spreadsheet_id))
+    rounds = manager.load_from_sheets()
+
+    assert manager._columnar is not None and manager._columnar.size == 300
+    for index in range(PLAYER_COUNT):
+        player_name = f'player{index}'
+        player_rounds = sorted((r for r in rounds if r['player_name'] == player_name),
+                               key=lambda r: str(r['date']))
+        assert manager.get_player_statistics(player_name) == compute_player_statistics(player_name,
+                                                                                       player_rounds)
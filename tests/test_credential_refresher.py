@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+백그라운드 인증 정보 갱신 테스트 (토큰 서버 호출은 가짜 refresh로 대체)
+"""
+
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from google.auth.exceptions import RefreshError
+from google.oauth2.credentials import Credentials
+
+from credential_refresher import CredentialRefresher, seconds_until_expiry
+from sheets_client import SCOPES, SheetsClientFactory
+
+
+def utc_now():
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def expiring_credentials(seconds: float) -> Credentials:
+    return Credentials(token='old-token', refresh_token='refresh-token', client_id='client',
+                       client_secret='secret', token_uri='https://oauth2.googleapis.com/token',
+                       scopes=SCOPES, expiry=utc_now() + timedelta(seconds=seconds))
+
+
+@pytest.fixture
+def refreshes(monkeypatch):
+    """Credentials.refresh를 새 토큰과 1시간 뒤 만료로 바꾸고 호출된 토큰 목록 반환"""
+    calls = []
+
+    def refresh(credentials, request):
+        calls.append(credentials.token)
+        credentials.token = f'new-token-{len(calls)}'
+        credentials.expiry = utc_now() + timedelta(hours=1)
+
+    monkeypatch.setattr(Credentials, 'refresh', refresh)
+    return calls
+
+
+def test_refresh_swaps_copy(refreshes):
+    original = expiring_credentials(10)
+    factory = SheetsClientFactory(original)
+    refresher = CredentialRefresher(factory)
+
+    assert refresher.refresh_now()
+    assert factory.credentials is not original and factory.credentials.token == 'new-token-1'
+    assert original.token == 'old-token'  # 사용 중인 객체는 바꾸지 않음
+    assert factory.generation == 1
+
+    stats = refresher.stats()
+    assert stats['refresh_count'] == 1 and stats['failed_refreshes'] == 0
+    assert stats['last_refresh_at'] is not None
+    assert stats['expires_in_seconds'] > 3500
+
+
+def test_failed_refresh_keeps_credentials(monkeypatch, capsys):
+    def refresh(credentials, request):
+        raise RefreshError('invalid_grant')
+
+    monkeypatch.setattr(Credentials, 'refresh', refresh)
+    original = expiring_credentials(10)
+    factory = SheetsClientFactory(original)
+    refresher = CredentialRefresher(factory)
+
+    assert not refresher.refresh_now()
+    assert factory.credentials is original and factory.generation == 0
+    stats = refresher.stats()
+    assert (stats['refresh_count'], stats['failed_refreshes'], stats['last_error']) == (0, 1, 'invalid_grant')
+    assert '갱신 실패' in capsys.readouterr().out
+
+
+def test_background_refresh_before_expiry(refreshes):
+    factory = SheetsClientFactory(expiring_credentials(60))
+    refresher = factory.start_refresher(margin=300)
+    try:
+        deadline = time.monotonic() + 5
+        while factory.generation == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert factory.credentials.token == 'new-token-1'
+        assert factory.credential_stats()['running']
+    finally:
+        refresher.stop()
+
+    assert refreshes == ['old-token']  # 갱신 후에는 만료까지 여유가 있어 다시 갱신하지 않음
+    assert not factory.credential_stats()['running']
+
+
+def test_refresher_disabled_with_zero_margin():
+    factory = SheetsClientFactory(expiring_credentials(60))
+    assert factory.start_refresher(margin=0) is None
+    assert factory.credential_stats() is None
+
+
+def test_seconds_until_expiry():
+    assert seconds_until_expiry(Credentials(token='token')) is None
+    assert 590 < seconds_until_expiry(expiring_credentials(600)) <= 600
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+GolfScoreManager 테스트 (헤더/스키마 확인, 커서 페이지 조회)
+"""
+
+import pytest
+
+import app
+from conftest import build_round, make_score_rows
+from golf_score_manager import (ROUNDS_MAX_PAGE_SIZE, SCORE_SCHEMA_VERSION, GolfScoreManager, _score_headers,
+                                parse_rounds_query)
+
+SCHEMA_MARKER = f'schema_v{SCORE_SCHEMA_VERSION}'
+
+
+def header_row(emulator, spreadsheet_id):
+    return emulator.backend(spreadsheet_id).get('Score!1:1')[0]
+
+
+def new_manager(emulator, spreadsheet_id):
+    return GolfScoreManager(spreadsheet_id, write_behind=False, backend=emulator.backend(spreadsheet_id))
+
+
+def test_header_checked_once_per_process(emulator, spreadsheet_id):
+    manager = new_manager(emulator, spreadsheet_id)
+    for day in range(1, 4):
+        manager.save_to_sheets(build_round(manager, 'kim', 'course1', f'2024-05-0{day}'))
+
+    assert emulator.stats()['calls']['values.get'] == 1
+    assert header_row(emulator, spreadsheet_id) == _score_headers() + [SCHEMA_MARKER]
+
+    # 같은 스프레드시트의 새 Manager도 다시 확인하지 않음
+    emulator.reset_stats()
+    other = new_manager(emulator, spreadsheet_id)
+    other.save_to_sheets(build_round(other, 'lee', 'course1', '2024-05-04'))
+    assert 'values.get' not in emulator.stats()['calls']
+
+
+def test_old_header_gets_schema_marker_only(emulator, spreadsheet_id):
+    old_header = ['date'] + _score_headers()[1:]
+    emulator.load_rows(spreadsheet_id, 'Score', [old_header])
+    manager = new_manager(emulator, spreadsheet_id)
+    manager.save_to_sheets(build_round(manager, 'kim', 'course1', '2024-05-01'))
+
+    assert header_row(emulator, spreadsheet_id) == old_header + [SCHEMA_MARKER]
+
+
+def test_migrate_schema_rewrites_header(emulator, spreadsheet_id, monkeypatch):
+    emulator.load_rows(spreadsheet_id, 'Score', [['date'] + _score_headers()[1:] + ['schema_v0']])
+    monkeypatch.setattr(app, 'golf_manager', new_manager(emulator, spreadsheet_id))
+
+    assert app.migrate_schema()
+    assert header_row(emulator, spreadsheet_id) == _score_headers() + [SCHEMA_MARKER]
+
+
+def test_migrate_schema_reports_storage_errors(emulator, spreadsheet_id, monkeypatch):
+    monkeypatch.setattr(app, 'golf_manager', new_manager(emulator, spreadsheet_id))
+    emulator.fail_next(1, 403)
+
+    assert not app.migrate_schema()
+
+
+def expected_rounds(rounds, player_name, course_name=None):
+    """플레이어 라운드를 최신순으로 직접 정렬 (같은 날짜는 나중에 저장한 것부터)"""
+    entries = [(str(r['date']), position) for position, r in enumerate(rounds)
+               if r['player_name'] == player_name and (course_name is None or r['course_name'] == course_name)]
+    return [rounds[position] for _, position in sorted(entries, reverse=True)]
+
+
+def all_pages(manager, player_name, **query):
+    pages = []
+    cursor = None
+    while True:
+        page = manager.get_player_rounds(player_name, cursor=cursor, **query)
+        pages.append(page['rounds'])
+        cursor = page['next_cursor']
+        if cursor is None:
+            return pages
+
+
+@pytest.mark.parametrize('limit', [1, 7, 50])
+def test_cursor_pages_cover_player_rounds(golf_manager, score_sheet, limit):
+    score_sheet(make_score_rows(200))
+    rounds = golf_manager.load_from_sheets()
+
+    pages = all_pages(golf_manager, 'player3', limit=limit)
+    assert all(len(page) <= limit for page in pages)
+    assert [r for page in pages for r in page] == expected_rounds(rounds, 'player3')
+
+
+def test_cursor_pages_with_filters(golf_manager, score_sheet):
+    score_sheet(make_score_rows(200))
+    rounds = golf_manager.load_from_sheets()
+
+    pages = all_pages(golf_manager, 'player0', limit=3, course_name='course2',
+                      date_from='2024-03-01', date_to='2024-09-30')
+    expected = [r for r in expected_rounds(rounds, 'player0', 'course2') if '2024-03-01' <= r['date'] <= '2024-09-30']
+    assert [r for page in pages for r in page] == expected
+
+
+def test_cursor_survives_new_rounds(golf_manager, score_sheet):
+    score_sheet(make_score_rows(100))
+    rounds = golf_manager.load_from_sheets()
+    first = golf_manager.get_player_rounds('player4', limit=5)
+
+    # 첫 페이지 이후 더 최근 라운드가 저장되어도 다음 페이지는 이어지는 위치부터 시작
+    golf_manager.save_to_sheets(build_round(golf_manager, 'player4', 'course0', '2025-06-01'))
+    second = golf_manager.get_player_rounds('player4', limit=5, cursor=first['next_cursor'])
+    assert first['rounds'] + second['rounds'] == expected_rounds(rounds, 'player4')[:10]
+
+
+def test_invalid_cursor(golf_manager):
+    with pytest.raises(ValueError):
+        golf_manager.get_player_rounds('player0', cursor='not-a-cursor')
+
+
+@pytest.mark.parametrize('args', [
+    {'from': '2024/01/01'}, {'to': 'yesterday'}, {'cursor': '!!'}, {'limit': 'ten'}, {'limit': '0'},
+    {'limit': str(ROUNDS_MAX_PAGE_SIZE + 1)},
+])
+def test_parse_rounds_query_rejects(args):
+    with pytest.raises(ValueError):
+        parse_rounds_query(args)
+
+
+def test_parse_rounds_query():
+    assert parse_rounds_query({'from': ' 2024-01-01 ', 'to': '', 'course': 'course1', 'limit': '5'}) == {
+        'date_from': '2024-01-01', 'course_name': 'course1', 'limit': 5}
+
+
+def test_rounds_endpoint_pages_session_user(golf_manager, user_manager, score_sheet, monkeypatch):
+    monkeypatch.setattr(app, 'golf_manager', golf_manager)
+    monkeypatch.setattr(app, 'user_manager', user_manager)
+    score_sheet(make_score_rows(100))
+    rounds = golf_manager.load_from_sheets()
+    assert user_manager.register_user('player2', 'player2@example.com', 'password1')['success']
+    client = app.app.test_client()
+    assert client.get('/api/rounds').status_code == 401
+    client.post('/api/auth/login', json={'username_or_email': 'player2', 'password': 'password1'})
+
+    dates = []
+    cursor = ''
+    while True:
+        page = client.get(f'/api/rounds?limit=4&cursor={cursor}').get_json()
+        assert len(page['rounds']) <= 4
+        dates.extend((r['player_name'], r['date']) for r in page['rounds'])
+        cursor = page['next_cursor']
+        if cursor is None:
+            break
+    assert dates == [(r['player_name'], r['date']) for r in expected_rounds(rounds, 'player2')]
+    assert client.get('/api/rounds?limit=1000').status_code == 400
+    assert client.get('/api/rounds?from=2024-13-01').status_code == 400
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+지표 수집/Prometheus 출력 테스트 (라우트별 처리 시간, Sheets 호출 수/전송량, 캐시 통계)
+"""
+
+import pytest
+
+import app
+from conftest import make_score_rows
+from metrics import (CONTENT_TYPE, PHASE_DURATION, SHEETS_BYTES, SHEETS_REQUESTS, Counter, Histogram,
+                     MetricsRegistry)
+from quota_scheduler import QuotaScheduler
+from storage import StorageError
+
+
+class FakeRequest:
+    """HttpRequest처럼 postproc로 응답 본문을 파싱하는 요청"""
+
+    def __init__(self, body: str, content: bytes):
+        self.body = body
+        self.content = content
+        self.postproc = lambda response, content: {'length': len(content)}
+
+    def execute(self):
+        return self.postproc(None, self.content)
+
+
+@pytest.fixture
+def client():
+    return app.app.test_client()
+
+
+def test_histogram_render():
+    histogram = Histogram('latency_seconds', '처리 시간', ('route',), buckets=(0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 3.0):
+        histogram.observe(value, '/api/rounds')
+
+    assert histogram.render() == [
+        'latency_seconds_bucket{route="/api/rounds",le="0.1"} 2',
+        'latency_seconds_bucket{route="/api/rounds",le="1.0"} 3',
+        'latency_seconds_bucket{route="/api/rounds",le="+Inf"} 4',
+        'latency_seconds_sum{route="/api/rounds"} 3.65',
+        'latency_seconds_count{route="/api/rounds"} 4',
+    ]
+    assert histogram.count('/api/rounds') == 4 and histogram.count('/other') == 0
+
+
+def test_registry_render(capsys):
+    registry = MetricsRegistry()
+    counter = registry.counter('calls_total', '호출 수', ('method',))
+    counter.inc('values.get')
+    counter.inc('values.get', amount=2)
+    counter.inc('say "hi"\n')
+    registry.register_collector(lambda: [('cache_entries', 'gauge', '항목 수', [({'sheet': 'Score'}, 3)])])
+    registry.register_collector(lambda: 1 / 0)
+
+    assert registry.render().splitlines() == [
+        '# HELP calls_total 호출 수',
+        '# TYPE calls_total counter',
+        'calls_total{method="say \\"hi\\"\\n"} 1',
+        'calls_total{method="values.get"} 3',
+        '# HELP cache_entries 항목 수',
+        '# TYPE cache_entries gauge',
+        'cache_entries{sheet="Score"} 3',
+    ]
+    assert '지표 수집 오류' in capsys.readouterr().out
+    assert Counter('x', 'x').render() == []
+
+
+def test_sheets_calls_are_counted(emulator, spreadsheet_id):
+    backend = emulator.backend(spreadsheet_id, QuotaScheduler(max_retries=0))
+    emulator.load_rows(spreadsheet_id, 'Score', make_score_rows(3))
+    before = (SHEETS_REQUESTS.value('values.get', '200'), SHEETS_REQUESTS.value('values.get', '403'))
+
+    backend.get('Score!A1:E3')
+    backend.get('Score!A1:E3')
+    emulator.fail_next(1, 403)
+    with pytest.raises(StorageError):
+        backend.get('Score!A1:E3')
+
+    after = (SHEETS_REQUESTS.value('values.get', '200'), SHEETS_REQUESTS.value('values.get', '403'))
+    assert (after[0] - before[0], after[1] - before[1]) == (2, 1)
+
+
+def test_sheets_bytes_are_measured(emulator, spreadsheet_id):
+    backend = emulator.backend(spreadsheet_id)
+    before = (SHEETS_BYTES.value('values.update', 'sent'), SHEETS_BYTES.value('values.update', 'received'))
+
+    result = backend._execute_once('values.update', FakeRequest('{"values": [["한"]]}', b'{"updatedRows": 1}'))
+
+    after = (SHEETS_BYTES.value('values.update', 'sent'), SHEETS_BYTES.value('values.update', 'received'))
+    assert result == {'length': 18}
+    assert (after[0] - before[0], after[1] - before[1]) == (len('{"values": [["한"]]}'.encode()), 18)
+
+
+def test_metrics_endpoint(client, golf_manager, score_sheet, monkeypatch):
+    monkeypatch.setattr(app, 'golf_manager', golf_manager)
+    score_sheet(make_score_rows(5))
+    golf_manager.load_from_sheets()
+    golf_manager.load_from_sheets()
+    json_encodes = PHASE_DURATION.count('json_encode')
+
+    assert client.get('/api/auth/status').get_json() == {'authenticated': False}
+    assert client.get('/no-such-page').status_code == 404
+    response = client.get('/api/metrics')
+
+    assert response.content_type == CONTENT_TYPE
+    text = response.get_data(as_text=True)
+    assert 'golf_http_requests_total{method="GET",route="/api/auth/status",status="200"}' in text
+    assert 'golf_http_requests_total{method="GET",route="unmatched",status="404"}' in text
+    assert 'golf_http_request_duration_seconds_count{method="GET",route="/api/auth/status"}' in text
+    assert 'golf_read_cache_hits_total ' in text
+    assert PHASE_DURATION.count('json_encode') > json_encodes
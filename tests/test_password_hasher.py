@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+비밀번호 해시 테스트 (형식, 기존 해시 호환, 로그인 시 다시 해시, 워커 풀)
+"""
+
+import secrets
+
+import pytest
+
+from password_hasher import LEGACY_ITERATIONS, PasswordHasher, parse_password_hash, pbkdf2_hex
+
+PASSWORD = 'password1'
+
+
+def legacy_hash(password: str) -> str:
+    """반복 횟수를 기록하지 않던 기존 'salt:hash' 형식"""
+    salt = secrets.token_hex(16)
+    return f'{salt}:{pbkdf2_hex(password, salt, LEGACY_ITERATIONS)}'
+
+
+@pytest.mark.parametrize('executor', ['inline', 'thread', 'process'])
+def test_hash_and_verify(executor):
+    hasher = PasswordHasher(iterations=1000, executor=executor, workers=2)
+    try:
+        password_hash = hasher.hash(PASSWORD)
+        assert parse_password_hash(password_hash)[0] == 1000
+        assert hasher.verify(PASSWORD, password_hash)
+        assert not hasher.verify('wrong-password', password_hash)
+
+        hashes = hasher.hash_many(['a-password', 'b-password'])
+        assert [hasher.verify(password, password_hash)
+                for password, password_hash in zip(['a-password', 'b-password'], hashes)] == [True, True]
+    finally:
+        hasher.shutdown()
+
+
+def test_needs_rehash():
+    hasher = PasswordHasher(iterations=1000, executor='inline')
+    assert not hasher.needs_rehash(hasher.hash(PASSWORD))
+    assert hasher.needs_rehash(PasswordHasher(iterations=2000, executor='inline').hash(PASSWORD))
+    assert hasher.needs_rehash(legacy_hash(PASSWORD))
+
+
+def test_legacy_hash_verifies():
+    assert PasswordHasher(executor='inline').verify(PASSWORD, legacy_hash(PASSWORD))
+    assert not PasswordHasher(executor='inline').verify(PASSWORD, 'not-a-hash')
+
+
+def test_login_rehashes_old_hash(user_manager, emulator, spreadsheet_id):
+    old_hash = PasswordHasher(iterations=2000, executor='inline').hash(PASSWORD)
+    emulator.load_rows(spreadsheet_id, 'Member', [['id-kim', 'kim', 'kim@example.com', old_hash, '', '']],
+                       start_row=2)
+
+    assert user_manager.authenticate_user('kim', PASSWORD)['success']
+    stored = emulator.backend(spreadsheet_id).get('Member!D2')[0][0]
+    assert stored != old_hash and parse_password_hash(stored)[0] == 1000
+    assert user_manager.authenticate_user('kim', PASSWORD)['success']
+
+    # 현재 설정의 해시는 다시 쓰지 않음
+    emulator.reset_stats()
+    user_manager.authenticate_user('kim', PASSWORD)
+    assert 'values.update' not in emulator.stats()['calls']
+
+
+def test_login_skips_rehash_when_row_moved(user_manager, emulator, spreadsheet_id):
+    old_hash = legacy_hash(PASSWORD)
+    emulator.load_rows(spreadsheet_id, 'Member', [['id-kim', 'kim', 'kim@example.com', old_hash, '', '']],
+                       start_row=2)
+    user_manager.get_user_by_username('kim')
+    # 인덱스를 만든 뒤 다른 사용자가 그 행을 차지
+    emulator.load_rows(spreadsheet_id, 'Member', [['id-lee', 'lee', 'lee@example.com', 'lee-hash', '', '']],
+                       start_row=2)
+
+    assert user_manager.authenticate_user('kim', PASSWORD)['success']
+    assert emulator.backend(spreadsheet_id).get('Member!D2')[0][0] == 'lee-hash'
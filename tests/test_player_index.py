@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+플레이어별 라운드 색인 테스트
+"""
+
+from conftest import PLAYER_COUNT, build_round, make_score_rows
+from golf_score_manager import compute_player_statistics
+from player_index import PlayerRoundIndex, select_entries
+
+
+def round_entry(player_name: str, date: str):
+    return {'player_name': player_name, 'date': date}
+
+
+def indexed_positions(rounds, player_name):
+    """플레이어 라운드 위치를 (날짜, 위치)순으로 직접 정렬"""
+    return [position for _, position in sorted((str(r['date']), position) for position, r in enumerate(rounds)
+                                               if r['player_name'] == player_name)]
+
+
+def test_positions_sorted_by_date():
+    index = PlayerRoundIndex.from_rounds([
+        round_entry('kim', '2024-05-03'), round_entry('lee', '2024-05-01'),
+        round_entry('kim', '2024-05-01'), round_entry('kim', '2024-05-03'),
+    ])
+    index.add(round_entry('kim', '2024-04-30'), 4)
+
+    assert index.positions('kim') == [4, 2, 0, 3]
+    assert index.positions('lee') == [1]
+    assert index.positions('nobody') == []
+    assert sorted(index.players()) == ['kim', 'lee'] and len(index) == 5
+
+
+def test_select_entries():
+    entries = [('2024-05-01', 0), ('2024-05-02', 3), ('2024-05-02', 5), ('2024-05-04', 1)]
+
+    assert list(select_entries(entries)) == entries[::-1]
+    assert list(select_entries(entries, date_from='2024-05-02')) == entries[:0:-1]
+    assert list(select_entries(entries, date_to='2024-05-02')) == entries[2::-1]
+    assert list(select_entries(entries, '2024-05-02', '2024-05-02')) == [entries[2], entries[1]]
+    assert list(select_entries(entries, before=('2024-05-02', 5))) == [entries[1], entries[0]]
+    assert list(select_entries(entries, date_from='2024-06-01')) == []
+
+
+def test_index_follows_loads_and_saves(golf_manager, score_sheet):
+    score_sheet(make_score_rows(200))
+    golf_manager.load_from_sheets()
+    for day in range(1, 4):
+        golf_manager.save_to_sheets(build_round(golf_manager, 'player1', 'course1', f'2023-01-0{day}'))
+
+    rounds = golf_manager.load_from_sheets()
+    assert len(rounds) == 203
+    for index in range(PLAYER_COUNT):
+        player_name = f'player{index}'
+        assert golf_manager._player_index.positions(player_name) == indexed_positions(rounds, player_name)
+
+
+def test_rows_added_elsewhere_are_indexed(golf_manager, score_sheet):
+    golf_manager.load_from_sheets()
+    score_sheet(make_score_rows(50, seed=1))
+    golf_manager._read_cache.invalidate()
+
+    statistics = golf_manager.get_player_statistics('player2')
+    rounds = golf_manager.load_from_sheets()
+    assert golf_manager._player_index.positions('player2') == indexed_positions(rounds, 'player2')
+    assert statistics == compute_player_statistics('player2', [rounds[p] for p in indexed_positions(rounds, 'player2')])
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+플레이어별 누적 통계 테스트 (순서 없는 추가, 저장 후 갱신, 재계산 검사)
+"""
+
+import random
+
+from conftest import PLAYER_COUNT, build_round, make_score_rows
+from golf_score_manager import compute_player_statistics
+from player_stats import PlayerStatsStore
+
+
+def round_entry(date: str, score: int):
+    return {'player_name': 'kim', 'date': date, 'total_score': score}
+
+
+def sorted_by_date(rounds, player_name):
+    return sorted((r for r in rounds if r['player_name'] == player_name), key=lambda r: str(r['date']))
+
+
+def test_out_of_order_rounds_match_recompute():
+    rng = random.Random(3)
+    rounds = [round_entry(f'2024-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}', rng.randint(65, 110))
+              for _ in range(200)]
+    store = PlayerStatsStore()
+    for position, round_data in enumerate(rounds):
+        store.add(round_data, position)
+        expected = compute_player_statistics('kim', sorted_by_date(rounds[:position + 1], 'kim'))
+        assert store.statistics('kim') == expected
+
+
+def test_recent_window_keeps_sheet_order_for_same_date():
+    rounds = [round_entry('2024-05-01', score) for score in (70, 80, 90, 100, 110, 120)]
+    store = PlayerStatsStore.from_rounds(rounds)
+    assert store.statistics('kim')['recent_5_rounds_avg'] == 100.0
+    assert store.statistics('nobody') == {'message': 'nobody의 라운드 기록이 없습니다.'}
+
+
+def test_incremental_statistics_match_recompute(golf_manager, score_sheet):
+    score_sheet(make_score_rows(300))
+    golf_manager.load_from_sheets()
+    for index in range(10):
+        golf_manager.save_to_sheets(build_round(golf_manager, 'player1', 'course1', f'2025-01-{index + 1:02d}'))
+
+    rounds = golf_manager.load_from_sheets()
+    assert len(rounds) == 310
+    for index in range(PLAYER_COUNT):
+        player_name = f'player{index}'
+        assert golf_manager.get_player_statistics(player_name) == compute_player_statistics(
+            player_name, sorted_by_date(rounds, player_name))
+    assert golf_manager.rebuild_player_statistics()['mismatched_players'] == []
+
+
+def test_statistics_do_not_read_sheet(golf_manager, score_sheet, emulator):
+    score_sheet(make_score_rows(100))
+    golf_manager.load_from_sheets()
+    emulator.reset_stats()
+
+    for index in range(PLAYER_COUNT):
+        golf_manager.get_player_statistics(f'player{index}')
+    assert emulator.stats()['calls'] == {}
+
+
+def test_rebuild_reports_mismatched_players(golf_manager, score_sheet):
+    score_sheet(make_score_rows(50))
+    golf_manager.load_from_sheets()
+    golf_manager._player_stats.add({'player_name': 'player0', 'date': '2024-01-01', 'total_score': 200}, 999)
+
+    assert golf_manager.rebuild_player_statistics()['mismatched_players'] == ['player0']
+    assert golf_manager.rebuild_player_statistics()['mismatched_players'] == []
+
+
+def test_statistics_without_rounds(golf_manager):
+    assert 'message' in golf_manager.get_player_statistics('nobody')
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+할당량 스케줄러 우선순위/백오프 재시도 테스트
+"""
+
+import threading
+import time
+
+import pytest
+
+from quota_scheduler import (PRIORITY_READ, PRIORITY_REFRESH, PRIORITY_WRITE, QuotaScheduler, TokenBucket,
+                             request_priority)
+from storage import QuotaExhausted, StorageError
+
+
+def make_backend(emulator, spreadsheet_id, **options):
+    """빠른 백오프(1ms)와 주어진 할당량을 쓰는 에뮬레이터 백엔드"""
+    options = {'read_per_minute': 0, 'write_per_minute': 0, 'backoff_base': 0.001, **options}
+    scheduler = QuotaScheduler(**options)
+    emulator.load_rows(spreadsheet_id, 'Score', [['a', 'b']])
+    emulator.reset_stats()
+    return emulator.backend(spreadsheet_id, scheduler), scheduler
+
+
+def test_waiting_requests_get_tokens_in_priority_order():
+    bucket = TokenBucket(per_minute=240, capacity=1)  # 0.25초마다 토큰 하나
+    assert bucket.acquire(PRIORITY_READ, timeout=0)
+    order = []
+
+    def acquire(priority):
+        assert bucket.acquire(priority, timeout=5)
+        order.append(priority)
+
+    threads = []
+    for priority in (PRIORITY_REFRESH, PRIORITY_READ, PRIORITY_WRITE):
+        thread = threading.Thread(target=acquire, args=(priority,))
+        thread.start()
+        threads.append(thread)
+        while bucket.stats()['waiting'] < len(threads):
+            time.sleep(0.001)
+    for thread in threads:
+        thread.join()
+
+    assert order == [PRIORITY_WRITE, PRIORITY_READ, PRIORITY_REFRESH]
+    assert bucket.stats()['acquired'] == 4
+
+
+def test_bucket_timeout():
+    bucket = TokenBucket(per_minute=1, capacity=1)
+    assert bucket.acquire(PRIORITY_READ, timeout=0)
+    assert not bucket.acquire(PRIORITY_READ, timeout=0.01)
+    assert bucket.stats()['throttled'] == 1
+
+
+def test_retry_delay_backoff():
+    scheduler = QuotaScheduler(backoff_base=1.0, backoff_max=4.0, max_retries=5)
+    for attempt, ceiling in enumerate([1.0, 2.0, 4.0, 4.0]):
+        delay = scheduler.retry_delay('values.get', 503, attempt, False, PRIORITY_READ)
+        assert ceiling / 2 <= delay <= ceiling
+    assert scheduler.retry_delay('values.get', 503, 5, False, PRIORITY_READ) is None
+    assert scheduler.retry_delay('values.get', 404, 0, False, PRIORITY_READ) is None
+    assert scheduler.retry_delay('values.get', 429, 0, False, PRIORITY_REFRESH) is None
+
+
+@pytest.mark.parametrize('status', [429, 500, 503])
+def test_retries_transient_errors(emulator, spreadsheet_id, status):
+    backend, scheduler = make_backend(emulator, spreadsheet_id)
+    emulator.fail_next(2, status)
+
+    assert backend.get('Score!A1:B1') == [['a', 'b']]
+    assert emulator.stats() == {'calls': {'values.get': 3}, 'injected_errors': 2}
+    assert scheduler.stats()['retries'] == 2
+    assert scheduler.stats()['rate_limited'] == (2 if status == 429 else 0)
+
+
+def test_gives_up_after_max_retries(emulator, spreadsheet_id):
+    backend, scheduler = make_backend(emulator, spreadsheet_id, max_retries=2)
+    emulator.fail_next(3, 503)
+
+    with pytest.raises(StorageError) as error:
+        backend.get('Score!A1:B1')
+    assert error.value.status == 503
+    assert emulator.stats()['calls'] == {'values.get': 3}
+
+
+def test_does_not_retry_client_errors(emulator, spreadsheet_id):
+    backend, _ = make_backend(emulator, spreadsheet_id)
+    emulator.fail_next(1, 400)
+
+    with pytest.raises(StorageError) as error:
+        backend.append('Score!A:B', [['c', 'd']])
+    assert error.value.status == 400
+    assert emulator.stats()['calls'] == {'values.append': 1}
+
+
+def test_refresh_requests_fail_fast(emulator, spreadsheet_id):
+    backend, _ = make_backend(emulator, spreadsheet_id)
+    emulator.fail_next(1, 429)
+
+    with request_priority(PRIORITY_REFRESH), pytest.raises(StorageError):
+        backend.get('Score!A1:B1')
+    assert emulator.stats()['calls'] == {'values.get': 1}
+
+
+def test_quota_exhausted_without_sending(emulator, spreadsheet_id):
+    backend, scheduler = make_backend(emulator, spreadsheet_id, read_per_minute=1, max_wait=0)
+    backend.get('Score!A1:B1')
+
+    with pytest.raises(QuotaExhausted):
+        backend.get('Score!A1:B1')
+    with request_priority(PRIORITY_REFRESH), pytest.raises(QuotaExhausted):
+        backend.get('Score!A1:B1')
+    assert emulator.stats()['calls'] == {'values.get': 1}
+    # 쓰기는 별도 할당량
+    backend.append('Score!A:B', [['c', 'd']])
+    assert scheduler.stats()['read']['throttled'] == 2
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+버전 기반 읽기 캐시 테스트 (TTL, 무효화, 크기 한도, 저장 후 무효화)
+"""
+
+import time
+
+from read_cache import VersionedReadCache
+
+
+def cache_with(key='rounds', value='value', **options):
+    cache = VersionedReadCache(**options)
+    assert cache.put(key, value, 10, cache.begin_load())
+    return cache
+
+
+def test_get_within_ttl():
+    cache = cache_with(ttl=30)
+    assert cache.get('rounds') == 'value'
+    assert cache.get('other') is None
+    assert (cache.stats()['hits'], cache.stats()['misses']) == (1, 1)
+
+
+def test_expired_entry():
+    cache = cache_with(ttl=0.01)
+    time.sleep(0.02)
+    assert cache.get('rounds') is None
+
+
+def test_invalidate_key_and_all():
+    cache = cache_with()
+    cache.put('other', 'other', 10, cache.begin_load())
+
+    cache.invalidate('rounds')
+    assert cache.get('rounds') is None
+    assert cache.get('other') == 'other'
+    cache.invalidate()
+    assert cache.get('other') is None
+    assert cache.stats()['bytes'] == 0
+
+
+def test_invalidate_during_load_discards_result():
+    cache = VersionedReadCache()
+    version = cache.begin_load()
+    cache.invalidate('rounds')  # 읽는 동안 다른 요청이 저장
+
+    assert not cache.put('rounds', 'stale', 10, version)
+    assert cache.get('rounds') is None
+    assert cache.put('rounds', 'fresh', 10, cache.begin_load())
+
+
+def test_size_limit_evicts_least_recently_used():
+    cache = VersionedReadCache(max_bytes=25)
+    for key in ('a', 'b'):
+        cache.put(key, key, 10, cache.begin_load())
+    cache.get('a')
+    cache.put('c', 'c', 10, cache.begin_load())
+
+    assert [cache.get(key) for key in ('a', 'b', 'c')] == ['a', None, 'c']
+    assert cache.stats()['evictions'] == 1
+    assert not cache.put('huge', 'huge', 26, cache.begin_load())
+
+
+def test_disabled_with_zero_ttl():
+    cache = VersionedReadCache(ttl=0)
+    assert not cache.put('rounds', 'value', 10, cache.begin_load())
+
+
+def test_manager_save_invalidates_rounds(golf_manager):
+    golf_manager.load_from_sheets()
+    golf_manager.load_from_sheets()
+    assert golf_manager.get_read_cache_stats()['hits'] == 1
+
+    golf_manager.save_to_sheets(golf_manager.create_golf_round('kim', 'course1', date='2024-05-01'))
+    assert [r['player_name'] for r in golf_manager.load_from_sheets()] == ['kim']
+    assert golf_manager.get_read_cache_stats()['invalidations'] >= 1
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+라운드 스트리밍 내보내기 테스트 (가져오기 왕복, GET /api/rounds/export, 도중 실패 표시)
+"""
+
+import csv
+import io
+import json
+
+import pytest
+
+import app
+from conftest import build_round, new_spreadsheet_id
+from golf_score_manager import GolfScoreManager
+from metrics import EXPORT_ERRORS
+from round_export import CSV_ERROR_MARKER, export_chunks, export_rounds, guarded_chunks
+from round_import import import_rounds
+from storage import StorageError
+
+PASSWORD = 'password1'
+
+
+def export_text(manager, fmt: str, player_name: str = None) -> str:
+    return ''.join(export_chunks(export_rounds(manager, player_name), fmt))
+
+
+def save_rounds(manager, count: int):
+    manager.save_rounds([build_round(manager, f'player{day % 3}', 'course1', f'2024-05-{day:02d}')
+                         for day in range(1, count + 1)])
+
+
+@pytest.fixture
+def target_manager(emulator):
+    """가져오기 대상 (같은 에뮬레이터의 빈 스프레드시트)"""
+    spreadsheet_id = new_spreadsheet_id()
+    manager = GolfScoreManager(spreadsheet_id, write_behind=False, backend=emulator.backend(spreadsheet_id))
+    yield manager
+    manager.close()
+
+
+@pytest.fixture
+def client(golf_manager, user_manager, monkeypatch):
+    monkeypatch.setattr(app, 'golf_manager', golf_manager)
+    monkeypatch.setattr(app, 'user_manager', user_manager)
+    client = app.app.test_client()
+    assert user_manager.register_user('player1', 'player1@example.com', PASSWORD)['success']
+    response = client.post('/api/auth/login', json={'username_or_email': 'player1', 'password': PASSWORD})
+    assert response.status_code == 200
+    return client
+
+
+def failing_rounds(manager, count: int):
+    """라운드 count개를 반환한 뒤 저장소 오류를 던지는 iter_rounds"""
+    def iter_rounds():
+        rounds = manager.load_from_sheets()
+        yield from rounds[:count]
+        raise StorageError('Quota exceeded', status=429)
+    return iter_rounds
+
+
+@pytest.mark.parametrize('fmt', ['csv', 'jsonl'])
+def test_export_import_round_trip(golf_manager, target_manager, monkeypatch, fmt):
+    monkeypatch.setattr('round_export.EXPORT_CHUNK_ROUNDS', 7)
+    save_rounds(golf_manager, 25)
+    chunks = list(export_chunks(export_rounds(golf_manager), fmt))
+    assert len(chunks) == 4
+
+    results = list(import_rounds(io.StringIO(''.join(chunks)), fmt, target_manager.save_rounds, chunk_rows=10))
+    assert results[-1]['done'] and (results[-1]['imported'], results[-1]['failed']) == (25, 0)
+    assert export_text(target_manager, fmt) == ''.join(chunks)
+
+
+def test_export_single_player(golf_manager):
+    save_rounds(golf_manager, 12)
+    lines = export_text(golf_manager, 'jsonl', 'player1').splitlines()
+    assert [json.loads(line)['date'] for line in lines] == [f'2024-05-{day:02d}' for day in (1, 4, 7, 10)]
+
+
+def test_guarded_chunks_ends_with_error_marker(capsys):
+    def chunks():
+        yield 'a\n'
+        raise StorageError('boom, "quoted"', status=503)
+
+    before = EXPORT_ERRORS.value('csv')
+    text = ''.join(guarded_chunks(chunks(), 'csv'))
+    assert list(csv.reader(io.StringIO(text))) == [['a'], [CSV_ERROR_MARKER, 'boom, "quoted"']]
+    assert EXPORT_ERRORS.value('csv') == before + 1
+    assert '내보내기 중단' in capsys.readouterr().out
+    assert ''.join(guarded_chunks(iter(['a\n', 'b\n']), 'csv')) == 'a\nb\n'
+
+
+@pytest.mark.parametrize('fmt', ['csv', 'jsonl'])
+def test_export_endpoint(client, golf_manager, fmt):
+    save_rounds(golf_manager, 9)
+    assert client.get('/api/rounds/export?player=player2').status_code == 403
+    assert client.get('/api/rounds/export?format=xml').status_code == 400
+
+    response = client.get(f'/api/rounds/export?format={fmt}')
+    assert response.status_code == 200
+    assert 'attachment' in response.headers['Content-Disposition']
+    assert response.get_data(as_text=True) == export_text(golf_manager, fmt, 'player1')
+
+
+def test_export_endpoint_marks_mid_stream_errors(client, golf_manager, monkeypatch):
+    monkeypatch.setattr('round_export.EXPORT_CHUNK_ROUNDS', 1)  # 실패 전에 읽은 라운드는 이미 전송됨
+    save_rounds(golf_manager, 9)
+    monkeypatch.setattr(golf_manager, 'iter_rounds', failing_rounds(golf_manager, 6))
+    before = EXPORT_ERRORS.value('jsonl')
+
+    lines = client.get('/api/rounds/export?format=jsonl').get_data(as_text=True).splitlines()
+    assert [json.loads(line).get('date') for line in lines[:-1]] == ['2024-05-01', '2024-05-04']
+    assert json.loads(lines[-1]) == {'error': 'Quota exceeded'}
+    assert EXPORT_ERRORS.value('jsonl') == before + 1
+
+    rows = list(csv.reader(io.StringIO(client.get('/api/rounds/export').get_data(as_text=True))))
+    assert len(rows) == 1 + 2 + 1
+    assert rows[-1] == [CSV_ERROR_MARKER, 'Quota exceeded']
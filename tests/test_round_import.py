@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+라운드 일괄 가져오기 테스트 (검증, 묶음 저장, 체크포인트 재개, POST /api/rounds/import)
+"""
+
+import io
+import json
+import random
+
+import pytest
+
+import app
+import round_import
+import sheets_emulator
+import storage
+from conftest import new_spreadsheet_id
+from golf_score_manager import GolfScoreManager
+from round_import import build_round, import_rounds
+
+PASSWORD = 'password1'
+
+
+def make_rounds(count: int, seed: int = 0, players: int = 3):
+    rng = random.Random(seed)
+    return [build_round(f'2024-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}', f'player{rng.randrange(players)}',
+                        f'course{rng.randrange(3)}',
+                        [[rng.choice((3, 4, 5)), 1, rng.randint(0, 1), rng.randint(1, 2), rng.randint(1, 3)]
+                         for _ in range(18)])
+            for _ in range(count)]
+
+
+def jsonl_lines(rounds):
+    """라운드마다 JSON Lines 한 줄"""
+    return [json.dumps(round_data.to_dict(), ensure_ascii=False) + '\n' for round_data in rounds]
+
+
+def csv_text(rounds, header: bool = True) -> str:
+    lines = ['날짜,플레이어,코스,총 스코어,핸디캡\n'] if header else []
+    lines += [','.join(map(str, round_data.to_row())) + '\n' for round_data in rounds]
+    return ''.join(lines)
+
+
+def saved_rows(manager):
+    return [round_data.to_row() for round_data in manager.load_from_sheets()]
+
+
+@pytest.fixture
+def target_manager(emulator):
+    """가져오기 대상 (같은 에뮬레이터의 빈 스프레드시트)"""
+    spreadsheet_id = new_spreadsheet_id()
+    manager = GolfScoreManager(spreadsheet_id, write_behind=False, backend=emulator.backend(spreadsheet_id))
+    yield manager
+    manager.close()
+
+
+@pytest.mark.parametrize('date, holes, message', [
+    ('2024/05/01', [[4, 1, 0, 1, 2]] * 18, '날짜'),
+    ('2024-05-01', [[4, 1, 0, 1, 2]] * 17, '홀 수'),
+    ('2024-05-01', [[7, 1, 0, 1, 2]] * 18, 'par'),
+    ('2024-05-01', [[4, -1, 0, 1, 2]] * 18, '음수'),
+    ('2024-05-01', [[4, '1.5', 0, 1, 2]] * 18, '정수'),
+    ('2024-05-01', [[4, 'x', 0, 1, 2]] * 18, '숫자'),
+])
+def test_build_round_validation(date, holes, message):
+    with pytest.raises(ValueError, match=message):
+        build_round(date, 'kim', 'course1', holes)
+
+
+def test_build_round_computes_totals():
+    round_data = build_round('2024-05-01', ' kim ', 'course1', [[4, '1', '', 1.0, 2]] * 18)
+    assert (round_data.player_name, round_data.total_score, round_data.handicap) == ('kim', 72, 0)
+    assert round_data.hole(0) == {'par': 4, 'driver': 1, 'wood_util': 0, 'iron': 1, 'putter': 2, 'total': 4}
+
+
+def test_csv_import_recomputes_totals(target_manager, emulator):
+    rounds = make_rounds(5)
+    rows = [round_data.to_row() for round_data in rounds]
+    text = csv_text(rounds).replace(f',{rows[0][3]},{rows[0][4]},', ',999,999,', 1) + '\n,,\n'
+    assert ',999,999,' in text
+
+    emulator.reset_stats()
+    result = list(import_rounds(io.StringIO(text), 'csv', target_manager.save_rounds, chunk_rows=2))
+    assert [progress['imported'] for progress in result] == [2, 4, 5]
+    assert emulator.stats()['calls']['values.append'] == 3
+    assert saved_rows(target_manager) == rows
+
+
+def test_import_reports_bad_records(target_manager):
+    good = jsonl_lines(make_rounds(3))
+    stream = io.StringIO(good[0] + '{"date": "2024-01-01"}\nnot json\n' + good[1] + good[2])
+
+    result = list(import_rounds(stream, 'jsonl', target_manager.save_rounds))[-1]
+    assert (result['imported'], result['failed']) == (3, 2)
+    assert [error['line'] for error in result['errors']] == [2, 3]
+
+
+def test_import_rejects_other_players(target_manager):
+    rounds = make_rounds(30)
+    stream = io.StringIO(''.join(jsonl_lines(rounds)))
+
+    result = list(import_rounds(stream, 'jsonl', target_manager.save_rounds, player_name='player0'))[-1]
+    owned = sum(1 for r in rounds if r.player_name == 'player0')
+    assert (result['imported'], result['failed']) == (owned, len(rounds) - owned)
+    assert {r['player_name'] for r in target_manager.load_from_sheets()} == {'player0'}
+
+
+def test_import_resumes_after_checkpoint(target_manager):
+    text = ''.join(jsonl_lines(make_rounds(10)))
+    first = next(import_rounds(io.StringIO(text), 'jsonl', target_manager.save_rounds, chunk_rows=4))
+
+    # 첫 묶음 이후 중단되었다가 체크포인트의 records부터 이어서 가져옴
+    result = list(import_rounds(io.StringIO(text), 'jsonl', target_manager.save_rounds, chunk_rows=4,
+                                skip_records=first['records']))[-1]
+    assert (first['imported'], result['imported'], result['records']) == (4, 6, 10)
+    assert len(target_manager.load_from_sheets()) == 10
+
+
+def test_cli_resumes_from_checkpoint_file(emulator, spreadsheet_id, tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr(storage, 'STORAGE_BACKEND', 'emulator')
+    monkeypatch.setattr(sheets_emulator, '_shared_emulator', emulator)
+    rounds = make_rounds(10)
+    path = tmp_path / 'history.csv'
+    path.write_text(csv_text(rounds), encoding='utf-8')
+    argv = [str(path), '--chunk-rows', '4', '--spreadsheet-id', spreadsheet_id]
+
+    original = GolfScoreManager.save_rounds
+    calls = []
+
+    def interrupted(manager, chunk):
+        calls.append(len(chunk))
+        if len(calls) == 2:
+            raise storage.StorageError('backend unavailable', status=503)
+        return original(manager, chunk)
+
+    monkeypatch.setattr(GolfScoreManager, 'save_rounds', interrupted)
+    assert round_import.main(argv) == 1
+    checkpoint = json.loads((tmp_path / 'history.csv.import-checkpoint.json').read_text(encoding='utf-8'))
+    assert (checkpoint['records'], checkpoint['imported'], checkpoint['done']) == (4, 4, False)
+
+    assert round_import.main(argv) == 0
+    assert calls == [4, 4, 4, 2]  # 두 번째 묶음부터 다시 저장
+    assert round_import.main(argv) == 0
+    assert '이미 가져오기를 마친 파일' in capsys.readouterr().out
+
+    manager = GolfScoreManager(spreadsheet_id, write_behind=False, backend=emulator.backend(spreadsheet_id))
+    assert saved_rows(manager) == [round_data.to_row() for round_data in rounds]
+
+
+@pytest.fixture
+def client(golf_manager, user_manager, monkeypatch):
+    monkeypatch.setattr(app, 'golf_manager', golf_manager)
+    monkeypatch.setattr(app, 'user_manager', user_manager)
+    client = app.app.test_client()
+    assert user_manager.register_user('player0', 'player0@example.com', PASSWORD)['success']
+    response = client.post('/api/auth/login', json={'username_or_email': 'player0', 'password': PASSWORD})
+    assert response.status_code == 200
+    return client
+
+
+def test_import_endpoint(client, golf_manager):
+    rounds = make_rounds(20)
+    response = client.post('/api/rounds/import', data=''.join(jsonl_lines(rounds)),
+                           content_type='application/x-ndjson')
+    result = [json.loads(line) for line in response.get_data(as_text=True).splitlines()][-1]
+
+    owned = [r.to_row() for r in rounds if r.player_name == 'player0']
+    assert result['done'] and (result['imported'], result['failed']) == (len(owned), len(rounds) - len(owned))
+    assert saved_rows(golf_manager) == owned
+
+
+def test_import_endpoint_multipart(client, golf_manager):
+    rounds = make_rounds(6, players=1)
+    upload = (io.BytesIO(csv_text(rounds).encode('utf-8')), 'history.csv')
+    response = client.post('/api/rounds/import?skip=2', data={'file': upload}, content_type='multipart/form-data')
+    result = [json.loads(line) for line in response.get_data(as_text=True).splitlines()][-1]
+
+    assert (result['imported'], result['records']) == (4, 6)
+    assert saved_rows(golf_manager) == [r.to_row() for r in rounds[2:]]
+
+
+def test_import_endpoint_rejects_bad_requests(client):
+    assert client.post('/api/rounds/import', data={'rounds': 'x'}).status_code == 415
+    assert client.post('/api/rounds/import', data={'other': (io.BytesIO(b'x'), 'x.csv')},
+                       content_type='multipart/form-data').status_code == 400
+    assert client.post('/api/rounds/import', data='x', content_type='text/plain').status_code == 400
+    assert client.post('/api/rounds/import', data='', content_type='text/csv').status_code == 400
+    assert client.post('/api/rounds/import?skip=x', data='x', content_type='text/csv').status_code == 400
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+GolfRound 테스트 (정수 배열 크기 자동 확장, 딕셔너리 호환)
+"""
+
+import pytest
+
+from round_model import GolfRound, compact_array
+
+
+@pytest.mark.parametrize('value, typecode', [
+    (100, 'b'), (-128, 'b'), (300, 'h'), (40000, 'i'), (2 ** 31, 'q'), (-(2 ** 63), 'q'),
+])
+def test_compact_array_picks_smallest_type(value, typecode):
+    values = compact_array([1, value])
+    assert values.typecode == typecode
+    assert values.tolist() == [1, value]
+
+
+def test_compact_array_rejects_values_beyond_8_bytes():
+    with pytest.raises(OverflowError):
+        compact_array([2 ** 63])
+
+
+def test_set_hole_widens_details():
+    round_data = GolfRound.new('kim', 'course1', '2024-05-01')
+    assert round_data.hole_values().typecode == 'b'
+
+    round_data.set_hole(1, 4, 200, 0, 0, 2)
+    assert round_data.hole_values().typecode == 'h'
+    assert round_data.hole(0) == {'par': 4, 'driver': 200, 'wood_util': 0, 'iron': 0, 'putter': 2, 'total': 202}
+
+    round_data.set_hole(2, 4, 2 ** 40, 0, 0, 0)
+    assert round_data.hole_values().typecode == 'q'
+    assert round_data['scores'][:3] == [202, 2 ** 40, 0]
+    assert round_data.total_score == 202 + 2 ** 40
+    # 이미 저장된 값은 확장 후에도 그대로 유지
+    assert round_data.hole(0)['total'] == 202 and round_data.hole(17)['par'] == 4
+
+
+def test_set_score_widens_scores():
+    round_data = GolfRound.new('kim', 'course1', '2024-05-01')
+    round_data.set_score(3, 1000)
+    assert round_data['scores'][2] == 1000
+    assert round_data.total_score == 1000
+
+
+def test_overflow_beyond_8_bytes_raises():
+    round_data = GolfRound.new('kim', 'course1', '2024-05-01')
+    with pytest.raises(OverflowError):
+        round_data.set_score(1, 2 ** 63)
+
+
+def test_reads_like_dict_round():
+    round_data = GolfRound.new('kim', 'course1', '2024-05-01', holes=9)
+    round_data.set_hole(1, 5, 1, 1, 1, 2)
+    round_data['handicap'] = 3
+
+    as_dict = round_data.to_dict()
+    assert list(as_dict) == ['player_name', 'course_name', 'date', 'holes', 'scores', 'detailed_scores',
+                             'total_score', 'par_scores', 'handicap']
+    assert as_dict['holes'] == 9 and as_dict['handicap'] == 3
+    assert as_dict['total_score'] == 5 and as_dict['scores'][0] == 5
+    assert round_data.to_row()[:11] == ['2024-05-01', 'kim', 'course1', 5, 3, 5, 1, 1, 1, 2, 5]
+    with pytest.raises(KeyError):
+        round_data['holes'] = 18
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Score 시트 행 파서 테스트 (빈 셀, UNFORMATTED_VALUE 숫자, 짧은 행, 범위 초과)
+"""
+
+import pytest
+
+from conftest import make_score_rows
+from score_parser import DETAIL_DEFAULTS, ROW_LENGTH, parse_score_row, to_int
+
+
+@pytest.mark.parametrize('value, expected', [
+    (5, 5), (4.0, 4), (4.7, 4), ('-2', -2), ('+3', 3), (' 5 ', 5), ('1,234', 1234), ('4.0', 4),
+    ('', 0), (None, 0), ('abc', 0), (float('nan'), 0), (float('inf'), 0), ('inf', 0),
+])
+def test_to_int(value, expected):
+    assert to_int(value) == expected
+
+
+def test_row_of_strings():
+    row = [str(value) for value in make_score_rows(1)[0]]
+    round_data = parse_score_row(row)
+    assert round_data.to_row() == make_score_rows(1)[0]
+
+
+def test_unformatted_numbers():
+    row = make_score_rows(1)[0]
+    row[3:] = [float(value) for value in row[3:]]
+    row[5] = 5.0
+    round_data = parse_score_row(row)
+
+    assert round_data.total_score == make_score_rows(1)[0][3]
+    assert round_data.hole(0)['par'] == 5
+    assert round_data.hole_values().typecode == 'b'
+
+
+def test_blank_cells_use_defaults():
+    row = make_score_rows(1)[0]
+    row[3] = ''
+    row[5:11] = ['', '', '1', ' ', None, '']
+    round_data = parse_score_row(row)
+
+    assert round_data.total_score == 0
+    assert round_data.hole(0) == {'par': 4, 'driver': 0, 'wood_util': 1, 'iron': 0, 'putter': 0, 'total': 0}
+    assert round_data.hole(1) == parse_score_row(make_score_rows(1)[0]).hole(1)
+
+
+def test_short_rows():
+    assert parse_score_row(['2024-05-01', 'kim', 'course1', '72']) is None
+
+    round_data = parse_score_row(['2024-05-01', 'kim', 'course1', '72', '0'])
+    assert round_data.holes == 18
+    assert list(round_data.hole_values()) == DETAIL_DEFAULTS
+
+    row = make_score_rows(1)[0][:5 + 6 * 2]
+    round_data = parse_score_row(row)
+    assert list(round_data.hole_values())[:12] == row[5:]
+    assert list(round_data.hole_values())[12:] == DETAIL_DEFAULTS[12:]
+
+
+def test_extra_cells_are_ignored():
+    row = make_score_rows(1)[0] + ['memo', 99]
+    assert len(parse_score_row(row).to_row()) == ROW_LENGTH
+
+
+def test_values_beyond_8_bytes_skip_row(capsys):
+    row = make_score_rows(1)[0]
+    row[6] = str(2 ** 70)
+    assert parse_score_row(row) is None
+    assert '건너뜁니다' in capsys.readouterr().out
+
+    # 8바이트 범위 안의 큰 값은 그대로 읽음
+    row[6] = 2 ** 40
+    assert parse_score_row(row).hole(0)['driver'] == 2 ** 40
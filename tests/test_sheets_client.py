@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Sheets 클라이언트 팩토리/서비스 풀 테스트 (네트워크 없이 실행)
+"""
+
+import threading
+import time
+
+import pytest
+from google.oauth2.credentials import Credentials
+
+from sheets_client import SheetsClientFactory, sheets_discovery_document
+
+
+class FakeService:
+    def __init__(self, credentials):
+        self.credentials = credentials
+
+
+@pytest.fixture
+def factory(monkeypatch):
+    factory = SheetsClientFactory(Credentials(token='token-1'), pool_size=2)
+    monkeypatch.setattr(factory, '_build_service', FakeService)
+    return factory
+
+
+def test_bundled_discovery_document_builds_service():
+    assert sheets_discovery_document()['name'] == 'sheets'
+    assert sheets_discovery_document() is sheets_discovery_document()
+
+    _, service = SheetsClientFactory(Credentials(token='token-1')).new_service()
+    assert hasattr(service, 'spreadsheets')
+
+
+def test_lease_reuses_service(factory):
+    pool = factory.service_pool()
+    with pool.lease() as first:
+        pass
+    with pool.lease() as second:
+        assert second is first
+    assert pool.stats() == {'size': 2, 'open': 1, 'idle': 1, 'leases': 2, 'waits': 0, 'builds': 1}
+
+
+def test_pool_is_bounded(factory):
+    pool = factory.service_pool()
+    leased = []
+    release = threading.Event()
+    waiting = threading.Event()
+
+    def hold():
+        with pool.lease() as service:
+            leased.append(service)
+            release.wait(5)
+
+    holders = [threading.Thread(target=hold) for _ in range(2)]
+    for thread in holders:
+        thread.start()
+    while len(leased) < 2:
+        time.sleep(0.01)
+
+    def third():
+        waiting.set()
+        with pool.lease() as service:
+            leased.append(service)
+
+    waiter = threading.Thread(target=third)
+    waiter.start()
+    waiting.wait(5)
+    waiter.join(0.1)
+    assert waiter.is_alive()  # 서비스 2개가 모두 사용 중이라 기다림
+
+    release.set()
+    for thread in holders + [waiter]:
+        thread.join(5)
+    assert leased[2] in leased[:2]
+    stats = pool.stats()
+    assert (stats['open'], stats['builds'], stats['waits']) == (2, 2, 1)
+
+
+def test_swapped_credentials_replace_services(factory):
+    pool = factory.service_pool()
+    with pool.lease() as old_service:
+        factory.swap_credentials(Credentials(token='token-2'))
+    assert pool.stats()['open'] == 0  # 이전 인증 정보의 서비스는 반납할 때 버림
+
+    with pool.lease() as service:
+        assert service is not old_service
+        assert service.credentials.token == 'token-2'
+
+
+def test_failed_build_releases_slot(factory, monkeypatch):
+    pool = factory.service_pool()
+
+    def broken(credentials):
+        raise RuntimeError('discovery failed')
+
+    monkeypatch.setattr(factory, '_build_service', broken)
+    for _ in range(3):
+        with pytest.raises(RuntimeError):
+            with pool.lease():
+                pass
+    assert pool.stats()['open'] == 0
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Sheets v4 에뮬레이터 테스트 (values API 형태, 값 변환, 지연/오류 주입)
+"""
+
+import time
+
+import pytest
+from googleapiclient.errors import HttpError
+
+from sheets_emulator import SheetsEmulator
+
+
+def values(emulator):
+    return emulator.spreadsheets().values()
+
+
+def test_append_and_get(emulator, spreadsheet_id):
+    result = values(emulator).append(spreadsheetId=spreadsheet_id, range='Score!A:C',
+                                     body={'values': [['a', 1, 2.5], ['b', 3]]}).execute()
+    assert result['updates']['updatedRange'] == 'Score!A1:C2'
+
+    result = values(emulator).append(spreadsheetId=spreadsheet_id, range='Score!A:C',
+                                     body={'values': [['c']]}).execute()
+    assert result['updates']['updatedRange'] == 'Score!A3:A3'
+
+    formatted = values(emulator).get(spreadsheetId=spreadsheet_id, range='Score!A1:C').execute()
+    assert formatted['values'] == [['a', '1', '2.5'], ['b', '3'], ['c']]
+    unformatted = values(emulator).get(spreadsheetId=spreadsheet_id, range='Score!B1:C2',
+                                       valueRenderOption='UNFORMATTED_VALUE').execute()
+    assert unformatted['values'] == [[1, 2.5], [3]]
+
+
+def test_user_entered_numbers(emulator, spreadsheet_id):
+    values(emulator).update(spreadsheetId=spreadsheet_id, range='Member!A1', valueInputOption='USER_ENTERED',
+                            body={'values': [['42', '1.5', 'x42', None]]}).execute()
+    result = values(emulator).get(spreadsheetId=spreadsheet_id, range='Member!A1:D1',
+                                  valueRenderOption='UNFORMATTED_VALUE').execute()
+    assert result['values'] == [[42, 1.5, 'x42']]
+
+
+def test_batch_get_and_batch_update(emulator, spreadsheet_id):
+    emulator.load_rows(spreadsheet_id, 'Member', [['id1', 'kim'], ['id2', 'lee']])
+    result = values(emulator).batchUpdate(spreadsheetId=spreadsheet_id, body={
+        'valueInputOption': 'RAW',
+        'data': [{'range': 'Member!C1', 'values': [['x']]}, {'range': 'Member!C2', 'values': [['y']]}]
+    }).execute()
+    assert result['totalUpdatedCells'] == 2
+
+    result = values(emulator).batchGet(spreadsheetId=spreadsheet_id,
+                                       ranges=['Member!A1:C1', 'Member!A2:C2']).execute()
+    assert [value_range['values'] for value_range in result['valueRanges']] == [[['id1', 'kim', 'x']],
+                                                                                 [['id2', 'lee', 'y']]]
+
+
+def test_grid_limits(spreadsheet_id):
+    emulator = SheetsEmulator(row_count=10)
+    with pytest.raises(HttpError) as error:
+        values(emulator).get(spreadsheetId=spreadsheet_id, range='Score!A1:B11').execute()
+    assert error.value.resp.status == 400
+
+    # append는 격자를 늘림
+    values(emulator).append(spreadsheetId=spreadsheet_id, range='Score!A:A',
+                            body={'values': [[row] for row in range(12)]}).execute()
+    metadata = emulator.spreadsheets().get(spreadsheetId=spreadsheet_id).execute()
+    assert {sheet['properties']['title']: sheet['properties']['gridProperties']['rowCount']
+            for sheet in metadata['sheets']} == {'Score': 12, 'Member': 10}
+
+
+def test_fail_next_and_stats(emulator, spreadsheet_id):
+    emulator.fail_next(2, 503)
+    for _ in range(2):
+        with pytest.raises(HttpError) as error:
+            values(emulator).get(spreadsheetId=spreadsheet_id, range='Score!A1').execute()
+        assert error.value.resp.status == 503
+    values(emulator).get(spreadsheetId=spreadsheet_id, range='Score!A1').execute()
+    assert emulator.stats() == {'calls': {'values.get': 3}, 'injected_errors': 2}
+
+
+def test_error_rate_and_latency(spreadsheet_id):
+    emulator = SheetsEmulator(latency=0.01, error_rate=1.0, seed=1)
+    started = time.perf_counter()
+    with pytest.raises(HttpError) as error:
+        values(emulator).get(spreadsheetId=spreadsheet_id, range='Score!A1').execute()
+    assert error.value.resp.status == 429
+    assert time.perf_counter() - started >= 0.01
+
+
+def test_backend_and_managers(emulator, spreadsheet_id, golf_manager, user_manager):
+    """에뮬레이터 백엔드를 두 Manager에 주입"""
+    round_data = golf_manager.create_golf_round('kim', 'course1', date='2024-05-01')
+    golf_manager.save_to_sheets(round_data)
+    assert [r['player_name'] for r in golf_manager.load_from_sheets()] == ['kim']
+
+    assert user_manager.register_user('kim', 'kim@example.com', 'password1')['success']
+    assert user_manager.authenticate_user('kim', 'password1')['success']
+    assert emulator.stats()['calls']['values.append'] == 2
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+SQLite 저장소 백엔드 테스트 (시트와 같은 범위 읽기/쓰기, 트랜잭션 오류 처리)
+"""
+
+import sqlite3
+
+import pytest
+
+from conftest import build_round
+from golf_score_manager import GolfScoreManager
+from storage import SQLiteBackend, StorageError
+
+
+@pytest.fixture
+def backend(tmp_path):
+    backend = SQLiteBackend(str(tmp_path / 'golf.db'))
+    yield backend
+    backend.close()
+
+
+def test_append_and_get(backend):
+    assert backend.append('Member!A:F', [['id1', 'kim', 'kim@example.com'], ['id2', 'lee']]) == 1
+    assert backend.append('Member!A:F', [['id3', 'park', '', 'hash']]) == 3
+
+    assert backend.get('Member!A1:C') == [['id1', 'kim', 'kim@example.com'], ['id2', 'lee'], ['id3', 'park']]
+    assert backend.get('Member!B2:D3') == [['lee'], ['park', '', 'hash']]
+    assert backend.get('Member!A2') == [['id2']]
+    assert backend.row_count('Member') == 3
+
+
+def test_extra_columns_round_trip(backend):
+    row = ['2024-05-01', 'kim', 'course1', '72', '0'] + [str(value) for value in range(108)]
+    backend.append('Score!A:DI', [row])
+    assert backend.get('Score!A1:DI1') == [row]
+    assert backend.get('Score!F1:G1') == [['0', '1']]
+
+
+def test_batch_update(backend):
+    backend.append('Member!A:F', [['id1', 'kim'], ['id2', 'lee']])
+    backend.batch_update([('Member!F1', [['2024-05-01']]), ('Member!B2:C2', [['lee2', 'lee@example.com']]),
+                          ('Member!A4', [['id4']])])
+
+    assert backend.get('Member!A1:F') == [['id1', 'kim', '', '', '', '2024-05-01'],
+                                          ['id2', 'lee2', 'lee@example.com'], [], ['id4']]
+    assert list(backend.iter_rows('Member', 'F', start_row=2)) == [
+        (2, ['id2', 'lee2', 'lee@example.com']), (3, []), (4, ['id4'])]
+
+
+def test_locked_database_raises_storage_error(backend, tmp_path):
+    backend.append('Member!A:F', [['id1', 'kim']])
+    backend._connection().execute('PRAGMA busy_timeout = 0')
+    other = sqlite3.connect(str(tmp_path / 'golf.db'), isolation_level=None)
+    other.execute('BEGIN IMMEDIATE')
+    try:
+        # BEGIN IMMEDIATE가 실패해도 원래 오류가 StorageError로 전달되어야 함
+        with pytest.raises(StorageError, match='locked'):
+            backend.append('Member!A:F', [['id2', 'lee']])
+        with pytest.raises(StorageError, match='locked'):
+            backend.batch_update([('Member!F1', [['2024-05-01']])])
+    finally:
+        other.execute('ROLLBACK')
+        other.close()
+
+    assert backend.append('Member!A:F', [['id2', 'lee']]) == 2
+
+
+def test_failed_write_rolls_back(backend):
+    backend.append('Member!A:F', [['id1', 'kim']])
+    with pytest.raises(StorageError):
+        backend.batch_update([('Member!B1', [['kim2']]), ('Unknown!A1', [['x']])])
+    assert backend.get('Member!A1:B1') == [['id1', 'kim']]
+
+
+def test_unused_column_indexes_are_dropped(tmp_path):
+    path = str(tmp_path / 'old.db')
+    connection = sqlite3.connect(path)
+    connection.execute('CREATE TABLE member_rows (row_number INTEGER PRIMARY KEY, user_id TEXT, username TEXT, '
+                       'email TEXT, password_hash TEXT, created_at TEXT, last_login TEXT, extra TEXT)')
+    connection.execute('CREATE INDEX idx_member_rows_username ON member_rows (username)')
+    connection.commit()
+    connection.close()
+
+    backend = SQLiteBackend(path)
+    try:
+        indexes = backend._connection().execute("SELECT name FROM sqlite_master WHERE type = 'index'").fetchall()
+        assert indexes == []
+    finally:
+        backend.close()
+
+
+def test_golf_manager_on_sqlite(backend):
+    manager = GolfScoreManager('sqlite-test', write_behind=False, backend=backend)
+    try:
+        round_data = build_round(manager, 'kim', 'course1', '2024-05-01')
+        manager.save_to_sheets(round_data)
+        loaded = manager.load_from_sheets()
+        assert [(r['date'], r['total_score'], r['detailed_scores']) for r in loaded] == [
+            (round_data['date'], round_data['total_score'], round_data['detailed_scores'])]
+        assert manager.get_player_statistics('kim')['total_rounds'] == 1
+    finally:
+        manager.close()
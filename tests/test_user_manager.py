@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+UserManager 테스트 (사용자 인덱스, 로그인)
+"""
+
+import user_manager as user_manager_module
+
+PASSWORD = 'password1'
+
+
+def storage_calls(emulator) -> int:
+    return sum(emulator.stats()['calls'].values())
+
+
+def register(manager, *usernames):
+    for username in usernames:
+        assert manager.register_user(username, f'{username}@example.com', PASSWORD)['success']
+
+
+def other_process_row(emulator, spreadsheet_id, row_number: int, username: str, password_hash: str):
+    """다른 프로세스가 가입시킨 사용자처럼 Member 시트에 직접 기록"""
+    emulator.load_rows(spreadsheet_id, 'Member',
+                       [[f'id-{username}', username, f'{username}@example.com', password_hash,
+                         '2024-01-01 00:00:00', '']], start_row=row_number)
+
+
+def test_lookups_use_index(user_manager, emulator):
+    register(user_manager, 'kim', 'lee')
+    user_id = user_manager.get_user_by_username('lee')['user_id']
+    emulator.reset_stats()
+
+    for _ in range(20):
+        assert user_manager.get_user_by_username('kim')['email'] == 'kim@example.com'
+        assert user_manager.get_user_by_email('lee@example.com')['user_id'] == user_id
+        assert user_manager.get_user_by_id(user_id)['username'] == 'lee'
+    assert storage_calls(emulator) == 0
+
+
+def test_lookup_returns_copy(user_manager):
+    register(user_manager, 'kim')
+    user_manager.get_user_by_username('kim')['email'] = 'changed'
+    assert user_manager.get_user_by_username('kim')['email'] == 'kim@example.com'
+
+
+def test_misses_are_rate_limited(user_manager, emulator):
+    register(user_manager, 'kim')
+    user_manager.get_user_by_username('kim')
+    emulator.reset_stats()
+
+    for _ in range(50):
+        assert user_manager.get_user_by_username('nobody') is None
+        assert not user_manager.authenticate_user('nobody', PASSWORD)['success']
+    assert storage_calls(emulator) == 0
+
+
+def test_miss_rereads_rows_added_elsewhere(user_manager, emulator, spreadsheet_id, monkeypatch):
+    register(user_manager, 'kim')
+    other_process_row(emulator, spreadsheet_id, 3, 'park', user_manager._hash_password(PASSWORD))
+
+    assert user_manager.get_user_by_username('park') is None  # 간격 제한 안에서는 다시 읽지 않음
+    monkeypatch.setattr(user_manager_module, 'USER_INDEX_MISS_REFRESH_INTERVAL', 0)
+    assert user_manager.get_user_by_username('park')['user_id'] == 'id-park'
+    assert user_manager.authenticate_user('park@example.com', PASSWORD)['success']
+
+
+def test_register_rejects_duplicates(user_manager):
+    register(user_manager, 'kim')
+    assert not user_manager.register_user('kim', 'other@example.com', PASSWORD)['success']
+    assert not user_manager.register_user('other', 'kim@example.com', PASSWORD)['success']
+    assert len(user_manager.get_all_users()) == 1
+
+
+def test_authenticate(user_manager):
+    register(user_manager, 'kim')
+    assert user_manager.authenticate_user('kim', PASSWORD)['user']['username'] == 'kim'
+    assert user_manager.authenticate_user('kim@example.com', PASSWORD)['success']
+    assert not user_manager.authenticate_user('kim', 'wrong-password')['success']
+
+
+def member_rows(emulator, spreadsheet_id):
+    return emulator.backend(spreadsheet_id).get('Member!A2:F')
+
+
+def test_last_logins_are_batched(user_manager, emulator, spreadsheet_id):
+    register(user_manager, 'kim', 'lee')
+    for username in ('kim', 'lee', 'kim'):
+        assert user_manager.authenticate_user(username, PASSWORD)['success']
+    emulator.reset_stats()
+
+    assert user_manager.flush() == 3
+    assert emulator.stats()['calls'] == {'values.batchGet': 1, 'values.batchUpdate': 1}
+    rows = member_rows(emulator, spreadsheet_id)
+    assert [row[5] for row in rows] == [user_manager.get_user_by_username(name)['last_login'] for name in ('kim', 'lee')]
+
+
+def test_last_login_follows_moved_rows(user_manager, emulator, spreadsheet_id):
+    register(user_manager, 'kim', 'lee', 'park')
+    for username in ('kim', 'park'):
+        user_manager.authenticate_user(username, PASSWORD)
+
+    # 큐가 저장되기 전에 다른 프로세스가 kim의 행을 지우고 행 순서를 바꿈
+    rows = member_rows(emulator, spreadsheet_id)
+    emulator.load_rows(spreadsheet_id, 'Member', [rows[2][:5] + [''], rows[1][:5] + [''], [''] * 6], start_row=2)
+    user_manager.flush()
+
+    rows = member_rows(emulator, spreadsheet_id)
+    assert [row[1] for row in rows] == ['park', 'lee']
+    assert rows[0][5] == user_manager.get_user_by_username('park')['last_login']
+    assert len(rows[1]) == 5  # lee의 last_login은 그대로 비어 있음
+
+
+def test_register_users_detects_duplicates(user_manager):
+    register(user_manager, 'kim')
+    result = user_manager.register_users([
+        {'username': 'lee', 'email': 'lee@example.com', 'password': PASSWORD},
+        {'username': 'kim', 'email': 'kim2@example.com', 'password': PASSWORD},   # 기존 사용자명
+        {'username': 'park', 'email': 'kim@example.com', 'password': PASSWORD},   # 기존 이메일
+        {'username': 'lee', 'email': 'lee2@example.com', 'password': PASSWORD},   # 같은 묶음 안 중복
+        {'username': 'choi', 'email': 'lee@example.com', 'password': PASSWORD},   # 같은 묶음 안 중복
+        {'username': 'short', 'email': 'short@example.com', 'password': '123'},
+        {'username': 'jung', 'email': 'jung@example.com', 'password': PASSWORD},
+    ])
+
+    assert [user['username'] for user in result['registered']] == ['lee', 'jung']
+    assert [error['index'] for error in result['errors']] == [1, 2, 3, 4, 5]
+    assert [user['username'] for user in user_manager.get_all_users()] == ['kim', 'lee', 'jung']
+
+
+def test_register_users_reads_sheet_once(user_manager, emulator, spreadsheet_id):
+    register(user_manager, 'kim')
+    # 방금 인덱스를 읽었어도 다른 프로세스가 가입시킨 사용자와의 중복을 확인
+    other_process_row(emulator, spreadsheet_id, 3, 'park', 'hash')
+    emulator.reset_stats()
+
+    result = user_manager.register_users([
+        {'username': 'park', 'email': 'park2@example.com', 'password': PASSWORD},
+        {'username': 'lee', 'email': 'lee@example.com', 'password': PASSWORD},
+    ])
+
+    assert [user['username'] for user in result['registered']] == ['lee']
+    calls = emulator.stats()['calls']
+    assert (calls.get('values.batchGet'), calls.get('values.append')) == (1, 1)
+    assert [user['username'] for user in user_manager.get_all_users()] == ['kim', 'park', 'lee']
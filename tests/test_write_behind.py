@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+쓰기 지연 큐 테스트 (배치 전송, 재시도, 전송 포기, 큐가 가득 찼을 때 바로 저장)
+"""
+
+import threading
+
+import pytest
+
+import golf_score_manager
+from golf_score_manager import GolfScoreManager
+from storage import StorageError
+from write_behind import WriteBehindQueue, is_retryable_error
+
+
+class Recorder:
+    """전송된 배치를 기록하고, fail에 든 예외를 차례로 던지는 flush_func"""
+
+    def __init__(self, fail=(), reject=()):
+        self.batches = []
+        self.fail = list(fail)
+        self.reject = set(reject)
+        self.flushed = threading.Event()
+
+    def __call__(self, items):
+        if self.fail:
+            raise self.fail.pop(0)
+        if self.reject.intersection(items):
+            raise StorageError('잘못된 행', status=400)
+        self.batches.append(list(items))
+        self.flushed.set()
+
+
+@pytest.fixture
+def make_queue():
+    queues = []
+
+    def make(flush_func, **options):
+        options = {'max_batch_size': 2, 'flush_interval': 60, **options}
+        queues.append(WriteBehindQueue(flush_func, **options))
+        return queues[-1]
+    yield make
+    for write_queue in queues:
+        write_queue.close()
+
+
+def test_flush_sends_batches(make_queue):
+    recorder = Recorder()
+    write_queue = make_queue(recorder)
+    for item in 'abcde':
+        assert write_queue.put(item)
+
+    # 배치가 차면 백그라운드 스레드도 전송하므로 스레드를 멈춘 뒤 결과 확인
+    write_queue.close()
+    assert recorder.batches == [['a', 'b'], ['c', 'd'], ['e']]
+    stats = write_queue.stats()
+    assert (stats['queue_depth'], stats['flushed_items'], stats['flush_count']) == (0, 5, 3)
+
+
+def test_full_batch_flushes_in_background(make_queue):
+    recorder = Recorder()
+    write_queue = make_queue(recorder, max_batch_size=3)
+    for item in 'abc':
+        write_queue.put(item)
+
+    assert recorder.flushed.wait(5)
+    assert recorder.batches == [['a', 'b', 'c']]
+
+
+def test_retryable_failure_keeps_batch(make_queue):
+    recorder = Recorder(fail=[StorageError('quota', status=429)])
+    write_queue = make_queue(recorder, max_batch_size=4)  # 배치가 차지 않아 백그라운드 전송이 끼어들지 않음
+    write_queue.put('a')
+    write_queue.put('b')
+
+    assert write_queue.flush() == 0
+    assert write_queue.depth() == 2
+    assert write_queue.flush() == 2
+    assert recorder.batches == [['a', 'b']]
+    assert write_queue.stats()['failed_flushes'] == 1
+
+
+def test_permanent_failure_dead_letters_only_bad_items(make_queue):
+    recorder = Recorder(reject=['bad'])
+    write_queue = make_queue(recorder, max_batch_size=4)
+    for item in ('a', 'bad', 'c'):
+        write_queue.put(item)
+
+    write_queue.flush()
+    assert recorder.batches == [['a'], ['c']]
+    assert write_queue.dead_letters() == ['bad']
+    assert write_queue.stats()['dead_lettered'] == 1
+    assert write_queue.depth() == 0
+
+
+def test_gives_up_after_max_attempts(make_queue):
+    recorder = Recorder(fail=[StorageError('unavailable', status=503)] * 4)
+    write_queue = make_queue(recorder, max_attempts=3)
+    write_queue.put('a')
+
+    for _ in range(2):
+        write_queue.flush()
+        assert write_queue.depth() == 1
+    # 세 번째 실패 뒤 항목별 전송: 네 번째 예외로 실패해 포기
+    write_queue.flush()
+    assert write_queue.dead_letters() == ['a']
+    assert write_queue.depth() == 0
+
+
+def test_close_flushes_and_rejects_new_items(make_queue):
+    recorder = Recorder()
+    write_queue = make_queue(recorder)
+    write_queue.put('a')
+
+    write_queue.close()
+    assert recorder.batches == [['a']]
+    assert not write_queue.put('b')
+
+
+def test_full_queue_rejects_put(make_queue):
+    write_queue = make_queue(Recorder(), max_batch_size=10, max_queue_size=1)
+    assert write_queue.put('a', timeout=0)
+    assert not write_queue.put('b', timeout=0)
+
+
+@pytest.mark.parametrize('status, retryable', [(None, True), (429, True), (408, True), (503, True),
+                                               (400, False), (403, False)])
+def test_is_retryable_error(status, retryable):
+    assert is_retryable_error(StorageError('error', status=status)) is retryable
+
+
+def test_manager_saves_directly_when_queue_is_full(emulator, spreadsheet_id, score_sheet, monkeypatch):
+    monkeypatch.setattr(golf_score_manager, 'WRITE_BEHIND_MAX_QUEUE', 1)
+    monkeypatch.setattr(golf_score_manager, 'WRITE_BEHIND_INTERVAL', 60)
+    monkeypatch.setattr(golf_score_manager, 'WRITE_BEHIND_ENQUEUE_TIMEOUT', 0)
+    manager = GolfScoreManager(spreadsheet_id, write_behind=True, backend=emulator.backend(spreadsheet_id))
+    try:
+        for player_name in ('kim', 'lee'):
+            manager.save_to_sheets(manager.create_golf_round(player_name, 'course1', date='2024-05-01'))
+
+        # 두 번째 라운드는 큐가 가득 차 바로 저장되고, 첫 번째는 아직 큐에 있음
+        assert manager.get_write_queue_stats()['queue_depth'] == 1
+        assert [r['player_name'] for r in manager.load_from_sheets()] == ['lee']
+        assert manager.flush() == 1
+        assert [r['player_name'] for r in manager.load_from_sheets()] == ['lee', 'kim']
+    finally:
+        manager.close()
@@ -5,166 +5,252 @@ User Management Module
 """
 
 import os
-import json
-import hashlib
+import atexit
 import secrets
-from datetime import datetime, timedelta
-from typing import Optional, Dict, List
-from google.auth.transport.requests import Request
-from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build
-from googleapiclient.errors import HttpError
+import threading
+import time
+from datetime import datetime
+from typing import Optional, Dict, Iterable, List
+
+from password_hasher import PasswordHasher
+from sheets_client import get_client_factory
+from quota_scheduler import PRIORITY_REFRESH, request_priority
+from storage import QuotaExhausted, StorageBackend, StorageError, create_backend, storage_backend_name
+from write_behind import WriteBehindQueue
 
 # Google Sheets API 설정
-SCOPES = ['https://www.googleapis.com/auth/spreadsheets']
 USERS_SHEET_ID = os.getenv('GOOGLE_USERS_SHEET_ID')  # 사용자 정보용 스프레드시트
-USERS_RANGE = 'Member!A1:F1000'  # 사용자 데이터 범위
+USERS_RANGE = 'Member!A:F'  # 사용자 데이터 범위 (행 수 제한 없음)
+USER_INDEX_TTL = float(os.getenv('GOLF_USER_INDEX_TTL', '300'))  # 사용자 인덱스 전체 재구성 주기 (초)
+USER_INDEX_MISS_REFRESH_INTERVAL = float(os.getenv('GOLF_USER_INDEX_MISS_REFRESH_INTERVAL', '30'))  # 인덱스에 없는 값 조회로 시트를 다시 읽는 최소 간격 (초)
+LAST_LOGIN_FLUSH_INTERVAL = float(os.getenv('GOLF_LAST_LOGIN_FLUSH_INTERVAL', '10'))  # last_login 일괄 저장 주기 (초), 0이면 즉시 저장
+LAST_LOGIN_BATCH_SIZE = 200  # batchUpdate 한 번에 묶을 최대 행 수
+BULK_REGISTER_CHUNK_SIZE = 5000  # 일괄 회원가입 시 append 한 번에 보낼 최대 행 수
+
 
 class UserManager:
     """사용자 관리 클래스"""
     
-    def __init__(self):
+    def __init__(self, password_hasher: PasswordHasher = None, backend: StorageBackend = None):
         self.service = None
+        self.password_hasher = password_hasher or PasswordHasher()
         
-        # 환경변수 검증
-        if not USERS_SHEET_ID:
-            raise ValueError("GOOGLE_USERS_SHEET_ID 환경변수가 설정되지 않았습니다.")
+        # 사용자 해시 인덱스: 필드 값 -> (사용자 레코드, 시트 행 번호)
+        self._user_index = {'user_id': {}, 'username': {}, 'email': {}}
+        self._index_loaded_at = None
+        self._index_lock = threading.Lock()
+        self._miss_refresh_lock = threading.Lock()
+        
+        # 저장소: 직접 지정하지 않으면 GOLF_STORAGE_BACKEND(sheets/sqlite)에 따라 생성
+        if backend is None and storage_backend_name() == 'sheets':
+            # 환경변수 검증
+            if not USERS_SHEET_ID:
+                raise ValueError("GOOGLE_USERS_SHEET_ID 환경변수가 설정되지 않았습니다.")
+            self._authenticate()
+        self.backend = backend or create_backend(USERS_SHEET_ID, self.service)
         
-        self._authenticate()
         self._ensure_users_headers()
+        
+        # last_login 기록은 모아 두었다가 주기적으로 batchUpdate 한 번으로 저장
+        self._last_login_queue = None
+        if LAST_LOGIN_FLUSH_INTERVAL > 0:
+            self._last_login_queue = WriteBehindQueue(
+                self._write_last_logins,
+                max_batch_size=LAST_LOGIN_BATCH_SIZE,
+                flush_interval=LAST_LOGIN_FLUSH_INTERVAL,
+                max_queue_size=10000,
+                name='last-login-writer'
+            )
+            atexit.register(self.close)
     
     def _authenticate(self):
-        """Google Sheets API 인증"""
-        creds = None
-        
-        # 환경변수에서 인증 정보 확인
-        if os.getenv('GOOGLE_CREDENTIALS_JSON'):
-            creds_data = json.loads(os.getenv('GOOGLE_CREDENTIALS_JSON'))
-            creds = Credentials.from_authorized_user_info(creds_data, SCOPES)
-        elif os.path.exists('token.json'):
-            creds = Credentials.from_authorized_user_file('token.json', SCOPES)
-        
-        if not creds or not creds.valid:
-            if creds and creds.expired and creds.refresh_token:
-                creds.refresh(Request())
-            else:
-                if os.getenv('GOOGLE_CLIENT_ID') and os.getenv('GOOGLE_CLIENT_SECRET'):
-                    client_config = {
-                        "installed": {
-                            "client_id": os.getenv('GOOGLE_CLIENT_ID'),
-                            "client_secret": os.getenv('GOOGLE_CLIENT_SECRET'),
-                            "auth_uri": "https://accounts.google.com/o/oauth2/auth",
-                            "token_uri": "https://oauth2.googleapis.com/token",
-                            "redirect_uris": ["http://localhost"]
-                        }
-                    }
-                    flow = InstalledAppFlow.from_client_config(client_config, SCOPES)
-                else:
-                    flow = InstalledAppFlow.from_client_secrets_file('credentials.json', SCOPES)
-                creds = flow.run_local_server(port=0)
-            
-            if not os.getenv('GOOGLE_CREDENTIALS_JSON'):
-                with open('token.json', 'w') as token:
-                    token.write(creds.to_json())
-        
-        self.service = build('sheets', 'v4', credentials=creds)
+        """Google Sheets API 인증 (프로세스 공유 인증 정보와 연결 풀, 만료 전 자동 갱신)"""
+        factory = get_client_factory()
+        self.credentials = factory.credentials
+        self.service = factory.service_pool()
+        factory.start_refresher()
     
     def _ensure_users_headers(self):
         """사용자 스프레드시트에 헤더가 있는지 확인하고 없으면 추가"""
         try:
-            result = self.service.spreadsheets().values().get(
-                spreadsheetId=USERS_SHEET_ID,
-                range='Member!A1:F1'
-            ).execute()
-            
-            values = result.get('values', [])
+            values = self.backend.get('Member!A1:F1')
             
             if not values or not values[0]:
                 headers = ['user_id', 'username', 'email', 'password_hash', 'created_at', 'last_login']
                 
-                body = {'values': [headers]}
-                self.service.spreadsheets().values().update(
-                    spreadsheetId=USERS_SHEET_ID,
-                    range='Member!A1:F1',
-                    valueInputOption='USER_ENTERED',
-                    body=body
-                ).execute()
+                self.backend.update('Member!A1:F1', [headers])
                 print("Member 시트에 사용자 헤더가 추가되었습니다.")
                 
-        except HttpError as error:
+        except StorageError as error:
             print(f"사용자 헤더 확인 중 오류: {error}")
     
+    def preload(self) -> int:
+        """Member 시트를 읽어 사용자 인덱스를 만들고 사용자 수 반환 (시작 전 점검용, 저장소 오류는 그대로 던짐)"""
+        self._refresh_user_index()
+        return len(self._user_index['user_id'])
+    
     def _hash_password(self, password: str) -> str:
-        """비밀번호 해시화"""
-        salt = secrets.token_hex(16)
-        password_hash = hashlib.pbkdf2_hmac('sha256', password.encode('utf-8'), salt.encode('utf-8'), 100000)
-        return f"{salt}:{password_hash.hex()}"
+        """비밀번호 해시화 (워커 풀에서 계산)"""
+        return self.password_hasher.hash(password)
     
     def _verify_password(self, password: str, password_hash: str) -> bool:
-        """비밀번호 검증"""
+        """비밀번호 검증 (워커 풀에서 계산)"""
         try:
-            salt, hash_value = password_hash.split(':')
-            password_hash_check = hashlib.pbkdf2_hmac('sha256', password.encode('utf-8'), salt.encode('utf-8'), 100000)
-            return password_hash_check.hex() == hash_value
-        except:
+            return self.password_hasher.verify(password, password_hash)
+        except Exception:
             return False
     
+    def _upgrade_password_hash(self, user: Dict, row_number: int, password: str):
+        """반복 횟수가 바뀐 기존 해시를 로그인 성공 시 새 설정으로 다시 해시해 저장"""
+        try:
+            # 인덱스의 행 번호가 시트 수정으로 어긋났을 수 있으므로 저장 전에 해당 행을 확인
+            row = (self.backend.get(f'Member!A{row_number}:D{row_number}') or [[]])[0]
+            if not row or row[0] != user['user_id']:
+                self._index_loaded_at = None
+                return
+            
+            password_hash = self._hash_password(password)
+            self.backend.update(f'Member!D{row_number}', [[password_hash]])  # D열 (password_hash)
+            user['password_hash'] = password_hash
+            
+        except Exception as e:
+            print(f"비밀번호 해시 갱신 중 오류: {e}")
+    
     def register_user(self, username: str, email: str, password: str) -> Dict:
         """사용자 회원가입"""
         try:
-            # 기존 사용자 확인
-            if self.get_user_by_username(username):
-                return {'success': False, 'message': '이미 존재하는 사용자명입니다.'}
-            
-            if self.get_user_by_email(email):
-                return {'success': False, 'message': '이미 존재하는 이메일입니다.'}
+            # 인덱스로 사용자명과 이메일 중복을 함께 확인 (다른 프로세스의 가입은 간격 제한 안에서 다시 읽어 확인)
+            error = self._check_unique_indexed(username, email)
+            if error:
+                return {'success': False, 'message': error}
             
             # 새 사용자 생성
-            user_id = secrets.token_hex(16)
-            password_hash = self._hash_password(password)
-            created_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            
-            user_data = [user_id, username, email, password_hash, created_at, '']
+            user_data = self._new_user_row(username, email, self._hash_password(password))
             
             # Google Sheets에 저장
-            body = {'values': [user_data]}
-            result = self.service.spreadsheets().values().append(
-                spreadsheetId=USERS_SHEET_ID,
-                range=USERS_RANGE,
-                valueInputOption='USER_ENTERED',
-                body=body
-            ).execute()
+            self._append_user_rows([user_data])
             
             return {
                 'success': True, 
                 'message': '회원가입이 완료되었습니다.',
-                'user_id': user_id
+                'user_id': user_data[0]
             }
             
         except Exception as e:
             return {'success': False, 'message': f'회원가입 중 오류가 발생했습니다: {str(e)}'}
     
+    def register_users(self, users: Iterable[Dict]) -> Dict:
+        """여러 사용자 일괄 회원가입 (중복 확인은 시트 1회 읽기, 저장은 append 1회)
+        
+        users: {'username', 'email', 'password'} 딕셔너리 목록
+        유효하지 않거나 중복된 항목은 건너뛰고 errors에 이유를 기록합니다.
+        """
+        try:
+            # 다른 프로세스의 가입까지 확인하도록 간격 제한 없이 시트를 한 번 읽어 인덱스 재구성
+            self._refresh_user_index()
+            
+            accepted = []
+            errors = []
+            batch_usernames = set()
+            batch_emails = set()
+            for position, user in enumerate(users):
+                username = (user.get('username') or '').strip()
+                email = (user.get('email') or '').strip()
+                password = user.get('password') or ''
+                
+                if not username or not email or not password:
+                    error = '모든 필드를 입력해주세요.'
+                elif len(password) < 6:
+                    error = '비밀번호는 6자 이상이어야 합니다.'
+                elif username in batch_usernames:
+                    error = '이미 존재하는 사용자명입니다.'
+                elif email in batch_emails:
+                    error = '이미 존재하는 이메일입니다.'
+                else:
+                    error = self._check_unique(username, email)
+                
+                if error:
+                    errors.append({'index': position, 'username': username, 'message': error})
+                    continue
+                
+                batch_usernames.add(username)
+                batch_emails.add(email)
+                accepted.append((username, email, password))
+            
+            # 비밀번호 해시는 워커 풀에서 병렬 계산
+            password_hashes = self.password_hasher.hash_many(password for _, _, password in accepted)
+            rows = [self._new_user_row(username, email, password_hash)
+                    for (username, email, _), password_hash in zip(accepted, password_hashes)]
+            
+            for start in range(0, len(rows), BULK_REGISTER_CHUNK_SIZE):
+                self._append_user_rows(rows[start:start + BULK_REGISTER_CHUNK_SIZE])
+            
+            return {
+                'success': True,
+                'message': f'{len(rows)}명의 회원가입이 완료되었습니다.',
+                'registered': [{'user_id': row[0], 'username': row[1]} for row in rows],
+                'errors': errors
+            }
+            
+        except Exception as e:
+            return {'success': False, 'message': f'일괄 회원가입 중 오류가 발생했습니다: {str(e)}'}
+    
+    def _check_unique_indexed(self, username: str, email: str) -> Optional[str]:
+        """인덱스로 중복 확인 (중복이 없으면 다른 프로세스의 가입을 반영해 한 번 더 확인)"""
+        if self._index_is_stale():
+            self._refresh_stale_index()
+        error = self._check_unique(username, email)
+        if error is None and self._refresh_after_miss():
+            error = self._check_unique(username, email)
+        return error
+    
+    def _check_unique(self, username: str, email: str) -> Optional[str]:
+        """인덱스 기준 사용자명/이메일 중복 확인 (중복이면 오류 메시지 반환)"""
+        if username in self._user_index['username']:
+            return '이미 존재하는 사용자명입니다.'
+        if email in self._user_index['email']:
+            return '이미 존재하는 이메일입니다.'
+        return None
+    
+    def _new_user_row(self, username: str, email: str, password_hash: str) -> List:
+        """새 사용자 시트 행 생성"""
+        user_id = secrets.token_hex(16)
+        created_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        return [user_id, username, email, password_hash, created_at, '']
+    
+    def _append_user_rows(self, rows: List[List]):
+        """사용자 행을 append 한 번으로 저장하고 인덱스에 반영"""
+        row_number = self.backend.append(USERS_RANGE, rows)
+        self._add_registered_users(rows, row_number)
+    
+    def _add_registered_users(self, rows: List[List], row_number: Optional[int]):
+        """새로 추가한 사용자를 인덱스에 반영 (행 번호를 알 수 없으면 다음 조회 때 재구성)"""
+        if row_number is None or self._index_loaded_at is None:
+            self._index_loaded_at = None
+            return
+        with self._index_lock:
+            for offset, row in enumerate(rows):
+                self._index_user(self._user_index, self._row_to_user(row), row_number + offset)
+    
     def authenticate_user(self, username_or_email: str, password: str) -> Dict:
         """사용자 로그인 인증 (사용자명 또는 이메일)"""
         try:
-            # 사용자명 또는 이메일로 사용자 조회
-            user = None
-            if '@' in username_or_email:
-                # 이메일로 로그인 시도
-                user = self.get_user_by_email(username_or_email)
-            else:
-                # 사용자명으로 로그인 시도
-                user = self.get_user_by_username(username_or_email)
+            # 사용자와 시트 행 번호를 인덱스에서 한 번에 조회 (시트는 주기적 재구성과 간격 제한된 재조회 때만 읽음)
+            field = 'email' if '@' in username_or_email else 'username'
+            entry = self._find_indexed_user(field, username_or_email)
             
-            if not user:
+            if not entry:
                 return {'success': False, 'message': '사용자명/이메일 또는 비밀번호가 올바르지 않습니다.'}
             
+            user, row_number = entry
             if not self._verify_password(password, user['password_hash']):
                 return {'success': False, 'message': '사용자명/이메일 또는 비밀번호가 올바르지 않습니다.'}
             
-            # 마지막 로그인 시간 업데이트
-            self.update_last_login(user['user_id'])
+            if self.password_hasher.needs_rehash(user['password_hash']):
+                self._upgrade_password_hash(user, row_number, password)
+            
+            # 마지막 로그인 시간 기록 (주기적으로 일괄 저장)
+            self._record_last_login(user)
             
             return {
                 'success': True,
@@ -181,155 +267,210 @@ class UserManager:
     
     def get_user_by_username(self, username: str) -> Optional[Dict]:
         """사용자명으로 사용자 조회"""
-        try:
-            result = self.service.spreadsheets().values().get(
-                spreadsheetId=USERS_SHEET_ID,
-                range=USERS_RANGE
-            ).execute()
-            
-            values = result.get('values', [])
-            if not values:
-                return None
-            
-            # 헤더 제거
-            data_rows = values[1:]
-            
-            for row in data_rows:
-                if len(row) >= 4 and row[1] == username:  # username은 B열 (인덱스 1)
-                    return {
-                        'user_id': row[0],
-                        'username': row[1],
-                        'email': row[2],
-                        'password_hash': row[3],
-                        'created_at': row[4] if len(row) > 4 else '',
-                        'last_login': row[5] if len(row) > 5 else ''
-                    }
-            
-            return None
-            
-        except Exception as e:
-            print(f"사용자 조회 중 오류: {e}")
-            return None
+        return self._lookup_user('username', username)
     
     def get_user_by_email(self, email: str) -> Optional[Dict]:
         """이메일로 사용자 조회"""
-        try:
-            result = self.service.spreadsheets().values().get(
-                spreadsheetId=USERS_SHEET_ID,
-                range=USERS_RANGE
-            ).execute()
-            
-            values = result.get('values', [])
-            if not values:
-                return None
-            
-            data_rows = values[1:]
-            
-            for row in data_rows:
-                if len(row) >= 3 and row[2] == email:  # email은 C열 (인덱스 2)
-                    return {
-                        'user_id': row[0],
-                        'username': row[1],
-                        'email': row[2],
-                        'password_hash': row[3],
-                        'created_at': row[4] if len(row) > 4 else '',
-                        'last_login': row[5] if len(row) > 5 else ''
-                    }
-            
-            return None
-            
-        except Exception as e:
-            print(f"사용자 조회 중 오류: {e}")
-            return None
+        return self._lookup_user('email', email)
     
     def get_user_by_id(self, user_id: str) -> Optional[Dict]:
         """사용자 ID로 사용자 조회"""
+        return self._lookup_user('user_id', user_id)
+    
+    def _lookup_user(self, field: str, value: str) -> Optional[Dict]:
+        """인덱스에서 사용자 조회 (없으면 다른 프로세스의 변경일 수 있으므로 간격 제한 안에서 새로 읽기)"""
+        entry = self._find_indexed_user(field, value)
+        if entry is None:
+            return None
+        return dict(entry[0])
+    
+    def _find_indexed_user(self, field: str, value: str) -> Optional[tuple]:
+        """인덱스에서 (사용자 레코드, 시트 행 번호) 조회"""
         try:
-            result = self.service.spreadsheets().values().get(
-                spreadsheetId=USERS_SHEET_ID,
-                range=USERS_RANGE
-            ).execute()
-            
-            values = result.get('values', [])
-            if not values:
-                return None
+            if self._index_is_stale():
+                self._refresh_stale_index()
             
-            data_rows = values[1:]
-            
-            for row in data_rows:
-                if len(row) >= 1 and row[0] == user_id:  # user_id는 A열 (인덱스 0)
-                    return {
-                        'user_id': row[0],
-                        'username': row[1],
-                        'email': row[2],
-                        'password_hash': row[3],
-                        'created_at': row[4] if len(row) > 4 else '',
-                        'last_login': row[5] if len(row) > 5 else ''
-                    }
-            
-            return None
+            entry = self._user_index[field].get(value)
+            if entry is None and self._refresh_after_miss():
+                entry = self._user_index[field].get(value)
+            return entry
             
         except Exception as e:
             print(f"사용자 조회 중 오류: {e}")
             return None
     
+    def _index_is_stale(self) -> bool:
+        """인덱스를 아직 만들지 않았거나 TTL이 지났는지 확인"""
+        return (self._index_loaded_at is None or
+                time.monotonic() - self._index_loaded_at > USER_INDEX_TTL)
+    
+    def _refresh_stale_index(self):
+        """TTL이 지난 인덱스 재구성 (Sheets 할당량이 부족하면 기존 인덱스를 그대로 사용)"""
+        if self._index_loaded_at is None:
+            self._refresh_user_index()
+            return
+        try:
+            with request_priority(PRIORITY_REFRESH):
+                self._refresh_user_index()
+        except QuotaExhausted:
+            pass
+    
+    def _refresh_after_miss(self) -> bool:
+        """인덱스에 없는 값을 찾을 때 시트를 다시 읽어 인덱스 재구성 (다시 읽었으면 True)
+        
+        없는 사용자명으로 로그인을 반복해도 시트 전체 읽기가 늘지 않도록, 마지막 재구성 뒤
+        USER_INDEX_MISS_REFRESH_INTERVAL이 지나지 않았으면 읽지 않습니다. 같은 프로세스의
+        가입은 저장할 때 인덱스에 바로 반영되므로 다른 프로세스의 변경에만 해당합니다.
+        """
+        with self._miss_refresh_lock:
+            loaded_at = self._index_loaded_at
+            if loaded_at is not None and time.monotonic() - loaded_at < USER_INDEX_MISS_REFRESH_INTERVAL:
+                return False
+            try:
+                with request_priority(PRIORITY_REFRESH):
+                    self._refresh_user_index()
+            except QuotaExhausted:
+                return False
+            return True
+    
+    def _refresh_user_index(self):
+        """Member 시트를 한 번 읽어 user_id/username/email 해시 인덱스 재구성"""
+        with self._index_lock:
+            index = {'user_id': {}, 'username': {}, 'email': {}}
+            # 헤더 제외하고 2행부터 페이지 단위로 읽기
+            for row_number, row in self.backend.iter_rows('Member', 'F', start_row=2):
+                if len(row) >= 4:
+                    self._index_user(index, self._row_to_user(row), row_number)
+            
+            self._user_index = index
+            self._index_loaded_at = time.monotonic()
+    
+    def _index_user(self, index: Dict, user: Dict, row_number: int):
+        """사용자 레코드를 각 인덱스에 등록"""
+        entry = (user, row_number)
+        for field in ('user_id', 'username', 'email'):
+            if user[field]:
+                index[field][user[field]] = entry
+    
+    def _row_to_user(self, row: List) -> Dict:
+        """시트 행을 사용자 레코드로 변환"""
+        return {
+            'user_id': row[0],
+            'username': row[1],
+            'email': row[2],
+            'password_hash': row[3],
+            'created_at': row[4] if len(row) > 4 else '',
+            'last_login': row[5] if len(row) > 5 else ''
+        }
+    
     def update_last_login(self, user_id: str):
         """마지막 로그인 시간 업데이트"""
         try:
-            # 모든 사용자 데이터 가져오기
-            result = self.service.spreadsheets().values().get(
-                spreadsheetId=USERS_SHEET_ID,
-                range=USERS_RANGE
-            ).execute()
-            
-            values = result.get('values', [])
-            if not values:
+            entry = self._find_indexed_user('user_id', user_id)
+            if entry is None:
                 return
-            
-            # 사용자 찾아서 업데이트
-            for i, row in enumerate(values[1:], start=2):  # 헤더 제외하고 2행부터 시작
-                if len(row) >= 1 and row[0] == user_id:
-                    # 마지막 로그인 시간 업데이트
-                    last_login = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                    
-                    # 행 업데이트
-                    update_range = f'F{i}'  # F열 (last_login)
-                    body = {'values': [[last_login]]}
-                    self.service.spreadsheets().values().update(
-                        spreadsheetId=USERS_SHEET_ID,
-                        range=update_range,
-                        valueInputOption='USER_ENTERED',
-                        body=body
-                    ).execute()
-                    break
+            self._record_last_login(entry[0])
                     
         except Exception as e:
             print(f"마지막 로그인 시간 업데이트 중 오류: {e}")
     
+    def _record_last_login(self, user: Dict):
+        """last_login을 인덱스에 바로 반영하고 시트 저장은 큐에 맡김 (큐가 없거나 가득 차면 즉시 저장)"""
+        last_login = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        user['last_login'] = last_login
+        
+        item = (user['user_id'], last_login)
+        if self._last_login_queue and self._last_login_queue.put(item, timeout=0):
+            return
+        
+        try:
+            self._write_last_logins([item])
+        except Exception as e:
+            print(f"마지막 로그인 시간 업데이트 중 오류: {e}")
+    
+    def _write_last_logins(self, items: List[tuple]):
+        """(user_id, 로그인 시간) 목록을 사용자별 최신 값으로 합쳐 batchUpdate 한 번으로 저장
+        
+        인덱스의 행 번호는 다른 프로세스의 시트 수정으로 어긋났을 수 있으므로, 저장 전에
+        batchGet 한 번으로 각 행의 user_id를 확인합니다. 맞지 않는 사용자가 있으면 인덱스를
+        다시 읽어 새 행 번호로 저장하고, 그래도 찾지 못한 사용자는 건너뜁니다.
+        """
+        latest = dict(items)  # 같은 사용자는 나중 값이 남음
+        rows = self._verified_user_rows(list(latest))
+        
+        missing = [user_id for user_id in latest if user_id not in rows]
+        if missing and self._refresh_after_mismatch():
+            for user_id in missing:
+                entry = self._user_index['user_id'].get(user_id)
+                if entry is not None:
+                    rows[user_id] = entry[1]
+                    entry[0]['last_login'] = latest[user_id]  # 다시 읽은 레코드에도 반영
+        
+        skipped = [user_id for user_id in latest if user_id not in rows]
+        if skipped:
+            print(f"last_login 저장 건너뜀: 시트에서 사용자 {len(skipped)}명의 행을 찾지 못했습니다.")
+        if rows:
+            self.backend.batch_update([
+                (f'Member!F{row_number}', [[latest[user_id]]])  # F열 (last_login)
+                for user_id, row_number in sorted(rows.items(), key=lambda item: item[1])
+            ])
+    
+    def _verified_user_rows(self, user_ids: List[str]) -> Dict[str, int]:
+        """인덱스의 행 번호 중 시트의 A열(user_id)이 실제로 일치하는 것만 반환"""
+        candidates = {}
+        for user_id in user_ids:
+            entry = self._user_index['user_id'].get(user_id)
+            if entry is not None:
+                candidates[user_id] = entry[1]
+        if not candidates:
+            return {}
+        
+        checked = self.backend.batch_get([f'Member!A{row_number}:A{row_number}' for row_number in candidates.values()])
+        return {user_id: row_number
+                for (user_id, row_number), values in zip(candidates.items(), checked)
+                if values and values[0] and values[0][0] == user_id}
+    
+    def _refresh_after_mismatch(self) -> bool:
+        """행 번호가 어긋난 사용자가 있을 때 인덱스 재구성 (할당량이 부족하면 False)"""
+        try:
+            with request_priority(PRIORITY_REFRESH):
+                self._refresh_user_index()
+        except QuotaExhausted:
+            self._index_loaded_at = None
+            return False
+        return True
+    
+    def flush(self) -> int:
+        """대기 중인 last_login 기록을 즉시 저장"""
+        if not self._last_login_queue:
+            return 0
+        return self._last_login_queue.flush()
+    
+    def close(self):
+        """대기 중인 last_login 기록을 저장하고 백그라운드 스레드와 해시 워커 풀 종료"""
+        if self._last_login_queue:
+            self._last_login_queue.close()
+        self.password_hasher.shutdown()
+    
+    def get_last_login_queue_stats(self) -> Optional[Dict]:
+        """last_login 일괄 저장 큐 지표, 비활성화 시 None"""
+        if not self._last_login_queue:
+            return None
+        return self._last_login_queue.stats()
+    
     def get_all_users(self) -> List[Dict]:
         """모든 사용자 조회 (관리자용)"""
         try:
-            result = self.service.spreadsheets().values().get(
-                spreadsheetId=USERS_SHEET_ID,
-                range=USERS_RANGE
-            ).execute()
-            
-            values = result.get('values', [])
-            if not values:
-                return []
-            
-            users = []
-            for row in values[1:]:  # 헤더 제외
-                if len(row) >= 4:
-                    users.append({
-                        'user_id': row[0],
-                        'username': row[1],
-                        'email': row[2],
-                        'created_at': row[4] if len(row) > 4 else '',
-                        'last_login': row[5] if len(row) > 5 else ''
-                    })
-            
-            return users
+            self._refresh_user_index()
+            
+            entries = sorted(self._user_index['user_id'].values(), key=lambda entry: entry[1])
+            return [{
+                'user_id': user['user_id'],
+                'username': user['username'],
+                'email': user['email'],
+                'created_at': user['created_at'],
+                'last_login': user['last_login']
+            } for user, _ in entries]
             
         except Exception as e:
             print(f"사용자 목록 조회 중 오류: {e}")
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+쓰기 지연(write-behind) 배치 큐
+Write-behind batching queue
+"""
+
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+DEAD_LETTER_LIMIT = 1000  # 보관하는 전송 포기 항목 최대 수 (넘으면 오래된 것부터 버림)
+
+
+def is_retryable_error(error: Exception) -> bool:
+    """다시 보내면 성공할 수 있는 오류인지 (status 속성이 408/429를 제외한 4xx면 영구 실패)"""
+    status = getattr(error, 'status', None)
+    if status is None:
+        return True
+    return not (400 <= status < 500) or status in (408, 429)
+
+
+class WriteBehindQueue:
+    """항목을 모아 백그라운드에서 일괄 처리하는 제한 크기 큐
+
+    put()으로 넣은 항목은 백그라운드 스레드가 max_batch_size개가 모이거나
+    flush_interval초가 지나면 flush_func(items)로 한 번에 전달합니다.
+    flush_func가 예외를 던지면 해당 배치는 보관했다가 다음 주기에 재시도합니다.
+    다만 잘못된 행처럼 다시 보내도 실패할 오류(is_retryable)이거나 max_attempts번 연속
+    실패하면, 뒤의 쓰기를 막지 않도록 항목을 하나씩 다시 보내 실패한 항목만
+    전송 포기 목록(dead_letters)으로 옮기고 로그를 남깁니다.
+    """
+
+    def __init__(self, flush_func: Callable[[List[Any]], Any], max_batch_size: int = 50,
+                 flush_interval: float = 2.0, max_queue_size: int = 1000,
+                 name: str = 'write-behind', max_attempts: int = 10,
+                 is_retryable: Callable[[Exception], bool] = is_retryable_error):
+        self.flush_func = flush_func
+        self.max_batch_size = max(1, max_batch_size)
+        self.flush_interval = max(0.01, flush_interval)
+        self.max_attempts = max(1, max_attempts)
+        self.is_retryable = is_retryable
+        self.name = name
+
+        self._queue = queue.Queue(maxsize=max_queue_size)
+        self._pending: List[Any] = []  # 전송에 실패해 재시도를 기다리는 항목
+        self._pending_failures = 0  # 재시도 대기 항목의 연속 전송 실패 횟수
+        self._dead_letters: List[Any] = []  # 전송을 포기한 항목
+        self._flush_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._flush_requested = threading.Event()
+
+        # 모니터링용 지표
+        self._stats_lock = threading.Lock()
+        self._enqueued = 0
+        self._flushed_items = 0
+        self._flush_count = 0
+        self._failed_flushes = 0
+        self._dead_lettered = 0
+        self._last_batch_size = 0
+        self._last_flush_latency = 0.0
+        self._max_flush_latency = 0.0
+        self._total_flush_latency = 0.0
+        self._last_error = None
+
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def put(self, item: Any, timeout: Optional[float] = None) -> bool:
+        """항목 추가 (큐가 가득 차 timeout 안에 넣지 못하면 False)"""
+        if self._stop_event.is_set():
+            return False
+        try:
+            self._queue.put(item, timeout=timeout)
+        except queue.Full:
+            return False
+
+        with self._stats_lock:
+            self._enqueued += 1
+        if self._queue.qsize() >= self.max_batch_size:
+            self._flush_requested.set()
+        return True
+
+    def depth(self) -> int:
+        """아직 전송되지 않은 항목 수"""
+        return self._queue.qsize() + len(self._pending)
+
+    def flush(self) -> int:
+        """대기 중인 항목을 현재 스레드에서 모두 전송하고 전송한 항목 수 반환"""
+        flushed = 0
+        while True:
+            batch = self._take_batch()
+            if not batch:
+                return flushed
+            if not self._flush_batch(batch):
+                return flushed
+            flushed += len(batch)
+
+    def close(self, timeout: Optional[float] = 10.0):
+        """백그라운드 스레드를 멈추고 남은 항목을 모두 전송"""
+        if self._stop_event.is_set():
+            return
+        self._stop_event.set()
+        self._flush_requested.set()
+        self._thread.join(timeout)
+        self.flush()
+
+        remaining = self.depth()
+        if remaining:
+            print(f"[{self.name}] 종료 시 전송하지 못한 항목 {remaining}개가 남았습니다. 마지막 오류: {self._last_error}")
+
+    def stats(self) -> Dict:
+        """큐 깊이와 플러시 지연 시간 지표"""
+        with self._stats_lock:
+            avg_latency = self._total_flush_latency / self._flush_count if self._flush_count else 0.0
+            return {
+                'queue_depth': self.depth(),
+                'queue_capacity': self._queue.maxsize,
+                'enqueued': self._enqueued,
+                'flushed_items': self._flushed_items,
+                'flush_count': self._flush_count,
+                'failed_flushes': self._failed_flushes,
+                'dead_lettered': self._dead_lettered,
+                'last_batch_size': self._last_batch_size,
+                'last_flush_latency_ms': round(self._last_flush_latency * 1000, 1),
+                'avg_flush_latency_ms': round(avg_latency * 1000, 1),
+                'max_flush_latency_ms': round(self._max_flush_latency * 1000, 1),
+                'last_error': self._last_error
+            }
+
+    def dead_letters(self) -> List[Any]:
+        """전송을 포기한 항목 목록 (오래된 순, 최대 DEAD_LETTER_LIMIT개)"""
+        with self._flush_lock:
+            return list(self._dead_letters)
+
+    def _run(self):
+        """백그라운드 플러시 루프"""
+        while not self._stop_event.is_set():
+            self._flush_requested.wait(self.flush_interval)
+            self._flush_requested.clear()
+            if self._stop_event.is_set():
+                break
+
+            while True:
+                batch = self._take_batch()
+                if not batch or not self._flush_batch(batch):
+                    break
+                # 배치가 꽉 차지 않았으면 다음 주기까지 더 모읍니다
+                if len(batch) < self.max_batch_size:
+                    break
+
+    def _take_batch(self) -> List[Any]:
+        """재시도 대기 항목을 우선으로 최대 max_batch_size개 꺼내기"""
+        with self._flush_lock:
+            batch = self._pending[:self.max_batch_size]
+            self._pending = self._pending[self.max_batch_size:]
+        while len(batch) < self.max_batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _flush_batch(self, batch: List[Any]) -> bool:
+        """배치 하나를 전송 (실패 시 재시도 목록 앞에 되돌리고, 영구 실패면 실패한 항목만 포기)"""
+        started = time.perf_counter()
+        try:
+            self.flush_func(batch)
+        except Exception as e:
+            with self._flush_lock:
+                self._pending_failures += 1
+                failures = self._pending_failures
+            with self._stats_lock:
+                self._failed_flushes += 1
+                self._last_error = str(e)
+            if self.is_retryable(e) and failures < self.max_attempts:
+                with self._flush_lock:
+                    self._pending = batch + self._pending
+                print(f"[{self.name}] 배치 전송 실패 ({len(batch)}개, 재시도 예정): {e}")
+                return False
+            print(f"[{self.name}] 배치 전송 실패 ({len(batch)}개, {failures}회째): {e} - 항목별로 다시 보냅니다.")
+            self._flush_items(batch)
+            return True
+
+        with self._flush_lock:
+            self._pending_failures = 0
+        self._record_flush(len(batch), time.perf_counter() - started)
+        return True
+
+    def _flush_items(self, batch: List[Any]):
+        """배치를 항목 하나씩 전송하고 그래도 실패한 항목은 전송 포기 목록으로 옮김"""
+        for item in batch:
+            started = time.perf_counter()
+            try:
+                self.flush_func([item])
+            except Exception as e:
+                self._dead_letter(item, e)
+                continue
+            self._record_flush(1, time.perf_counter() - started)
+        with self._flush_lock:
+            self._pending_failures = 0
+
+    def _dead_letter(self, item: Any, error: Exception):
+        with self._flush_lock:
+            self._dead_letters.append(item)
+            del self._dead_letters[:-DEAD_LETTER_LIMIT]
+        with self._stats_lock:
+            self._dead_lettered += 1
+            self._last_error = str(error)
+        print(f"[{self.name}] 항목 전송 포기: {error} - {item!r}")
+
+    def _record_flush(self, batch_size: int, latency: float):
+        with self._stats_lock:
+            self._flush_count += 1
+            self._flushed_items += batch_size
+            self._last_batch_size = batch_size
+            self._last_flush_latency = latency
+            self._total_flush_latency += latency
+            self._max_flush_latency = max(self._max_flush_latency, latency)